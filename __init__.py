@@ -7,7 +7,16 @@ A comprehensive ComfyUI node collection for advanced camera, lighting, color, an
 SFW Edition - GitHub Compliant - Professional Grade
 """
 
+import importlib
+import logging
+import os
 import sys
+from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+# Set to 1 to skip the startup banner (e.g. in worker processes or structured logs)
+QUIET_ENV = "CAMERA_FACTORY_STATION_QUIET"
 
 # ANSI color codes for terminal output
 class Colors:
@@ -17,42 +26,109 @@ class Colors:
 
 # Startup message
 def print_startup_message():
-    """Display the Production Imaging Bay startup message in yellow."""
-    banner = f"{Colors.YELLOW}{Colors.BOLD}┌─────────────────────────────────────────┐{Colors.END}"
-    message = f"{Colors.YELLOW}{Colors.BOLD}│    Production Imaging Bay is Online    │{Colors.END}"
-    footer = f"{Colors.YELLOW}{Colors.BOLD}└─────────────────────────────────────────┘{Colors.END}"
-    info = f"{Colors.YELLOW}[Camera Factory Station] 1040+ professional options loaded{Colors.END}"
+    """Log the Production Imaging Bay startup message (in yellow on a terminal) unless silenced."""
+    if os.environ.get(QUIET_ENV, "").strip().lower() in ("1", "true", "yes", "on"):
+        return
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    # Plain text when the log goes to a file or a log collector
+    yellow, bold, end = (Colors.YELLOW, Colors.BOLD, Colors.END) if sys.stderr.isatty() else ("", "", "")
+    banner = f"{yellow}{bold}┌─────────────────────────────────────────┐{end}"
+    message = f"{yellow}{bold}│    Production Imaging Bay is Online    │{end}"
+    footer = f"{yellow}{bold}└─────────────────────────────────────────┘{end}"
+    info = f"{yellow}[Camera Factory Station] 1040+ professional options loaded{end}"
     
-    print(banner)
-    print(message)
-    print(footer)
-    print(info)
-    sys.stdout.flush()
+    logger.info("\n".join((banner, message, footer, info)))
 
-# Print startup message when module is imported
+# Announce the node pack when module is imported
 print_startup_message()
 
-from .factory_camera_operator import FactoryCameraOperator
-from .factory_size_optimizer import FactorySizeOptimizer  
-from .factory_color_harmonist import FactoryColorHarmonist
-from .factory_lighting_studio import FactoryLightingStudio
-from .factory_product_photographer import FactoryProductPhotographer
+# Opt-in Prometheus export: a local /metrics endpoint and/or a node_exporter textfile
+if os.environ.get("CAMERA_FACTORY_STATION_METRICS_PORT") or os.environ.get("CAMERA_FACTORY_STATION_METRICS_TEXTFILE"):
+    importlib.import_module(".factory_metrics", __name__).start_from_environment()
 
-# Node registration for ComfyUI
-NODE_CLASS_MAPPINGS = {
-    "FactoryCameraOperator": FactoryCameraOperator,
-    "FactorySizeOptimizer": FactorySizeOptimizer,
-    "FactoryColorHarmonist": FactoryColorHarmonist,
-    "FactoryLightingStudio": FactoryLightingStudio,
-    "FactoryProductPhotographer": FactoryProductPhotographer,
+# Module defining each node class; node modules are imported on first access
+NODE_MODULES = {
+    "FactoryCameraOperator": ".factory_camera_operator",
+    "FactorySizeOptimizer": ".factory_size_optimizer",
+    "FactoryColorHarmonist": ".factory_color_harmonist",
+    "FactoryLightingStudio": ".factory_lighting_studio",
+    "FactoryProductPhotographer": ".factory_product_photographer",
+    "FactoryPipeline": ".factory_pipeline",
+    
+    # List-mode variants for batches of prompts
+    "FactoryCameraOperatorBatch": ".factory_camera_operator",
+    "FactorySizeOptimizerBatch": ".factory_size_optimizer",
+    "FactoryColorHarmonistBatch": ".factory_color_harmonist",
+    "FactoryLightingStudioBatch": ".factory_lighting_studio",
+    "FactoryProductPhotographerBatch": ".factory_product_photographer",
+    
+    # Segment-chain variants and the converter back to a plain prompt
+    "FactoryCameraOperatorSegments": ".factory_camera_operator",
+    "FactorySizeOptimizerSegments": ".factory_size_optimizer",
+    "FactoryColorHarmonistSegments": ".factory_color_harmonist",
+    "FactoryLightingStudioSegments": ".factory_lighting_studio",
+    "FactoryProductPhotographerSegments": ".factory_product_photographer",
+    "FactorySegmentsToPrompt": ".factory_segments",
 }
 
+class LazyNodeMappings(Mapping):
+    """Read-only node registry that imports a node's module the first time its class is looked up"""
+    
+    def __init__(self, modules):
+        self._modules = modules
+        self._classes = {}
+    
+    def __getitem__(self, name):
+        node_class = self._classes.get(name)
+        if node_class is None:
+            module = importlib.import_module(self._modules[name], __name__)
+            node_class = self._classes[name] = getattr(module, name)
+        return node_class
+    
+    def loaded(self):
+        """Yield (name, class) of every node whose module is already imported, without importing the rest"""
+        for name, module_name in self._modules.items():
+            node_class = self._classes.get(name)
+            if node_class is None:
+                # A module still being imported may not define the class yet
+                node_class = getattr(sys.modules.get(__name__ + module_name), name, None)
+                if node_class is None:
+                    continue
+                self._classes[name] = node_class
+            yield name, node_class
+    
+    def __iter__(self):
+        return iter(self._modules)
+    
+    def __len__(self):
+        return len(self._modules)
+    
+    def __repr__(self):
+        return f"LazyNodeMappings({list(self._modules)!r})"
+
+# Node registration for ComfyUI
+NODE_CLASS_MAPPINGS = LazyNodeMappings(NODE_MODULES)
+
 NODE_DISPLAY_NAME_MAPPINGS = {
     "FactoryCameraOperator": "📸 Camera Operator",
     "FactorySizeOptimizer": "📏 Size Optimizer", 
     "FactoryColorHarmonist": "🎨 Color Harmonist",
     "FactoryLightingStudio": "💡 Lighting Studio",
     "FactoryProductPhotographer": "🛍️ Product Photographer",
+    "FactoryPipeline": "🏭 Factory Pipeline",
+    "FactoryCameraOperatorBatch": "📸 Camera Operator (Batch)",
+    "FactorySizeOptimizerBatch": "📏 Size Optimizer (Batch)",
+    "FactoryColorHarmonistBatch": "🎨 Color Harmonist (Batch)",
+    "FactoryLightingStudioBatch": "💡 Lighting Studio (Batch)",
+    "FactoryProductPhotographerBatch": "🛍️ Product Photographer (Batch)",
+    "FactoryCameraOperatorSegments": "📸 Camera Operator (Segments)",
+    "FactorySizeOptimizerSegments": "📏 Size Optimizer (Segments)",
+    "FactoryColorHarmonistSegments": "🎨 Color Harmonist (Segments)",
+    "FactoryLightingStudioSegments": "💡 Lighting Studio (Segments)",
+    "FactoryProductPhotographerSegments": "🛍️ Product Photographer (Segments)",
+    "FactorySegmentsToPrompt": "🧵 Segments To Prompt",
 }
 
 __all__ = [
@@ -60,5 +136,30 @@ __all__ = [
     "FactorySizeOptimizer", 
     "FactoryColorHarmonist",
     "FactoryLightingStudio", 
-    "FactoryProductPhotographer"
+    "FactoryProductPhotographer",
+    "FactoryPipeline",
+    "FactoryCameraOperatorBatch",
+    "FactorySizeOptimizerBatch",
+    "FactoryColorHarmonistBatch",
+    "FactoryLightingStudioBatch",
+    "FactoryProductPhotographerBatch",
+    "FactoryCameraOperatorSegments",
+    "FactorySizeOptimizerSegments",
+    "FactoryColorHarmonistSegments",
+    "FactoryLightingStudioSegments",
+    "FactoryProductPhotographerSegments",
+    "FactorySegmentsToPrompt",
 ]
+
+
+def __getattr__(name):
+    """Resolve node classes and factory_* submodules on first use"""
+    if name in NODE_MODULES:
+        return NODE_CLASS_MAPPINGS[name]
+    if name.startswith("factory_"):
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
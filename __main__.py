@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+
+"""
+Camera Factory Station - Headless Command Line
+Run from the folder that contains the node pack: python -m <node pack folder> prompts.jsonl -c chain.json
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+import sys
+
+from .factory_cli import main
+
+sys.exit(main())
@@ -0,0 +1,37 @@
+"""
+Shared helpers for the Camera Factory Station benchmark scripts.
+The scripts live inside the node pack, so they import it by its folder name.
+"""
+
+import contextlib
+import importlib
+import io
+import os
+import sys
+import timeit
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_NAME = os.path.basename(PACKAGE_DIR)
+
+
+def load_station():
+    """Import the node pack as a package, hiding its startup banner"""
+    parent = os.path.dirname(PACKAGE_DIR)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return importlib.import_module(PACKAGE_NAME)
+
+
+def best_of(func, number, repeat=5):
+    """Return the best per-call time in microseconds over several repeats"""
+    timings = timeit.repeat(func, number=number, repeat=repeat)
+    return min(timings) / number * 1e6
+
+
+def report(title, rows):
+    """Print a small aligned table of (label, microseconds) rows"""
+    print(title)
+    width = max(len(label) for label, _ in rows)
+    for label, micros in rows:
+        print(f"  {label.ljust(width)}  {micros:12.2f} us")
@@ -0,0 +1,105 @@
+"""
+Benchmark the batch prompt API against calling each node once per prompt.
+
+Every prompt is distinct, so the per-call output cache never hits; the batch
+path wins by analyzing prompts once per distinct set of keyword hits and
+rendering tags once per distinct detected context. With
+--baseline REV the single calls of that git revision of the node pack (for
+example the last release) are timed too, so batch cost per prompt can be
+compared with what one call used to cost.
+
+Usage: python benchmarks/bench_batch.py [batch_size] [--baseline REV]
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import os
+import random
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+from _common import PACKAGE_DIR, PACKAGE_NAME, best_of, load_station, report
+
+SUBJECTS = ["portrait of a woman", "red sneaker", "ceramic vase", "mountain landscape", "city street", "coffee cup"]
+SETTINGS = ["in a forest", "on white background", "at night", "in a studio", "by the sea", "in a cafe"]
+MOODS = ["golden hour", "dramatic", "soft light", "neon", "minimalist", "vintage"]
+
+
+def make_prompts(count, seed=0):
+    """Build distinct prompts from a small vocabulary, as a batch text loader would"""
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(SUBJECTS)} {rng.choice(SETTINGS)}, {rng.choice(MOODS)}, shot {index}"
+        for index in range(count)
+    ]
+
+
+def default_settings(cls):
+    """Return the default value of every required input after base_prompt"""
+    required = list(cls.INPUT_TYPES()["required"].items())[1:]
+    return [spec[1].get("default", spec[0][0]) if len(spec) > 1 else spec[0][0] for _, spec in required]
+
+
+def load_revision(revision):
+    """Import the node pack as it was at a git revision, from a temporary copy"""
+    archive = subprocess.run(
+        ["git", "-C", PACKAGE_DIR, "archive", f"{revision}:./"], check=True, capture_output=True,
+    ).stdout
+    workdir = tempfile.mkdtemp(prefix="camera_factory_baseline_")
+    name = f"{PACKAGE_NAME}_baseline"
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(os.path.join(workdir, name))
+    sys.path.insert(0, workdir)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return importlib.import_module(name)
+
+
+def per_prompt_single(cls, prompts):
+    """Microseconds per prompt calling the node once per prompt (output cache cleared first)"""
+    entry = getattr(cls(), cls.FUNCTION)
+    settings = default_settings(cls)
+    cache = getattr(cls, "output_cache", None)
+
+    def run():
+        if cache is not None:
+            cache.clear()
+        for prompt in prompts:
+            entry(prompt, *settings)
+
+    return best_of(run, number=3) / len(prompts)
+
+
+def per_prompt_batch(cls, prompts):
+    """Microseconds per prompt running the whole list through the node's batch method"""
+    batch = getattr(cls(), cls.FUNCTION + "_batch")
+    settings = default_settings(cls)
+    return best_of(lambda: batch(prompts, *settings), number=3) / len(prompts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("batch_size", nargs="?", type=int, default=256)
+    parser.add_argument("--baseline", help="git revision whose single calls to time as well")
+    args = parser.parse_args()
+
+    station = load_station()
+    baseline = load_revision(args.baseline) if args.baseline else None
+    prompts = make_prompts(args.batch_size)
+
+    rows = []
+    # Node warnings of older revisions went to stdout
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _, cls, _ in station.factory_pipeline.PIPELINE_STAGES:
+            if baseline is not None:
+                rows.append((f"{cls.__name__} single ({args.baseline})", per_prompt_single(baseline.NODE_CLASS_MAPPINGS[cls.__name__], prompts)))
+            rows.append((f"{cls.__name__} single", per_prompt_single(cls, prompts)))
+            rows.append((f"{cls.__name__} batch", per_prompt_batch(cls, prompts)))
+    report(f"Per-prompt cost, batch of {args.batch_size} prompts", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Benchmark tag emphasis: building bracketed f-strings per call versus the
+shared memoized emphasis engine.
+
+Usage: python benchmarks/bench_emphasis.py
+"""
+
+from _common import best_of, load_station, report
+
+
+def legacy_apply_emphasis(tag, emphasis_level):
+    """The per-node implementation the engine replaced"""
+    if emphasis_level == "low":
+        return f"({tag})"
+    elif emphasis_level == "high":
+        return f"(({tag}))"
+    elif emphasis_level == "very_high":
+        return f"((({tag})))"
+    else:
+        return tag
+
+
+def main():
+    station = load_station()
+    engine = station.factory_emphasis.EMPHASIS
+    tags = [tag for tags in station.factory_camera_operator.CAMERA_SETTINGS["shot_types"].values() for tag in tags][:16]
+
+    rows = []
+    for level in ("medium", "high", "very_high"):
+        rows.append((f"per-call f-strings ({level})", best_of(lambda: [legacy_apply_emphasis(tag, level) for tag in tags], number=20000)))
+        rows.append((f"engine ({level})", best_of(lambda: engine.emphasize_all(tags, level), number=20000)))
+    rows.append(("engine (weight 1.3)", best_of(lambda: engine.emphasize_all(tags, 1.3), number=20000)))
+    report(f"Emphasizing {len(tags)} tags", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark per-call latency of every node with its default settings.
+
+"call" clears the output cache first, so it is the full cost of a fresh
+prompt; "render" times only the tag and summary rendering for a fixed
+detected context, which is where the option-to-tag lookups happen.
+
+Usage: python benchmarks/bench_node_latency.py
+"""
+
+from _common import best_of, load_station, report
+
+PROMPT = "professional portrait of a woman in a studio, soft light"
+
+
+def default_settings(cls):
+    """Return the default value of every required input after base_prompt"""
+    required = list(cls.INPUT_TYPES()["required"].items())[1:]
+    return [spec[1].get("default", spec[0][0]) if len(spec) > 1 else spec[0][0] for _, spec in required]
+
+
+def main():
+    station = load_station()
+    stages = station.factory_pipeline.PIPELINE_STAGES
+
+    rows = []
+    for name, cls, render in stages:
+        node = cls()
+        settings = default_settings(cls)
+        entry = getattr(node, cls.FUNCTION)
+        render_method = getattr(node, render)
+
+        def call():
+            cls.output_cache.clear()
+            entry(PROMPT, *settings)
+
+        if name == "size":
+            def render_only():
+                render_method(*settings)
+        else:
+            context = entry(PROMPT, *settings)[cls.RETURN_NAMES.index("prompt_context")].analyses[name]
+            context = {key: list(value) if isinstance(value, tuple) else value for key, value in context.items()}
+
+            def render_only():
+                render_method(context, *settings)
+
+        rows.append((f"{cls.__name__} call", best_of(call, number=2000)))
+        rows.append((f"{cls.__name__} render", best_of(render_only, number=2000)))
+    report("Per-call latency with default settings", rows)
+
+
+if __name__ == "__main__":
+    main()
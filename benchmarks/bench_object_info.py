@@ -0,0 +1,35 @@
+"""
+Benchmark the cost of answering ComfyUI's /object_info for this node pack.
+
+"rebuild" calls the undecorated INPUT_TYPES builder, which is what every
+request paid before schemas were cached; "cached" is the current behaviour.
+
+Usage: python benchmarks/bench_object_info.py
+"""
+
+from _common import best_of, load_station, report
+
+
+def main():
+    station = load_station()
+    classes = list(station.NODE_CLASS_MAPPINGS.values())
+
+    def object_info_rebuild():
+        for cls in classes:
+            cls.INPUT_TYPES.__wrapped__(cls)
+
+    def object_info_cached():
+        for cls in classes:
+            cls.INPUT_TYPES()
+
+    rows = [
+        ("object_info rebuild", best_of(object_info_rebuild, number=200)),
+        ("object_info cached", best_of(object_info_cached, number=20000)),
+    ]
+    for cls in classes:
+        rows.append((f"{cls.__name__} rebuild", best_of(lambda: cls.INPUT_TYPES.__wrapped__(cls), number=500)))
+    report("INPUT_TYPES cost per /object_info request", rows)
+
+
+if __name__ == "__main__":
+    main()
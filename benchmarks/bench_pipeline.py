@@ -0,0 +1,55 @@
+"""
+Benchmark the fused FactoryPipeline node against the chained five-node workflow.
+
+Output caches are cleared before every run so both sides do the full work.
+
+Usage: python benchmarks/bench_pipeline.py
+"""
+
+from _common import best_of, load_station, report
+
+PROMPTS = [
+    "professional portrait of a woman",
+    "red sneaker product shot, white background, studio",
+    "mountain landscape at sunrise, golden hour, dramatic sky",
+]
+
+
+def main():
+    station = load_station()
+    pipeline_module = station.factory_pipeline
+    pipeline = pipeline_module.FactoryPipeline()
+    stages = [(node_class(), node_class) for _, node_class, _ in pipeline_module.PIPELINE_STAGES]
+
+    def defaults(node_class):
+        required = list(node_class.INPUT_TYPES()["required"].items())[1:]
+        return [spec[1].get("default", spec[0][0]) if len(spec) > 1 else spec[0][0] for _, spec in required]
+
+    chain_settings = [defaults(node_class) for _, node_class in stages]
+    pipeline_settings = {
+        name: spec[1].get("default", spec[0][0]) if len(spec) > 1 else spec[0][0]
+        for name, spec in list(pipeline.INPUT_TYPES()["required"].items())[1:]
+    }
+
+    def chained():
+        for prompt in PROMPTS:
+            prompt_context = None
+            for (node, node_class), settings in zip(stages, chain_settings):
+                node_class.output_cache.clear()
+                result = getattr(node, node_class.FUNCTION)(prompt, *settings, prompt_context=prompt_context)
+                prompt, prompt_context = result[0], result[node_class.RETURN_NAMES.index("prompt_context")]
+
+    def fused():
+        pipeline.output_cache.clear()
+        for prompt in PROMPTS:
+            pipeline.run_pipeline(prompt, **pipeline_settings)
+
+    rows = [
+        ("chained five nodes", best_of(chained, number=200) / len(PROMPTS)),
+        ("FactoryPipeline", best_of(fused, number=200) / len(PROMPTS)),
+    ]
+    report("Per-prompt cost of the full five-stage enhancement", rows)
+
+
+if __name__ == "__main__":
+    main()
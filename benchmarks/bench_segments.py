@@ -0,0 +1,62 @@
+"""
+Benchmark a five-node chain passing STRING prompts against the same chain passing
+PROMPT_SEGMENTS and joining once at the end with Segments To Prompt.
+
+Output caches are cleared before every run so both sides do the full work. The
+gap grows with the length of the incoming prompt, since the STRING chain copies
+the whole prompt at every node.
+
+Usage: python benchmarks/bench_segments.py [prompt_repeats]
+"""
+
+import sys
+
+from _common import best_of, load_station, report
+
+PROMPT = "professional portrait of a woman in a studio, soft light, detailed skin texture"
+
+
+def default_settings(cls):
+    """Return the default value of every required input after base_prompt"""
+    required = list(cls.INPUT_TYPES()["required"].items())[1:]
+    return {name: spec[1].get("default", spec[0][0]) if len(spec) > 1 else spec[0][0] for name, spec in required}
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    station = load_station()
+    base_prompt = ", ".join([PROMPT] * repeats)
+    segments_module = station.factory_segments
+
+    stages = []
+    for _, cls, _ in station.factory_pipeline.PIPELINE_STAGES:
+        variant = getattr(station, f"{cls.__name__}Segments")
+        stages.append((cls, variant, default_settings(cls), cls.RETURN_NAMES.index("prompt_context")))
+    converter = segments_module.FactorySegmentsToPrompt()
+
+    def string_chain():
+        prompt, prompt_context = base_prompt, None
+        for cls, _, settings, context_index in stages:
+            cls.output_cache.clear()
+            result = getattr(cls(), cls.FUNCTION)(prompt, prompt_context=prompt_context, **settings)
+            prompt, prompt_context = result[0], result[context_index]
+        return prompt
+
+    def segments_chain():
+        segments, prompt_context = segments_module.PromptSegments(base_prompt), None
+        for cls, variant, settings, _ in stages:
+            cls.output_cache.clear()
+            result = getattr(variant(), variant.FUNCTION)(segments, prompt_context=prompt_context, **settings)
+            segments, prompt_context = result[0], result[variant.RETURN_NAMES.index("prompt_context")]
+        return converter.join_segments(segments)[0]
+
+    assert string_chain() == segments_chain()
+    rows = [
+        ("STRING chain", best_of(string_chain, number=500)),
+        ("PROMPT_SEGMENTS chain + join", best_of(segments_chain, number=500)),
+    ]
+    report(f"Five-node chain on a {len(base_prompt)}-character prompt", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark per-worker memory with catalogs built in every process against catalogs
+memory-mapped from one shared file.
+
+Starts several worker interpreters side by side, each importing every node and
+running the Factory Pipeline over a few prompts, then reads their memory from
+/proc (Linux only): RSS, PSS (shared pages split between the processes mapping
+them) and USS (pages private to the process). The pipeline's per-prompt latency
+in each mode, timed in a worker running alone, is printed too, since mapped
+catalogs decode entries on access.
+
+Usage: python benchmarks/bench_shared_catalog.py [workers]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from _common import PACKAGE_DIR, PACKAGE_NAME, load_station
+from run_suite import default_settings
+
+WORKER = """
+import sys, timeit
+sys.path.insert(0, {parent!r})
+station = __import__({package!r})
+classes = list(station.NODE_CLASS_MAPPINGS.values())
+pipeline = station.FactoryPipeline()
+prompts = ["portrait of a woman, soft light", "red sneaker product shot", "mountain landscape at sunrise"]
+def run():
+    station.FactoryPipeline.output_cache.clear()
+    for prompt in prompts:
+        pipeline.run_pipeline(prompt, **{settings!r})
+run()
+if sys.argv[1] == "time":
+    print(min(timeit.repeat(run, number=20, repeat=3)) / (20 * len(prompts)) * 1e6)
+else:
+    print("ready", flush=True)
+    sys.stdin.read()
+"""
+
+
+def memory_kb(pid):
+    """RSS, PSS and USS of a process in kB, from /proc/<pid>/smaps_rollup"""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as smaps:
+        for line in smaps:
+            name, _, value = line.partition(":")
+            if value.strip().endswith("kB"):
+                fields[name] = int(value.split()[0])
+    return fields["Rss"], fields["Pss"], fields["Private_Clean"] + fields["Private_Dirty"]
+
+
+def worker_code(settings):
+    return WORKER.format(parent=os.path.dirname(PACKAGE_DIR), package=PACKAGE_NAME, settings=settings)
+
+
+def memory_per_worker(env, workers, settings):
+    """Mean RSS, PSS and USS of workers running at once"""
+    processes = [
+        subprocess.Popen([sys.executable, "-c", worker_code(settings), "hold"], env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        for _ in range(workers)
+    ]
+    try:
+        for process in processes:
+            process.stdout.readline()
+        samples = [memory_kb(process.pid) for process in processes]
+    finally:
+        for process in processes:
+            process.communicate("")
+    return [statistics.mean(column) for column in zip(*samples)]
+
+
+def pipeline_latency(env, settings):
+    """Microseconds per prompt through the Factory Pipeline, timed in a worker running alone"""
+    output = subprocess.run(
+        [sys.executable, "-c", worker_code(settings), "time"], env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        sys.exit("bench_shared_catalog needs /proc/<pid>/smaps_rollup (Linux 4.14+)")
+
+    station = load_station()
+    settings = default_settings(station.FactoryPipeline)
+    workdir = tempfile.mkdtemp(prefix="camera_factory_shared_")
+    shared = station.factory_catalog.build_shared_catalog(os.path.join(workdir, "catalog_shared.bin"))
+    base = dict(os.environ, CAMERA_FACTORY_STATION_QUIET="1", CAMERA_FACTORY_STATION_CATALOG_MMAP="off")
+    configs = [
+        ("per-process catalogs", base),
+        ("shared mapped catalog", dict(base, CAMERA_FACTORY_STATION_CATALOG_MMAP=shared)),
+    ]
+
+    print(f"Memory per worker, {workers} workers at once ({os.path.getsize(shared)} byte shared catalog)")
+    print(f"  {'':22}  {'RSS kB':>9}  {'PSS kB':>9}  {'USS kB':>9}  {'pipeline us/prompt':>19}")
+    for label, env in configs:
+        rss, pss, uss = memory_per_worker(env, workers, settings)
+        latency = pipeline_latency(env, settings)
+        print(f"  {label:22}  {rss:9.0f}  {pss:9.0f}  {uss:9.0f}  {latency:19.1f}")
+
+
+if __name__ == "__main__":
+    main()
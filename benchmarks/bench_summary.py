@@ -0,0 +1,40 @@
+"""
+Benchmark per-call latency of every node with each summary_mode.
+
+"off" is what a node does when its summary output is not connected in the
+workflow; the output cache is cleared before every call.
+
+Usage: python benchmarks/bench_summary.py
+"""
+
+from _common import best_of, load_station, report
+
+PROMPT = "professional portrait of a woman in a studio, soft light"
+
+
+def default_settings(cls):
+    """Return the default value of every required input after base_prompt"""
+    required = list(cls.INPUT_TYPES()["required"].items())[1:]
+    return [spec[1].get("default", spec[0][0]) if len(spec) > 1 else spec[0][0] for _, spec in required]
+
+
+def main():
+    station = load_station()
+    modes = station.factory_summary.SUMMARY_MODES
+
+    rows = []
+    for _, cls, _ in station.factory_pipeline.PIPELINE_STAGES:
+        node = cls()
+        settings = default_settings(cls)
+        entry = getattr(node, cls.FUNCTION)
+        for mode in modes:
+            def call():
+                cls.output_cache.clear()
+                entry(PROMPT, *settings, summary_mode=mode)
+
+            rows.append((f"{cls.__name__} {mode}", best_of(call, number=2000)))
+    report("Per-call latency by summary_mode", rows)
+
+
+if __name__ == "__main__":
+    main()
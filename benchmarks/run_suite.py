@@ -0,0 +1,242 @@
+"""
+Run the release benchmark suite and write the results as JSON.
+
+Covers:
+  import.*       fresh-interpreter import of the package, with and without every node module
+  catalog.*      building each node module's catalogs (importing it after the shared helpers)
+  input_types.*  first (building) and cached INPUT_TYPES calls per node
+  call.*         per-call latency of each node entry point over several option sets
+  chain.*        five-node chain and Factory Pipeline throughput
+
+Every metric is a flat key with a value and a unit, so two result files can be
+compared with --compare (or any JSON diff). Import and catalog timings run in fresh
+interpreters and report the median of --repeat runs; the rest report best-of timings.
+
+Usage: python benchmarks/run_suite.py [-o results.json] [--compare previous.json] [--repeat N] [--quick]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from _common import PACKAGE_DIR, PACKAGE_NAME, best_of, load_station
+
+PROMPTS = [
+    "professional portrait of a woman in a studio, soft light",
+    "red sneaker product shot, white background",
+    "mountain landscape at sunrise, golden hour, dramatic sky",
+    "city street at night, neon signs, rain",
+    "steak dinner on a rustic table, food photography",
+]
+
+# Option sets timed per node besides the defaults
+RANDOM_OPTION_SETS = 3
+
+# Measured in a fresh interpreter; prints one JSON object of millisecond timings
+PROBE = """
+import importlib, json, sys, time
+sys.path.insert(0, {parent!r})
+mode, package = sys.argv[1], {package!r}
+timings = {{}}
+start = time.perf_counter()
+station = importlib.import_module(package)
+timings["package"] = time.perf_counter() - start
+if mode == "import":
+    start = time.perf_counter()
+    classes = list(station.NODE_CLASS_MAPPINGS.values())
+    timings["all_nodes"] = time.perf_counter() - start + timings["package"]
+elif mode == "catalog":
+    for helper in ("factory_cache", "factory_catalog", "factory_context", "factory_tags", "factory_segments",
+                   "factory_summary", "factory_metadata", "factory_emphasis", "factory_keywords"):
+        importlib.import_module(package + "." + helper)
+    # Stage modules before the pipeline, which imports them
+    for module in dict.fromkeys(station.NODE_MODULES.values()):
+        if package + module in sys.modules:
+            continue
+        start = time.perf_counter()
+        importlib.import_module(module, package)
+        timings[module.lstrip(".")] = time.perf_counter() - start
+elif mode == "input_types":
+    classes = {{name: station.NODE_CLASS_MAPPINGS[name] for name in station.NODE_CLASS_MAPPINGS}}
+    for name, cls in classes.items():
+        start = time.perf_counter()
+        cls.INPUT_TYPES()
+        timings[name] = time.perf_counter() - start
+print(json.dumps({{name: value * 1e3 for name, value in timings.items()}}))
+"""
+
+
+def probe(mode, repeat):
+    """Median of each timing over repeat fresh interpreters"""
+    parent = os.path.dirname(PACKAGE_DIR)
+    code = PROBE.format(parent=parent, package=PACKAGE_NAME)
+    env = dict(os.environ, CAMERA_FACTORY_STATION_QUIET="1")
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code, mode], env=env, check=True, capture_output=True, text=True,
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+
+
+def default_settings(cls):
+    """Return the default value of every widget input"""
+    settings = {}
+    for section in ("required", "optional"):
+        for name, spec in cls.INPUT_TYPES().get(section, {}).items():
+            options = spec[1] if len(spec) > 1 else {}
+            if options.get("forceInput") or not (isinstance(spec[0], (list, tuple)) or "default" in options):
+                continue
+            settings[name] = options.get("default", spec[0][0] if isinstance(spec[0], (list, tuple)) else None)
+    return settings
+
+
+def option_sets(cls, count, seed=0):
+    """Defaults plus count random picks of every choice input (same picks on every run)"""
+    rng = random.Random(f"{cls.__name__}:{seed}")
+    defaults = default_settings(cls)
+    choices = {
+        name: list(spec[0])
+        for section in ("required", "optional")
+        for name, spec in cls.INPUT_TYPES().get(section, {}).items()
+        if isinstance(spec[0], (list, tuple)) and name != "summary_mode"
+    }
+    sets = [("defaults", defaults)]
+    for index in range(count):
+        sets.append((f"random{index + 1}", dict(defaults, **{name: rng.choice(values) for name, values in choices.items()})))
+    return sets
+
+
+def call_latency(station, number):
+    """Microseconds per fresh call of each node entry point, per option set"""
+    results = {}
+    classes = [cls for _, cls, _ in station.factory_pipeline.PIPELINE_STAGES] + [station.FactoryPipeline]
+    for cls in classes:
+        entry = getattr(cls(), cls.FUNCTION)
+        for label, settings in option_sets(cls, RANDOM_OPTION_SETS):
+            def call():
+                cls.output_cache.clear()
+                for prompt in PROMPTS:
+                    entry(prompt, **settings)
+
+            results[f"call.{cls.__name__}.{label}"] = best_of(call, number=number) / len(PROMPTS)
+    return results
+
+
+def chain_throughput(station, number):
+    """Prompts per second through the chained stage nodes and through the Factory Pipeline"""
+    stages = []
+    for _, cls, _ in station.factory_pipeline.PIPELINE_STAGES:
+        stages.append((cls, getattr(cls(), cls.FUNCTION), default_settings(cls), cls.RETURN_NAMES.index("prompt_context")))
+    pipeline_class = station.FactoryPipeline
+    pipeline = getattr(pipeline_class(), pipeline_class.FUNCTION)
+    pipeline_settings = default_settings(pipeline_class)
+
+    def chain():
+        for prompt in PROMPTS:
+            prompt_context = None
+            for cls, entry, settings, context_index in stages:
+                cls.output_cache.clear()
+                result = entry(prompt, prompt_context=prompt_context, **settings)
+                prompt, prompt_context = result[0], result[context_index]
+
+    def fused():
+        pipeline_class.output_cache.clear()
+        for prompt in PROMPTS:
+            pipeline(prompt, **pipeline_settings)
+
+    return {
+        "chain.five_nodes": len(PROMPTS) / (best_of(chain, number=number) / 1e6),
+        "chain.pipeline": len(PROMPTS) / (best_of(fused, number=number) / 1e6),
+    }
+
+
+def git_revision():
+    """Short commit hash of the node pack, when it is a git checkout"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PACKAGE_DIR, check=True, capture_output=True, text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(repeat, number):
+    """Collect every metric as {key: {"value": ..., "unit": ...}}"""
+    metrics = {}
+    for name, value in probe("import", repeat).items():
+        metrics[f"import.{name}"] = {"value": value, "unit": "ms"}
+    for name, value in probe("catalog", repeat).items():
+        if name != "package":
+            metrics[f"catalog.{name}"] = {"value": value, "unit": "ms"}
+    for name, value in probe("input_types", repeat).items():
+        if name != "package":
+            metrics[f"input_types.first.{name}"] = {"value": value * 1e3, "unit": "us"}
+
+    station = load_station()
+    for name in station.NODE_CLASS_MAPPINGS:
+        cls = station.NODE_CLASS_MAPPINGS[name]
+        metrics[f"input_types.cached.{name}"] = {"value": best_of(cls.INPUT_TYPES, number=number * 100), "unit": "us"}
+    for name, value in call_latency(station, number).items():
+        metrics[name] = {"value": value, "unit": "us"}
+    for name, value in chain_throughput(station, number).items():
+        metrics[name] = {"value": value, "unit": "prompts/s"}
+    return metrics
+
+
+def compare(metrics, previous):
+    """Print every metric next to a previous run, with the relative change"""
+    width = max(len(name) for name in metrics)
+    for name, metric in metrics.items():
+        line = f"  {name.ljust(width)}  {metric['value']:12.2f} {metric['unit']:<9}"
+        if name in previous:
+            before = previous[name]["value"]
+            change = (metric["value"] - before) / before * 100 if before else 0.0
+            line += f"  was {before:12.2f}  ({change:+6.1f}%)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Camera Factory Station benchmark suite")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="previous results JSON to compare against")
+    parser.add_argument("--repeat", type=int, default=7, help="fresh interpreters per import/catalog timing")
+    parser.add_argument("--quick", action="store_true", help="fewer iterations, for a fast sanity run")
+    args = parser.parse_args()
+
+    started = time.time()
+    metrics = run_suite(max(1, args.repeat if not args.quick else 3), 20 if args.quick else 200)
+    results = {
+        "meta": {
+            "package": PACKAGE_NAME,
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(started)),
+        },
+        "metrics": metrics,
+    }
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as previous_file:
+            previous = json.load(previous_file)["metrics"]
+    compare(metrics, previous)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(results, output_file, indent=2, sort_keys=True)
+            output_file.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+"""
+Factory Catalog - Shared Read-Only Option Catalogs
+Builds every node catalog once per process as immutable structures shared by all node instances,
+or maps them from a catalog file shared by every worker process when that is switched on (see
+build_shared_catalog).
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+import functools
+import hashlib
+import importlib
+import logging
+import os
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# Memory-mapped catalog file shared by worker processes: "on" for the default path, or a path
+SHARED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog_shared.bin")
+SHARED_ENV = "CAMERA_FACTORY_STATION_CATALOG_MMAP"
+
+# (module, catalog name) -> literal builder, recorded for the build functions; catalogs served from
+# the shared file drop theirs so the literals can be freed
+_builders = {}
+
+# Shared catalog file once mapped, and per module its catalogs (None when missing or stale)
+_shared = None
+_shared_modules = {}
+
+
+def freeze_catalog(value):
+    """Recursively convert a catalog literal into read-only mappings and tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze_catalog(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_catalog(item) for item in value)
+    return value
+
+
+def cached_input_types(build):
+    """Turn an INPUT_TYPES builder into a classmethod that computes its schema once per class"""
+    schemas = {}
+
+    @functools.wraps(build)
+    def input_types(cls):
+        schema = schemas.get(cls)
+        if schema is None:
+            schema = schemas[cls] = build(cls)
+        return schema
+
+    return classmethod(input_types)
+
+
+def source_digest(filename):
+    """Digest of a module's source, tying shared catalog entries to the literals they were built from"""
+    try:
+        with open(filename, "rb") as source:
+            return hashlib.blake2b(source.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def shared_catalog_path():
+    """Shared catalog file in use, or None when catalogs are not mapped (the default)"""
+    path = os.environ.get(SHARED_ENV, "").strip()
+    if path.lower() in ("", "0", "off", "false", "no"):
+        return None
+    if path.lower() in ("1", "on", "true", "yes"):
+        return SHARED_PATH
+    return path
+
+
+def shared_catalogs(module, filename):
+    """Return the mapped catalogs of a module, or None when the shared file has none matching its source"""
+    global _shared
+    if module not in _shared_modules:
+        if _shared is None:
+            _shared = _map_shared_catalog()
+        entry = _shared.get(module) if _shared else None
+        if entry is not None and entry["source"] != source_digest(filename):
+            entry = None
+        _shared_modules[module] = entry["catalogs"] if entry is not None else None
+    return _shared_modules[module]
+
+
+def _map_shared_catalog():
+    """Map the shared catalog file; an absent or unreadable file maps nothing"""
+    path = shared_catalog_path()
+    if path is None or not os.path.exists(path):
+        return {}
+    from .factory_mmap import CatalogFile
+    try:
+        return CatalogFile(path).catalogs()
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable shared catalog %s: %s", path, e)
+        return {}
+
+
+def load_catalog(name, builder):
+    """
+    Return a node catalog frozen by freeze_catalog, or a read-only view of it in the shared file.
+    builder returns the catalog literal; it only runs when neither has a current copy.
+    """
+    module = builder.__module__.rsplit(".", 1)[-1]
+    mapped = shared_catalogs(module, builder.__code__.co_filename)
+    if mapped is not None and name in mapped:
+        return mapped[name]
+    _builders[(module, name)] = builder
+    return freeze_catalog(builder())
+
+
+def _catalog_sources():
+    """Import every node module and return {module: {"source": digest, "catalogs": {name: literal}}}"""
+    package = __name__.rsplit(".", 1)[0]
+    node_classes = importlib.import_module(package).NODE_CLASS_MAPPINGS
+    for name in node_classes:
+        node_classes[name]
+    if any(catalogs is not None for catalogs in _shared_modules.values()):
+        raise RuntimeError(f"Catalogs were mapped from the shared file; build with {SHARED_ENV} unset")
+    
+    modules = {}
+    for (module, name), builder in sorted(_builders.items()):
+        entry = modules.setdefault(module, {"source": source_digest(builder.__code__.co_filename), "catalogs": {}})
+        entry["catalogs"][name] = builder()
+    return modules
+
+
+def build_shared_catalog(path=None):
+    """Import every node module and write all their catalogs to the shared catalog file; returns the path"""
+    from .factory_mmap import write_catalog_file
+    
+    return write_catalog_file(path or shared_catalog_path() or SHARED_PATH, _catalog_sources())
+
+
+if __name__ == "__main__":
+    # Run as `python -m <node pack folder>.factory_catalog`; build with the package's own module
+    catalog = importlib.import_module(f"{__package__}.factory_catalog")
+    print(f"Shared catalog written to {catalog.build_shared_catalog()}")
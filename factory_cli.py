@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+
+"""
+Factory CLI - Headless Batch Prompt Enhancement
+Runs a chain of Camera Factory Station nodes over prompts read from JSONL or CSV without starting
+ComfyUI, streaming the input in chunks and writing enhanced prompts plus metadata as JSONL.
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+import argparse
+import csv
+import json
+import logging
+import sys
+from functools import partial
+from itertools import islice
+
+from .factory_pipeline import PIPELINE_STAGES, FactoryPipeline
+from .factory_parallel import item_seed, ordered_map
+from .factory_summary import SUMMARY_COMPACT, SUMMARY_MODES, SUMMARY_OFF
+
+logger = logging.getLogger(__name__)
+
+# Node types a chain can contain; list-mode and segment variants run as their base node
+CHAIN_NODES = {node_class.__name__: node_class for _, node_class, _ in PIPELINE_STAGES}
+CHAIN_NODES[FactoryPipeline.__name__] = FactoryPipeline
+VARIANT_SUFFIXES = ("Batch", "Segments")
+
+# Values the ComfyUI frontend stores right after a seed widget
+SEED_CONTROL_VALUES = ("fixed", "increment", "decrement", "randomize")
+
+# Widget input types (custom socket types such as PROMPT_CONTEXT have no widget)
+WIDGET_TYPES = ("INT", "FLOAT", "STRING", "BOOLEAN")
+
+DEFAULT_CHUNK_SIZE = 256
+INPUT_FORMATS = ("auto", "jsonl", "csv")
+
+
+def chain_node_class(node_type):
+    """Return the node class for a chain entry type, or None when it is not a Camera Factory node"""
+    if node_type in CHAIN_NODES:
+        return CHAIN_NODES[node_type]
+    for suffix in VARIANT_SUFFIXES:
+        if node_type.endswith(suffix) and node_type[:-len(suffix)] in CHAIN_NODES:
+            return CHAIN_NODES[node_type[:-len(suffix)]]
+    return None
+
+
+def widget_inputs(node_class):
+    """Return (name, spec) of every widget input in the order ComfyUI stores widgets_values"""
+    widgets = []
+    schema = node_class.INPUT_TYPES()
+    for section in ("required", "optional"):
+        for name, spec in schema.get(section, {}).items():
+            options = spec[1] if len(spec) > 1 else {}
+            if options.get("forceInput"):
+                continue
+            if isinstance(spec[0], (list, tuple)) or spec[0] in WIDGET_TYPES:
+                widgets.append((name, spec))
+    return widgets
+
+
+def assigned_widgets(widgets, values):
+    """Pair widgets with stored values in order, skipping the control value after a seed"""
+    settings = {}
+    values = list(values)
+    for name, _ in widgets:
+        if not values:
+            break
+        settings[name] = values.pop(0)
+        if name == "seed" and values and values[0] in SEED_CONTROL_VALUES:
+            values.pop(0)
+    return settings
+
+
+def matched_choices(widgets, settings):
+    """Number of list widgets whose assigned value is one of their options"""
+    return sum(
+        1 for name, spec in widgets
+        if isinstance(spec[0], (list, tuple)) and settings.get(name, spec[0]) in spec[0]
+    )
+
+
+def prompt_inputs(node_class):
+    """Names of the required text inputs that only accept a connection (the incoming prompt)"""
+    return [
+        name for name, spec in node_class.INPUT_TYPES()["required"].items()
+        if spec[0] == "STRING" and len(spec) > 1 and spec[1].get("forceInput")
+    ]
+
+
+def widget_settings(node_class, values):
+    """
+    Map a widgets_values list onto input names, skipping the seed control value.
+    Exports that kept the text of the forceInput prompt input as the first stored value
+    are recognized by their list values only lining up once that value is dropped.
+    """
+    widgets = widget_inputs(node_class)
+    settings = assigned_widgets(widgets, values)
+    if values and isinstance(values[0], str) and prompt_inputs(node_class):
+        shifted = assigned_widgets(widgets, values[1:])
+        if matched_choices(widgets, shifted) > matched_choices(widgets, settings):
+            return shifted
+    return settings
+
+
+def checked_value(node_class, name, spec, value):
+    """Coerce a configured value to its input type, falling back to the default when it is invalid"""
+    options = spec[1] if len(spec) > 1 else {}
+    default = options.get("default", spec[0][0] if isinstance(spec[0], (list, tuple)) else None)
+    try:
+        if isinstance(spec[0], (list, tuple)):
+            if value not in spec[0]:
+                raise ValueError(value)
+            return value
+        if spec[0] == "INT":
+            return int(value)
+        if spec[0] == "FLOAT":
+            return float(value)
+        if spec[0] == "BOOLEAN":
+            return value if isinstance(value, bool) else str(value).lower() in ("true", "1", "yes")
+        return str(value)
+    except (TypeError, ValueError):
+        logger.warning("Invalid value %r for %s.%s, using %r", value, node_class.__name__, name, default)
+        return default
+
+
+def node_settings(node_class, entry):
+    """Resolve one chain entry into a complete settings dict (every widget, defaults filled in)"""
+    configured = widget_settings(node_class, entry.get("widgets_values") or [])
+    inputs = entry.get("inputs")
+    if isinstance(inputs, dict):
+        # Named values; [node_id, slot] pairs are links in API-format workflows
+        configured.update((name, value) for name, value in inputs.items() if not isinstance(value, list))
+
+    settings = {}
+    for name, spec in widget_inputs(node_class):
+        if name in configured:
+            settings[name] = checked_value(node_class, name, spec, configured.pop(name))
+        else:
+            options = spec[1] if len(spec) > 1 else {}
+            settings[name] = options.get("default", spec[0][0] if isinstance(spec[0], (list, tuple)) else None)
+    for name in configured:
+        logger.warning("Unknown input '%s' for %s ignored", name, node_class.__name__)
+    return settings
+
+
+def load_chain(config):
+    """
+    Build the node chain from a parsed config.
+    Accepts a list of entries, {"chain": [...]}, or a ComfyUI workflow export (UI or
+    API format), whose Camera Factory nodes run in execution order. Each entry names
+    its node "type" and gives "widgets_values" (as saved by ComfyUI) and/or named "inputs".
+    """
+    if isinstance(config, dict) and "nodes" in config:
+        entries = sorted(config["nodes"], key=lambda node: (node.get("order", node.get("id", 0)), node.get("id", 0)))
+    elif isinstance(config, dict) and config and all(isinstance(node, dict) and "class_type" in node for node in config.values()):
+        entries = [dict(node, type=node["class_type"]) for _, node in sorted(config.items(), key=lambda item: int(item[0]) if str(item[0]).isdigit() else 0)]
+    elif isinstance(config, dict):
+        entries = config.get("chain", [])
+    else:
+        entries = config
+
+    chain = []
+    for entry in entries:
+        node_class = chain_node_class(entry.get("type", ""))
+        if node_class is None:
+            continue
+        chain.append((node_class, node_settings(node_class, entry)))
+    if not chain:
+        raise ValueError("config contains no Camera Factory Station nodes")
+    return chain
+
+
+def read_records(stream, input_format="jsonl", prompt_field="prompt"):
+    """Yield input records one at a time; JSONL lines may be objects or bare prompt strings"""
+    if input_format == "csv":
+        for row in csv.DictReader(stream):
+            yield row
+        return
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        yield record if isinstance(record, dict) else {prompt_field: record}
+
+
+def chunked(records, size):
+    """Yield lists of up to size records, so only one chunk is held in memory"""
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def numbered_chunks(records, size):
+    """Yield (index of the first record, chunk) pairs"""
+    first_index = 0
+    for chunk in chunked(records, size):
+        yield first_index, chunk
+        first_index += len(chunk)
+
+
+def run_node(node_class, settings, prompts, prompt_contexts, summary_mode, seeds=None):
+    """
+    Run one chain node over a list of prompts and return its outputs by name, one dict per prompt.
+    With seeds (one per prompt), a seeded node runs one batch per distinct seed instead of
+    using its configured seed for every prompt.
+    """
+    if seeds is None or "seed" not in settings:
+        return run_batch(node_class, settings, prompts, prompt_contexts, summary_mode)
+
+    groups = {}
+    for index, seed in enumerate(seeds):
+        groups.setdefault(seed, []).append(index)
+    outputs = [None] * len(prompts)
+    for seed, indexes in groups.items():
+        group_outputs = run_batch(
+            node_class, dict(settings, seed=seed),
+            [prompts[index] for index in indexes], [prompt_contexts[index] for index in indexes], summary_mode,
+        )
+        for index, output in zip(indexes, group_outputs):
+            outputs[index] = output
+    return outputs
+
+
+def run_batch(node_class, settings, prompts, prompt_contexts, summary_mode):
+    """Run one chain node over a list of prompts with a single set of settings"""
+    node = node_class()
+    settings = dict(settings, summary_mode=summary_mode)
+    names = node_class.RETURN_NAMES
+
+    if node_class is FactoryPipeline:
+        results = [
+            node.run_pipeline(prompt, prompt_context=prompt_context, **settings)
+            for prompt, prompt_context in zip(prompts, prompt_contexts)
+        ]
+    else:
+        required = [settings.pop(name) for name in list(node_class.INPUT_TYPES()["required"])[1:]]
+        batch = getattr(node, f"{node_class.FUNCTION}_batch")
+        results = batch(prompts, *required, prompt_contexts=prompt_contexts, **settings)
+    return [dict(zip(names, result)) for result in results]
+
+
+def enhance_records(chain, records, prompt_field="prompt", summary_mode=SUMMARY_OFF, first_index=None):
+    """
+    Apply the chain to a chunk of records and return the output records in input order.
+    When first_index is given, every record gets its own seed derived from each node's
+    seed and the record's position in the whole input (records numbered from first_index),
+    so results do not depend on how the input is chunked or spread over workers.
+    """
+    prompts = [str(record.get(prompt_field) or "") for record in records]
+    prompt_contexts = [None] * len(records)
+    metadata = [[] for _ in records]
+    summaries = [[] for _ in records]
+    sizes = [{} for _ in records]
+    token_counts = [0] * len(records)
+
+    for node_class, settings in chain:
+        seeds = None
+        if first_index is not None and "seed" in settings:
+            seeds = [item_seed(settings["seed"], first_index + index) for index in range(len(records))]
+        outputs = run_node(node_class, settings, prompts, prompt_contexts, summary_mode, seeds)
+        for index, output in enumerate(outputs):
+            prompts[index] = output["enhanced_prompt"]
+            prompt_contexts[index] = output["prompt_context"]
+            token_counts[index] = output["token_count"]
+            record = json.loads(output["metadata"])
+            metadata[index].extend(record["stages"] if "stages" in record else [record])
+            summary = next((value for name, value in output.items() if name.endswith("_summary")), "")
+            if summary:
+                summaries[index].append(summary)
+            for name in ("width", "height", "optimal_width", "optimal_height"):
+                if output.get(name) is not None:
+                    sizes[index][name.replace("optimal_", "")] = output[name]
+
+    results = []
+    for index, record in enumerate(records):
+        result = dict(record)
+        result["enhanced_prompt"] = prompts[index]
+        result["token_count"] = token_counts[index]
+        result.update(sizes[index])
+        result["metadata"] = metadata[index]
+        if summary_mode != SUMMARY_OFF:
+            result["summary"] = ("\n" if summary_mode == SUMMARY_COMPACT else "\n\n").join(summaries[index])
+        results.append(result)
+    return results
+
+
+def enhance_chunk(chain, prompt_field, summary_mode, seed_per_item, chunk):
+    """Worker entry point: enhance one (first_index, records) chunk"""
+    first_index, records = chunk
+    return enhance_records(chain, records, prompt_field, summary_mode, first_index if seed_per_item else None)
+
+
+def enhance_stream(chain, records, prompt_field="prompt", summary_mode=SUMMARY_OFF,
+                   chunk_size=DEFAULT_CHUNK_SIZE, workers=1, seed_per_item=False):
+    """
+    Yield output records for an iterable of input records, in input order.
+    Chunks of chunk_size records run on workers processes (0 = one per CPU); with
+    seed_per_item every record gets its own derived seed, otherwise each node's seed applies.
+    """
+    work = partial(enhance_chunk, chain, prompt_field, summary_mode, seed_per_item)
+    for results in ordered_map(work, numbered_chunks(records, max(1, chunk_size)), workers):
+        for result in results:
+            yield result
+
+
+def detect_format(path, input_format="auto"):
+    """Pick the input format from the file extension unless given explicitly"""
+    if input_format != "auto":
+        return input_format
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def build_parser():
+    """Command line interface of python -m <node pack folder>"""
+    parser = argparse.ArgumentParser(
+        description="Enhance prompts with a Camera Factory Station node chain, without ComfyUI.",
+    )
+    parser.add_argument("input", help="JSONL or CSV file of prompts ('-' for stdin)")
+    parser.add_argument("-c", "--config", required=True, help="JSON chain config or a ComfyUI workflow export")
+    parser.add_argument("-o", "--output", default="-", help="JSONL output file ('-' for stdout, the default)")
+    parser.add_argument("--format", choices=INPUT_FORMATS, default="auto", help="input format (default: from the file extension)")
+    parser.add_argument("--prompt-field", default="prompt", help="JSON key or CSV column holding the prompt")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="prompts processed per batch call")
+    parser.add_argument("--summary", choices=SUMMARY_MODES, default=SUMMARY_OFF, help="include node summaries in the output")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (0 = one per CPU, default: 1)")
+    parser.add_argument("--seed-per-item", action="store_true", help="derive each prompt's seed from the node seed and its position")
+    return parser
+
+
+def main(argv=None):
+    """Entry point: stream input records through the chain and write one JSON line per record"""
+    args = build_parser().parse_args(argv)
+    with open(args.config, encoding="utf-8") as config_file:
+        chain = load_chain(json.load(config_file))
+
+    input_format = detect_format(args.input, args.format)
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        records = read_records(source, input_format, args.prompt_field)
+        results = enhance_stream(
+            chain, records, args.prompt_field, args.summary,
+            args.chunk_size, args.workers, args.seed_per_item,
+        )
+        for result in results:
+            target.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    return 0
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+
+"""
+Factory Context - Prompt Analysis Shared Across Chained Nodes
+Carries keyword hits and detection results from node to node so each node only analyzes newly appended tags.
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+import weakref
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from .factory_catalog import freeze_catalog
+from .factory_keywords import PROMPT_KEYWORDS, WORD_BOUNDARY
+from .factory_segments import PromptSegments
+from .factory_tags import estimate_tokens, prompt_tag_keys
+
+# ComfyUI socket type for PromptContext outputs and inputs
+PROMPT_CONTEXT = "PROMPT_CONTEXT"
+
+# Analyses of a context no node has annotated yet
+_NO_ANALYSES = MappingProxyType({})
+
+
+def _hashable(value):
+    """Hashable equivalent of a frozen analysis: mappings as sorted item tuples"""
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_hashable(item) for item in value)
+    return value
+
+
+class PromptContext:
+    """
+    Analysis record for one prompt, passed along a node chain.
+
+    Holds the keyword hits of the prompt (per matching mode), the normalized keys
+    of its tags (for deduplication), its CLIP token estimate and the context each
+    upstream node detected. The prompt is a string or a PromptSegments chain.
+    A context built by appending tags to an upstream one keeps a link to it and
+    works out hits, keys and tokens from the upstream results plus the appended
+    text, so no node rescans the part of the prompt an earlier node analyzed.
+    Hits are only reused while no keyword table has been registered since they
+    were scanned (node modules load lazily, possibly after the context is built).
+    Instances are never modified after a node returns them: extending or
+    annotating a context produces a new one, so ComfyUI can cache and share them
+    between branches safely.
+    """
+
+    __slots__ = (
+        "prompt", "analyses", "_upstream", "_appended", "_hits", "_generation",
+        "_keys", "_tokens", "_analysis_key", "__weakref__",
+    )
+
+    def __init__(self, prompt, hits=None, analyses=None, keys=None, tokens=None, generation=None, *, upstream=None, appended=""):
+        self.prompt = prompt
+        # Contexts derived from one another share the read-only analyses
+        if type(analyses) is not MappingProxyType:
+            analyses = MappingProxyType(dict(analyses)) if analyses else _NO_ANALYSES
+        self.analyses = analyses
+        self._upstream = upstream
+        self._appended = appended
+        self._hits = dict(hits) if hits else {}
+        self._generation = PROMPT_KEYWORDS.generation if generation is None else generation
+        self._keys = keys
+        self._tokens = tokens
+        self._analysis_key = None
+
+    @classmethod
+    def for_prompt(cls, prompt, context=None):
+        """Return a context for prompt, reusing an upstream context when prompt extends it"""
+        if isinstance(context, cls):
+            return context.extended(prompt)
+        return cls._unlinked(prompt)
+
+    @classmethod
+    def _unlinked(cls, prompt):
+        """
+        Context for a prompt that arrives without its upstream context.
+        A prompt another node produced (and still holds) reuses that node's results,
+        and a segment chain is analyzed per segment; either way without its analyses,
+        which a node only sees through a linked prompt_context input.
+        """
+        published = _PUBLISHED.get(prompt)
+        if published is not None:
+            published = published()
+        if published is not None:
+            return cls(prompt, upstream=published)
+        if isinstance(prompt, PromptSegments) and prompt.parent is not None:
+            return cls(prompt, upstream=cls._unlinked(prompt.parent), appended=f", {prompt.segment}")
+        return cls(prompt)
+
+    def hits(self, matching=WORD_BOUNDARY):
+        """Return the registered keywords found in the prompt (scanned once per mode)"""
+        if self._generation != PROMPT_KEYWORDS.generation:
+            self._hits = {}
+            self._generation = PROMPT_KEYWORDS.generation
+        hits = self._hits.get(matching)
+        if hits is None:
+            if self._upstream is None:
+                hits = PROMPT_KEYWORDS.scan(str(self.prompt), matching)
+            else:
+                hits = self._upstream.hits(matching)
+                if self._appended:
+                    hits = hits | PROMPT_KEYWORDS.scan(self._appended, matching)
+            self._hits[matching] = hits
+        return hits
+
+    def tag_keys(self):
+        """Return the normalized keys of the prompt's tags (computed once)"""
+        keys = self._keys
+        if keys is None:
+            if self._upstream is None:
+                keys = prompt_tag_keys(str(self.prompt))
+            else:
+                keys = self._upstream.tag_keys()
+                if self._appended:
+                    keys = keys | prompt_tag_keys(self._appended)
+            self._keys = keys
+        return keys
+
+    def token_count(self):
+        """Return the CLIP token estimate of the prompt (computed once)"""
+        tokens = self._tokens
+        if tokens is None:
+            if self._upstream is None:
+                tokens = estimate_tokens(str(self.prompt))
+            else:
+                # The token estimate is additive at comma boundaries
+                tokens = self._upstream.token_count() + estimate_tokens(self._appended)
+            self._tokens = tokens
+        return tokens
+
+    def _appended_text(self, prompt):
+        """Text of the tags prompt appends to this context's prompt, or None when it does not extend it"""
+        if isinstance(prompt, PromptSegments):
+            # Segment chains know what was appended without comparing the text
+            return prompt.appended_since(self.prompt)
+        base = str(self.prompt)
+        appended = prompt[len(base):]
+        # Hits only carry over when the old prompt is an untouched run of whole tags
+        if not prompt.startswith(base) or not (appended.startswith(",") or base.endswith(",") or not base):
+            return None
+        return appended
+
+    def extended(self, prompt):
+        """Return a context for a prompt built by appending tags to this one"""
+        if prompt is self.prompt or prompt == self.prompt:
+            return self
+        appended = self._appended_text(prompt)
+        if appended is None:
+            return PromptContext._unlinked(prompt)
+        # Hits, keys and tokens of the appended tags are only worked out if a node asks
+        return PromptContext(prompt, None, self.analyses, upstream=self, appended=appended)
+
+    def with_analysis(self, name, analysis):
+        """Return a copy of this context that also records one node's detection results"""
+        analyses = dict(self.analyses)
+        analyses[name] = freeze_catalog(analysis)
+        return PromptContext(
+            self.prompt, self._hits, analyses, self._keys, self._tokens, self._generation,
+            upstream=self._upstream, appended=self._appended,
+        )
+
+    def passed_on(self, prompt, name=None, analysis=None):
+        """
+        Return the context a node hands to the next one: extended to its output prompt,
+        with its detection results recorded under name, and published so a node given
+        only the prompt still finds the analysis.
+        """
+        analyses = self.analyses
+        if name is not None:
+            analyses = dict(analyses)
+            analyses[name] = freeze_catalog(analysis)
+            analyses = MappingProxyType(analyses)
+        if prompt is self.prompt or prompt == self.prompt:
+            context = PromptContext(
+                prompt, self._hits, analyses, self._keys, self._tokens, self._generation,
+                upstream=self._upstream, appended=self._appended,
+            )
+        else:
+            appended = self._appended_text(prompt)
+            if appended is None:
+                context = PromptContext._unlinked(prompt)
+                if name is not None:
+                    context = context.with_analysis(name, analysis)
+            else:
+                context = PromptContext(prompt, None, analyses, upstream=self, appended=appended)
+        return publish(context)
+
+    def analysis_key(self, prompt):
+        """
+        Hashable key of the upstream analyses a node sees when given prompt with this context.
+        Everything else a context holds is derived from the prompt, so output caches key on
+        this instead of the context; the analyses are dropped when prompt does not extend it.
+        """
+        if prompt is not self.prompt and prompt != self.prompt and self._appended_text(prompt) is None:
+            return ()
+        key = self._analysis_key
+        if key is None:
+            key = self._analysis_key = _hashable(self.analyses)
+        return key
+
+    def __repr__(self):
+        return f"PromptContext({len(self.prompt)} chars, analyses={list(self.analyses)})"
+
+
+# Weak references to node output contexts by prompt: a context is found while something
+# (ComfyUI's output cache) still holds it. Cleared when full, like the tag memos.
+_PUBLISHED = {}
+_MAX_PUBLISHED = 4096
+
+
+def publish(context):
+    """Make context the analysis of its prompt for nodes that receive the prompt unlinked; returns context"""
+    if len(_PUBLISHED) >= _MAX_PUBLISHED:
+        _PUBLISHED.clear()
+    _PUBLISHED[context.prompt] = weakref.ref(context)
+    return context
+
+
+def upstream_context(prompt_contexts, index):
+    """Return the upstream PromptContext for the index-th prompt of a batch (or None)"""
+    if not prompt_contexts:
+        return None
+    return prompt_contexts[min(index, len(prompt_contexts) - 1)]
+
+
+def context_key(context):
+    """
+    Hashable key for a node's detected context.
+    Node tags and summaries depend only on settings, seed and this context, so a
+    batch renders them once per distinct key instead of once per prompt.
+    """
+    return tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in context.items()
+    ))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+"""
+Factory Emphasis - Shared Tag Emphasis Engine
+Renders emphasis levels and numeric weights for every node from one memoized table,
+so each emphasized tag string is built once per process and shared.
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+import sys
+
+# Emphasis levels offered by every node, with the bracket depth each one applies
+EMPHASIS_LEVELS = ("none", "low", "medium", "high", "very_high", "maximum")
+EMPHASIS_BRACKETS = {
+    "none": 0,
+    "low": 1,
+    "medium": 0,
+    "high": 2,
+    "very_high": 3,
+    "maximum": 4,
+}
+
+# Optional numeric weight input; 0 keeps the bracket level
+EMPHASIS_WEIGHT_INPUT = ("FLOAT", {"default": 0.0, "min": 0.0, "max": 3.0, "step": 0.05})
+
+
+def resolve_emphasis(level, weight=0.0):
+    """Return the emphasis to apply: a numeric weight when one is set, else the level name"""
+    if weight:
+        return round(float(weight), 2)
+    return level
+
+
+class EmphasisEngine:
+    """
+    Memoized tag emphasis.
+
+    Emphasis is either a level name (bracket depth, unknown names behave like
+    "medium") or a number, rendered as a prompt weight like (tag:1.3). Results
+    are interned and cached per emphasis, so repeated calls only do dict lookups.
+    """
+
+    max_cached_tags = 65536
+
+    def __init__(self):
+        self._tables = {}
+
+    def _table(self, emphasis):
+        table = self._tables.get(emphasis)
+        if table is None:
+            table = self._tables[emphasis] = {}
+        return table
+
+    def _render(self, tag, emphasis):
+        if isinstance(emphasis, (int, float)):
+            if emphasis == 1:
+                return sys.intern(tag)
+            return sys.intern(f"({tag}:{emphasis:g})")
+        depth = EMPHASIS_BRACKETS.get(emphasis, 0)
+        return sys.intern(f"{'(' * depth}{tag}{')' * depth}")
+
+    def emphasize(self, tag, emphasis="medium"):
+        """Return tag with emphasis applied"""
+        table = self._table(emphasis)
+        result = table.get(tag)
+        if result is None:
+            if len(table) >= self.max_cached_tags:
+                table.clear()
+            result = table[tag] = self._render(tag, emphasis)
+        return result
+
+    def emphasize_all(self, tags, emphasis="medium"):
+        """Return a list of tags with emphasis applied"""
+        table = self._table(emphasis)
+        results = []
+        for tag in tags:
+            result = table.get(tag)
+            if result is None:
+                result = self.emphasize(tag, emphasis)
+            results.append(result)
+        return results
+
+    def warm(self, tags, levels=EMPHASIS_LEVELS):
+        """Precompute the emphasized forms of tags for the given levels"""
+        for level in levels:
+            self.emphasize_all(tags, level)
+
+
+# One engine shared by every node
+EMPHASIS = EmphasisEngine()
+emphasize = EMPHASIS.emphasize
+emphasize_all = EMPHASIS.emphasize_all
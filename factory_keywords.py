@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+
+"""
+Factory Keywords - Shared Single-Pass Keyword Matching
+Finds every context keyword used by the node analyzers with one pass over the prompt,
+either as whole words (default) or with the legacy substring semantics.
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+import re
+from types import MappingProxyType
+
+# Keyword matching modes offered by the context-aware nodes
+WORD_BOUNDARY = "word_boundary"
+SUBSTRING = "substring"
+MATCHING_MODES = (WORD_BOUNDARY, SUBSTRING)
+
+# Prompt weights such as (tag:1.2) and the word characters kept by the tokenizer
+_WEIGHT = re.compile(r":\s*-?\d+(?:\.\d+)?")
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def normalize_keyword(keyword):
+    """Normalize a keyword or tag to lowercase words joined by single spaces"""
+    return " ".join(_WORD.findall(keyword.lower()))
+
+
+def normalize_tag(tag):
+    """Normalize a prompt tag for comparison: no emphasis, weight, underscores or case"""
+    return " ".join(_WORD.findall(_WEIGHT.sub(" ", tag.lower())))
+
+
+def tag_tokens(tag, max_words=1):
+    """Return the normalized words of one tag plus its word n-grams up to max_words"""
+    words = _WORD.findall(_WEIGHT.sub(" ", tag.lower()))
+    tokens = set(words)
+    for size in range(2, max_words + 1):
+        tokens.update(" ".join(words[i:i + size]) for i in range(len(words) - size + 1))
+    return tokens
+
+
+def prompt_tokens(prompt, max_words=1):
+    """
+    Split a prompt once into a frozenset of normalized tokens.
+    Underscores, emphasis brackets and weights like (tag:1.2) are dropped, and
+    n-grams never span the comma between two tags.
+    """
+    tokens = set()
+    for tag in prompt.split(","):
+        tokens |= tag_tokens(tag, max_words)
+    return frozenset(tokens)
+
+
+def _trie_pattern(keywords):
+    """Build a regex that matches the longest keyword starting at a position"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional tail so longer keywords win over their prefixes
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Multi-keyword matcher reporting every registered keyword found in a text.
+
+    In WORD_BOUNDARY mode a keyword matches when its normalized words appear as
+    whole tokens of one tag ("light" no longer matches "lighting"), which is a set
+    lookup per token. SUBSTRING mode keeps the legacy `keyword in text` results
+    using one trie-shaped regex that visits the text once.
+
+    Keywords never contain commas, so a prompt's hits are the union of the hits
+    of its comma-separated tags; tag results are memoized because chained nodes
+    and batch runs keep re-sending the same tags. The generation counts keyword
+    registrations, so hits kept elsewhere can tell when they predate a table.
+    """
+
+    max_cached_tags = 8192
+
+    def __init__(self, keywords=()):
+        self.keywords = frozenset()
+        self._pattern = None
+        self._covers = {}
+        self._by_token = {}
+        self.max_words = 1
+        self.generation = 0
+        self._tag_hits = {mode: {} for mode in MATCHING_MODES}
+        self.add(keywords)
+
+    def add(self, keywords):
+        """Register more keywords; the automaton is recompiled on the next scan"""
+        keywords = frozenset(keywords) - self.keywords
+        if keywords:
+            self.keywords |= keywords
+            self._pattern = None
+            self._tag_hits = {mode: {} for mode in MATCHING_MODES}
+            self.generation += 1
+
+    def _compile(self):
+        # Zero-width lookahead so overlapping keywords are all visited
+        pattern = re.compile(f"(?=({_trie_pattern(self.keywords)}))")
+        # A longest match implies every keyword contained in it is present too
+        self._covers = {
+            keyword: frozenset(other for other in self.keywords if other in keyword)
+            for keyword in self.keywords
+        }
+        # Token index: normalized keyword -> original spellings
+        by_token = {}
+        for keyword in self.keywords:
+            by_token.setdefault(normalize_keyword(keyword), set()).add(keyword)
+        self._by_token = {token: frozenset(keywords) for token, keywords in by_token.items()}
+        self.max_words = max((token.count(" ") + 1 for token in self._by_token), default=1)
+        self._pattern = pattern
+        return pattern
+
+    def match_tokens(self, tokens):
+        """Return the keywords whose normalized form is among a set of prompt tokens"""
+        if self._pattern is None:
+            self._compile()
+        hits = set()
+        for token in tokens:
+            keywords = self._by_token.get(token)
+            if keywords:
+                hits |= keywords
+        return frozenset(hits)
+
+    def scan_tag(self, tag, matching=WORD_BOUNDARY):
+        """Return the keywords occurring in a single comma-free piece of text"""
+        matching = SUBSTRING if matching == SUBSTRING else WORD_BOUNDARY
+        cache = self._tag_hits[matching]
+        hits = cache.get(tag)
+        if hits is None:
+            pattern = self._pattern or self._compile()
+            if matching == SUBSTRING:
+                hits = set()
+                for match in pattern.finditer(tag.lower()):
+                    hits |= self._covers[match.group(1)]
+                hits = frozenset(hits)
+            else:
+                hits = self.match_tokens(tag_tokens(tag, self.max_words))
+            if len(cache) >= self.max_cached_tags:
+                cache.clear()
+            cache[tag] = hits
+        return hits
+
+    def scan(self, text, matching=WORD_BOUNDARY):
+        """Return the frozenset of registered keywords occurring in text"""
+        if not self.keywords:
+            return frozenset()
+        hits = set()
+        for tag in set(text.split(",")):
+            hits |= self.scan_tag(tag, matching)
+        return frozenset(hits)
+
+
+# One matcher shared by every node so a prompt is scanned once for all analyzers
+PROMPT_KEYWORDS = KeywordMatcher()
+
+
+def keyword_table(groups):
+    """Freeze a {label: [keywords]} table and register its keywords with PROMPT_KEYWORDS"""
+    table = MappingProxyType({label: frozenset(keywords) for label, keywords in groups.items()})
+    for keywords in table.values():
+        PROMPT_KEYWORDS.add(keywords)
+    return table
+
+
+def first_match(table, hits, default):
+    """Return the first label (in table order) with a keyword among hits"""
+    for label, keywords in table.items():
+        if not hits.isdisjoint(keywords):
+            return label
+    return default
+
+
+def all_matches(table, hits):
+    """Return every label (in table order) with a keyword among hits"""
+    return [label for label, keywords in table.items() if not hits.isdisjoint(keywords)]
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+"""
+Factory Metadata - Structured Generation Records
+Builds the compact JSON metadata output of every node: the selections a node made, the
+context it detected and the size of what it appended, ready for bulk loading without
+parsing the human-readable summaries.
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+import json
+from collections.abc import Mapping
+
+
+def _plain(value):
+    """JSON fallback for the read-only catalog structures"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return str(value)
+
+
+def stage_metadata(stage, selections, detected, tag_count, token_count):
+    """Return one node's metadata record"""
+    return {
+        "stage": stage,
+        "selections": selections,
+        "detected": detected,
+        "tag_count": tag_count,
+        "token_count": token_count,
+    }
+
+
+# Encoder reused by every record (json.dumps builds a new one per call when options are passed)
+_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_plain)
+
+
+def metadata_json(record):
+    """Serialize a metadata record compactly with stable key order"""
+    return _ENCODER.encode(record)
+
+
+def stage_metadata_parts(stage, selections, detected):
+    """
+    Serialize the members of a stage record that do not depend on the prompt.
+    A batch rendering the same tags for many prompts serializes them once and
+    assembles each prompt's record with stage_metadata_json.
+    """
+    return (metadata_json(detected), metadata_json(selections), metadata_json(stage))
+
+
+def stage_metadata_json(parts, tag_count, token_count):
+    """Return metadata_json(stage_metadata(...)) built from stage_metadata_parts and the two counts"""
+    detected, selections, stage = parts
+    # Members in the sorted key order metadata_json writes
+    return (
+        f'{{"detected":{detected},"selections":{selections},"stage":{stage},'
+        f'"tag_count":{int(tag_count)},"token_count":{int(token_count)}}}'
+    )
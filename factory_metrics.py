@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+
+"""
+Factory Metrics - Prometheus Exposition
+Opt-in metrics registry for the node pack: calls and prompts per node, picks per option value,
+output cache hits, and histograms of prompt length in/out and tags added, exposed in the
+Prometheus text format over a local HTTP endpoint or written to a node_exporter textfile.
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+import functools
+import logging
+import os
+import threading
+from bisect import bisect_left
+
+logger = logging.getLogger(__name__)
+
+# Set to 1 to record metrics from startup; enable_metrics() switches it at runtime
+METRICS_ENV = "CAMERA_FACTORY_STATION_METRICS"
+
+# Serve /metrics on this local port, or rewrite this textfile periodically (either implies enabled)
+METRICS_PORT_ENV = "CAMERA_FACTORY_STATION_METRICS_PORT"
+METRICS_TEXTFILE_ENV = "CAMERA_FACTORY_STATION_METRICS_TEXTFILE"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+TEXTFILE_INTERVAL = 15.0
+
+PROMPT_LENGTH_BUCKETS = (50, 100, 200, 400, 800, 1600, 3200, 6400)
+TAGS_ADDED_BUCKETS = (0, 1, 2, 4, 8, 16, 32, 64)
+
+_enabled = os.environ.get(METRICS_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+_lock = threading.Lock()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with labels"""
+
+    kind = "counter"
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+
+    def inc(self, *labelvalues, amount=1):
+        with _lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def samples(self):
+        with _lock:
+            return [(self.name, _labels(self.labelnames, key), value) for key, value in sorted(self._values.items())]
+
+    def clear(self):
+        with _lock:
+            self._values.clear()
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels"""
+
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._values = {}
+
+    def observe(self, value, *labelvalues):
+        with _lock:
+            counts = self._values.get(labelvalues)
+            if counts is None:
+                counts = self._values[labelvalues] = [[0] * (len(self.buckets) + 1), 0, 0.0]
+            counts[0][bisect_left(self.buckets, value)] += 1
+            counts[1] += 1
+            counts[2] += value
+
+    def samples(self):
+        samples = []
+        with _lock:
+            for key, (buckets, count, total) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float("inf"),), buckets):
+                    cumulative += bucket_count
+                    labels = _labels(self.labelnames, key, (("le", _number(bound)),))
+                    samples.append((f"{self.name}_bucket", labels, cumulative))
+                samples.append((f"{self.name}_count", _labels(self.labelnames, key), count))
+                samples.append((f"{self.name}_sum", _labels(self.labelnames, key), total))
+        return samples
+
+    def clear(self):
+        with _lock:
+            self._values.clear()
+
+
+class Gauge:
+    """Gauge read from a callback at exposition time; the callback yields (labelvalues, value)"""
+
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labelnames, collect):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.collect = collect
+
+    def samples(self):
+        return [(self.name, _labels(self.labelnames, key), value) for key, value in self.collect()]
+
+    def clear(self):
+        pass
+
+
+def _output_caches():
+    """
+    (node name, output cache counters) of every loaded node class that has its own cache.
+    Node modules nobody has imported yet have empty caches, so scraping never imports them.
+    """
+    from . import NODE_CLASS_MAPPINGS
+
+    seen = set()
+    for name, node_class in NODE_CLASS_MAPPINGS.loaded():
+        cache = getattr(node_class, "output_cache", None)
+        if cache is not None and id(cache) not in seen:
+            seen.add(id(cache))
+            yield name, cache.info()
+
+
+def _cache_counter(field):
+    def collect():
+        return [((name,), info[field]) for name, info in _output_caches()]
+    return collect
+
+
+def _cache_hit_ratio():
+    ratios = []
+    for name, info in _output_caches():
+        lookups = info["hits"] + info["misses"]
+        ratios.append(((name,), info["hits"] / lookups if lookups else 0.0))
+    return ratios
+
+
+NODE_CALLS = Counter("camera_factory_node_calls_total", "Node executions (cache misses), per node class", ("node",))
+NODE_PROMPTS = Counter("camera_factory_node_prompts_total", "Prompts enhanced, per node class", ("node",))
+OPTION_PICKS = Counter(
+    "camera_factory_option_selections_total", "Prompts enhanced per value of each choice input", ("node", "option", "value")
+)
+PROMPT_LENGTH = Histogram(
+    "camera_factory_prompt_length_chars", "Prompt length in characters, before (in) and after (out) a node",
+    ("node", "direction"), PROMPT_LENGTH_BUCKETS,
+)
+TAGS_ADDED = Histogram("camera_factory_tags_added", "Tags a node appended to one prompt", ("node",), TAGS_ADDED_BUCKETS)
+CACHE_HITS = Gauge("camera_factory_output_cache_hits", "Output cache hits since the cache was last cleared", ("node",), _cache_counter("hits"))
+CACHE_MISSES = Gauge("camera_factory_output_cache_misses", "Output cache misses since the cache was last cleared", ("node",), _cache_counter("misses"))
+CACHE_HIT_RATIO = Gauge("camera_factory_output_cache_hit_ratio", "Output cache hits per lookup", ("node",), _cache_hit_ratio)
+
+METRICS = (NODE_CALLS, NODE_PROMPTS, OPTION_PICKS, PROMPT_LENGTH, TAGS_ADDED, CACHE_HITS, CACHE_MISSES, CACHE_HIT_RATIO)
+
+
+def enable_metrics(enabled=True):
+    """Switch recording on or off for the whole process"""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def metrics_enabled():
+    return _enabled
+
+
+def reset_metrics():
+    """Drop every recorded sample (cache gauges follow the caches themselves)"""
+    for metric in METRICS:
+        metric.clear()
+
+
+# Node class -> (required input names after the prompt, choice input names)
+_node_inputs = {}
+
+
+def _inputs_of(node_class):
+    inputs = _node_inputs.get(node_class)
+    if inputs is None:
+        schema = node_class.INPUT_TYPES()
+        required = tuple(schema["required"])[1:]
+        choices = frozenset(
+            name
+            for section in ("required", "optional")
+            for name, spec in schema.get(section, {}).items()
+            if isinstance(spec[0], (list, tuple))
+        )
+        inputs = _node_inputs[node_class] = (required, choices)
+    return inputs
+
+
+def observe(node_class, prompts, settings, results):
+    """Record one node execution over prompts with the given settings and output tuples"""
+    node = node_class.__name__
+    _, choices = _inputs_of(node_class)
+    NODE_CALLS.inc(node)
+    NODE_PROMPTS.inc(node, amount=len(results))
+    for name, value in settings.items():
+        if name in choices:
+            OPTION_PICKS.inc(node, name, value, amount=len(results))
+    for prompt, result in zip(prompts, results):
+        PROMPT_LENGTH.observe(len(prompt), node, "in")
+        PROMPT_LENGTH.observe(len(result[0]), node, "out")
+        TAGS_ADDED.observe(tags_added(prompt, result[0]), node)
+
+
+def tags_added(prompt, enhanced_prompt):
+    """
+    Number of tags a node appended to prompt, read from its output prompt (the metadata
+    output is empty when unlinked). Tags never contain commas and join_tags writes one
+    comma per tag, so this counts the commas after the incoming prompt.
+    """
+    if isinstance(enhanced_prompt, str):
+        return enhanced_prompt.count(",", len(prompt))
+    # A segment chain: only the appended segments are looked at, the chain is not joined
+    appended = enhanced_prompt.appended_since(prompt)
+    return 0 if appended is None else appended.count(",")
+
+
+def metered(method):
+    """
+    Record metrics for a node's batch method (list of prompts in, list of outputs out)
+    or single-prompt method. Costs one flag check while metrics are off.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, prompts, *args, **kwargs):
+        results = method(self, prompts, *args, **kwargs)
+        if _enabled:
+            node_class = type(self)
+            required, _ = _inputs_of(node_class)
+            settings = dict(zip(required, args))
+            settings.update(kwargs)
+            if isinstance(prompts, list):
+                observe(node_class, prompts, settings, results)
+            else:
+                observe(node_class, [prompts], settings, [results])
+        return results
+
+    return wrapper
+
+
+def render_metrics():
+    """Return every metric in the Prometheus text exposition format"""
+    lines = []
+    for metric in METRICS:
+        lines.append(f"# HELP {metric.name} {metric.help_text}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric.samples():
+            lines.append(f"{name}{labels} {_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path):
+    """Write the exposition atomically, for node_exporter's textfile collector"""
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temporary = tempfile.mkstemp(prefix=".camera_factory_", suffix=".prom", dir=directory)
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as textfile:
+            textfile.write(render_metrics())
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def metrics_handler():
+    """Return the request handler class serving GET /metrics (http.server is only imported to serve)"""
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = render_metrics().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Scrapes are frequent; keep them out of the ComfyUI console
+            pass
+
+    return MetricsHandler
+
+
+def start_metrics_server(port=0, host="127.0.0.1"):
+    """Serve /metrics from a daemon thread; returns the server (server.server_address has the bound port)"""
+    from http.server import ThreadingHTTPServer
+
+    server = ThreadingHTTPServer((host, port), metrics_handler())
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="camera-factory-metrics", daemon=True).start()
+    return server
+
+
+def start_textfile_writer(path, interval=TEXTFILE_INTERVAL):
+    """Rewrite the textfile every interval seconds from a daemon thread; returns an Event that stops it"""
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            try:
+                write_textfile(path)
+            except OSError as e:
+                logger.warning("Could not write metrics textfile %s: %s", path, e)
+
+    write_textfile(path)
+    threading.Thread(target=run, name="camera-factory-metrics-textfile", daemon=True).start()
+    return stop
+
+
+def start_from_environment():
+    """Enable metrics and start the endpoint or textfile writer configured by environment variables"""
+    port = os.environ.get(METRICS_PORT_ENV, "").strip()
+    textfile = os.environ.get(METRICS_TEXTFILE_ENV, "").strip()
+    if port or textfile:
+        enable_metrics()
+    try:
+        if port:
+            start_metrics_server(int(port))
+        if textfile:
+            start_textfile_writer(textfile)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not start metrics export: %s", e)
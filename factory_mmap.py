@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+
+"""
+Factory Mmap - Memory-Mapped Shared Catalogs
+Read-only catalog file that every worker process maps instead of holding its own copy of the
+catalogs: one string table plus an index of offsets into it, read through views that behave
+like the frozen catalog mappings (lookups, iteration in catalog order, keys/values/items).
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import ItemsView, Mapping, ValuesView
+
+MAGIC = b"CFSC"
+FILE_FORMAT = 1
+
+# magic, format, string count, root reference
+HEADER = struct.Struct("<4sIII")
+WORD = struct.Struct("<I")
+PAIR = struct.Struct("<II")
+INT = struct.Struct("<q")
+FLOAT = struct.Struct("<d")
+
+# A reference is a 32-bit word: the low bits tag the kind, the rest is a string index or node offset
+TAG_BITS = 3
+TAG_STRING = 0
+TAG_MAPPING = 1
+TAG_SEQUENCE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+
+
+class MappedCatalog(Mapping):
+    """
+    Catalog mapping backed by the shared file. Values are decoded on access: strings and
+    numbers as themselves, sequences as tuples, nested mappings as further views.
+    """
+
+    __slots__ = ("_file", "_offset", "_count")
+
+    def __init__(self, catalog_file, offset):
+        self._file = catalog_file
+        self._offset = offset
+        self._count = WORD.unpack_from(catalog_file.data, offset)[0]
+
+    def _entry(self, position):
+        """(key string index, value reference) of the entry at position, in catalog order"""
+        return PAIR.unpack_from(self._file.data, self._offset + 4 + 8 * position)
+
+    def _find(self, key):
+        """Position of key among the entries, or -1; binary search over the key-sorted index"""
+        if not isinstance(key, str):
+            return -1
+        target = key.encode("utf-8")
+        data = self._file.data
+        sorted_base = self._offset + 4 + 8 * self._count
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            position = WORD.unpack_from(data, sorted_base + 4 * middle)[0]
+            candidate = self._file.string_bytes(WORD.unpack_from(data, self._offset + 4 + 8 * position)[0])
+            if candidate == target:
+                return position
+            if candidate < target:
+                low = middle + 1
+            else:
+                high = middle
+        return -1
+
+    def __getitem__(self, key):
+        position = self._find(key)
+        if position < 0:
+            raise KeyError(key)
+        return self._file.value(self._entry(position)[1])
+
+    def get(self, key, default=None):
+        position = self._find(key)
+        if position < 0:
+            return default
+        return self._file.value(self._entry(position)[1])
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def __iter__(self):
+        for position in range(self._count):
+            yield self._file.string(self._entry(position)[0])
+
+    def __len__(self):
+        return self._count
+
+    def values(self):
+        return _MappedValues(self)
+
+    def items(self):
+        return _MappedItems(self)
+
+    def __repr__(self):
+        return f"MappedCatalog({dict(self.items())!r})"
+
+
+class _MappedValues(ValuesView):
+    """Values view decoding the entries in order, without a key lookup per value"""
+
+    __slots__ = ()
+
+    def __iter__(self):
+        catalog = self._mapping
+        for position in range(len(catalog)):
+            yield catalog._file.value(catalog._entry(position)[1])
+
+
+class _MappedItems(ItemsView):
+    """Items view decoding the entries in order, without a key lookup per value"""
+
+    __slots__ = ()
+
+    def __iter__(self):
+        catalog = self._mapping
+        for position in range(len(catalog)):
+            key, ref = catalog._entry(position)
+            yield catalog._file.string(key), catalog._file.value(ref)
+
+
+class CatalogFile:
+    """A catalog file mapped read-only into the process"""
+
+    def __init__(self, path):
+        with open(path, "rb") as catalog_file:
+            self.data = mmap.mmap(catalog_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size:
+            self.data.close()
+            raise ValueError("truncated catalog file")
+        magic, file_format, string_count, root = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or file_format != FILE_FORMAT:
+            self.data.close()
+            raise ValueError(f"not a format {FILE_FORMAT} catalog file")
+        self.path = path
+        self.string_offsets = HEADER.size
+        self.string_blob = self.string_offsets + 4 * (string_count + 1)
+        self.root = root
+
+    def string_bytes(self, index):
+        start, end = PAIR.unpack_from(self.data, self.string_offsets + 4 * index)
+        return self.data[self.string_blob + start:self.string_blob + end]
+
+    def string(self, index):
+        return self.string_bytes(index).decode("utf-8")
+
+    def value(self, ref):
+        """Decode the value a reference points at"""
+        tag, payload = ref & ((1 << TAG_BITS) - 1), ref >> TAG_BITS
+        if tag == TAG_STRING:
+            return self.string(payload)
+        if tag == TAG_MAPPING:
+            return MappedCatalog(self, payload)
+        if tag == TAG_SEQUENCE:
+            count = WORD.unpack_from(self.data, payload)[0]
+            return tuple(self.value(item) for item in struct.unpack_from(f"<{count}I", self.data, payload + 4))
+        if tag == TAG_INT:
+            return INT.unpack_from(self.data, payload)[0]
+        if tag == TAG_FLOAT:
+            return FLOAT.unpack_from(self.data, payload)[0]
+        raise ValueError(f"bad catalog reference {ref:#x} in {self.path}")
+
+    def catalogs(self):
+        """Top-level mapping of the file"""
+        return self.value(self.root)
+
+    def close(self):
+        self.data.close()
+
+
+def _strings(value, strings):
+    """Collect every string of a catalog (keys and values) in first-seen order"""
+    if type(value) is str:
+        strings.setdefault(value, len(strings))
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _strings(item, strings)
+    elif hasattr(value, "items"):
+        for key, item in value.items():
+            strings.setdefault(key, len(strings))
+            _strings(item, strings)
+
+
+class _Writer:
+    """Lays out the node section after the string table; identical nodes are stored once"""
+
+    def __init__(self, strings, base):
+        self.strings = strings
+        self.base = base
+        self.nodes = bytearray()
+        self.offsets = {}
+
+    def node(self, tag, body):
+        offset = self.offsets.get(body)
+        if offset is None:
+            offset = self.offsets[body] = self.base + len(self.nodes)
+            self.nodes += body
+        return (offset << TAG_BITS) | tag
+
+    def ref(self, value):
+        """Reference word for value, writing its node first when it needs one"""
+        if type(value) is str:
+            return (self.strings[value] << TAG_BITS) | TAG_STRING
+        if type(value) is int:
+            return self.node(TAG_INT, INT.pack(value))
+        if type(value) is float:
+            return self.node(TAG_FLOAT, FLOAT.pack(value))
+        if isinstance(value, (list, tuple)):
+            refs = [self.ref(item) for item in value]
+            return self.node(TAG_SEQUENCE, struct.pack(f"<{len(refs) + 1}I", len(refs), *refs))
+        if hasattr(value, "items"):
+            keys = list(value)
+            body = bytearray(WORD.pack(len(keys)))
+            for key in keys:
+                body += PAIR.pack(self.strings[key], self.ref(value[key]))
+            # Entry positions sorted by key bytes, for binary search
+            for position in sorted(range(len(keys)), key=lambda position: keys[position].encode("utf-8")):
+                body += WORD.pack(position)
+            return self.node(TAG_MAPPING, bytes(body))
+        raise TypeError(f"unsupported catalog value {value!r}")
+
+
+def write_catalog_file(path, catalogs):
+    """Write nested mappings of strings, numbers and sequences as a catalog file, atomically"""
+    strings = {}
+    _strings(catalogs, strings)
+    blobs = [value.encode("utf-8") for value in strings]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    table = struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(blobs)
+    table += b"\0" * (-(HEADER.size + len(table)) % 8)
+
+    writer = _Writer(strings, HEADER.size + len(table))
+    root = writer.ref(catalogs)
+    if (writer.base + len(writer.nodes)) >> (32 - TAG_BITS):
+        raise ValueError("catalogs too large for a catalog file")
+    contents = HEADER.pack(MAGIC, FILE_FORMAT, len(blobs), root) + table + bytes(writer.nodes)
+
+    # Processes that mapped the old file keep reading it; new ones map the replacement
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as catalog_file:
+        catalog_file.write(contents)
+    os.replace(temporary, path)
+    return path
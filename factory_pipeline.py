@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+
+"""
+Factory Pipeline - All Five Stages in One Node
+Runs camera, color, lighting, product and size enhancement in a single pass with one shared
+prompt analysis and one final join, producing the same prompt as the five chained nodes.
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+import functools
+
+from .factory_cache import OutputCache, input_fingerprint, memoized_output
+from .factory_camera_operator import FactoryCameraOperator
+from .factory_catalog import cached_input_types, freeze_catalog
+from .factory_color_harmonist import FactoryColorHarmonist
+from .factory_context import PROMPT_CONTEXT, PromptContext, publish
+from .factory_keywords import PROMPT_KEYWORDS, WORD_BOUNDARY
+from .factory_lighting_studio import FactoryLightingStudio
+from .factory_metadata import metadata_json, stage_metadata
+from .factory_metrics import metered
+from .factory_product_photographer import FactoryProductPhotographer
+from .factory_segments import PROMPT_SEGMENTS, PromptSegments
+from .factory_stats import class_stats, instrumented, lap, lap_prefix
+from .factory_summary import BUILD_METADATA, SUMMARY_COMPACT, SUMMARY_FULL, finish_summary, on_demand_summary, resolve_summary_mode
+from .factory_size_optimizer import FactorySizeOptimizer
+from .factory_tags import assemble_tags, prompt_tag_keys
+
+# Stages in chain order (the order of example_workflow.json): name, node class, render method
+PIPELINE_STAGES = (
+    ("camera", FactoryCameraOperator, "render_camera_settings"),
+    ("color", FactoryColorHarmonist, "render_color_harmony"),
+    ("lighting", FactoryLightingStudio, "render_lighting_design"),
+    ("product", FactoryProductPhotographer, "render_product_photography"),
+    ("size", FactorySizeOptimizer, "render_size_optimization"),
+)
+
+# Inputs with one value for the whole pipeline instead of one per stage
+SHARED_SETTINGS = ("context_awareness", "keyword_matching", "drop_duplicate_tags", "max_tokens", "summary_mode", "seed")
+SHARED_INPUTS = ("base_prompt", "prompt_context") + SHARED_SETTINGS
+
+
+@functools.lru_cache(maxsize=None)
+def stage_input_names(stages=PIPELINE_STAGES):
+    """
+    Map every stage input to its name on the pipeline node.
+    Names used by a single stage are kept; names used by several stages with different
+    options (photography_style, color_temperature, ...) get the stage name as prefix.
+    """
+    owners = {}
+    for name, node_class, _ in stages:
+        for section in ("required", "optional"):
+            for input_name in node_class.INPUT_TYPES().get(section, {}):
+                owners.setdefault(input_name, []).append(name)
+    
+    names = {}
+    for name, node_class, _ in stages:
+        mapping = {}
+        for section in ("required", "optional"):
+            for input_name in node_class.INPUT_TYPES().get(section, {}):
+                if input_name in SHARED_INPUTS:
+                    continue
+                if len(owners[input_name]) > 1 and not input_name.startswith(f"{name}_"):
+                    mapping[input_name] = f"{name}_{input_name}"
+                else:
+                    mapping[input_name] = input_name
+        names[name] = mapping
+    return freeze_catalog(names)
+
+
+class FactoryPipeline:
+    """
+    Fused camera -> color -> lighting -> product -> size node.
+    
+    Chaining the five nodes concatenates the growing prompt five times and analyzes it
+    five times. The pipeline keeps one running set of keyword hits instead, scanning only
+    the tags each stage appends, so every stage sees exactly the context it would see in
+    the chain, and joins the prompt once at the end.
+    """
+    
+    stages = PIPELINE_STAGES
+    
+    @cached_input_types
+    def INPUT_TYPES(cls):
+        names = stage_input_names(cls.stages)
+        required = {"base_prompt": ("STRING", {"forceInput": True})}
+        optional = {"prompt_context": (PROMPT_CONTEXT,)}
+        
+        # Shared settings first, then each stage's own settings in chain order
+        for name, node_class, _ in cls.stages:
+            for input_name in SHARED_SETTINGS:
+                spec = node_class.INPUT_TYPES()["optional"].get(input_name)
+                if spec is not None:
+                    optional.setdefault(input_name, spec)
+        for name, node_class, _ in cls.stages:
+            schema = node_class.INPUT_TYPES()
+            for section, target in (("required", required), ("optional", optional)):
+                for input_name, spec in schema.get(section, {}).items():
+                    if input_name in names[name]:
+                        target[names[name][input_name]] = spec
+        
+        return {
+            "required": required,
+            "optional": optional,
+            "hidden": {"unique_id": "UNIQUE_ID", "prompt": "PROMPT"},
+        }
+    
+    RETURN_TYPES = ("STRING", "STRING", "INT", "INT", PROMPT_CONTEXT, "INT", PROMPT_SEGMENTS, "STRING")
+    RETURN_NAMES = ("enhanced_prompt", "pipeline_summary", "width", "height", "prompt_context", "token_count", "prompt_segments", "metadata")
+    FUNCTION = "run_pipeline"
+    CATEGORY = "Camera Factory Station"
+    
+    # Bounded memo of recent outputs keyed by input fingerprint
+    output_cache = OutputCache(maxsize=1024)
+    
+    @classmethod
+    def cache_info(cls):
+        """Return hit/miss/eviction counters of the output cache"""
+        return cls.output_cache.info()
+    
+    @classmethod
+    def stats(cls):
+        """Return call counts and latency histograms per stage (recorded while factory_stats is enabled)"""
+        return class_stats(cls)
+    
+    @classmethod
+    def IS_CHANGED(cls, **kwargs):
+        """Selections are seeded, so identical inputs always produce identical output"""
+        kwargs["summary_mode"] = resolve_summary_mode(cls, kwargs)
+        return input_fingerprint(kwargs)
+    
+    def stage_settings(self, name, node_class, kwargs):
+        """Collect one stage's settings from the pipeline inputs under the stage's own names"""
+        mapping = stage_input_names(self.stages)[name]
+        settings = {
+            input_name: kwargs[pipeline_name]
+            for input_name, pipeline_name in mapping.items()
+            if pipeline_name in kwargs
+        }
+        for input_name in SHARED_SETTINGS:
+            if input_name in kwargs:
+                settings[input_name] = kwargs[input_name]
+        required = [settings.pop(input_name) for input_name in list(node_class.INPUT_TYPES()["required"])[1:]]
+        return required, settings
+    
+    def detect_stage_context(self, name, node, prompt, matching, prompt_context, context_awareness):
+        """Run one stage's prompt analysis against the hits of the prompt built so far"""
+        if name == "color":
+            return node.detect_color_context(prompt, matching, prompt_context, context_awareness)
+        if not context_awareness:
+            return {}
+        if name == "camera":
+            return node.analyze_prompt_context(prompt, matching, prompt_context)
+        if name == "lighting":
+            return node.analyze_prompt_for_lighting(prompt, matching, prompt_context)
+        return node.analyze_product_context(prompt, matching, prompt_context)
+    
+    @instrumented
+    @on_demand_summary
+    @memoized_output
+    @metered
+    def run_pipeline(self, base_prompt, **kwargs):
+        """Apply all five stages to the prompt in one pass"""
+        matching = kwargs.get("keyword_matching", WORD_BOUNDARY)
+        context_awareness = kwargs.get("context_awareness", True)
+        drop_duplicates = kwargs.get("drop_duplicate_tags", False)
+        max_tokens = kwargs.get("max_tokens", 0)
+        summary_mode = kwargs.get("summary_mode", SUMMARY_FULL)
+        build_metadata = kwargs.get(BUILD_METADATA, True)
+        
+        # One analysis of the incoming prompt, reusing the upstream one when connected
+        upstream = PromptContext.for_prompt(base_prompt, kwargs.get("prompt_context"))
+        hits = upstream.hits(matching)
+        # Tag keys are only needed to drop duplicates
+        keys = upstream.tag_keys() if drop_duplicates else None
+        tokens = upstream.token_count()
+        analyses = dict(upstream.analyses)
+        
+        segments = root = PromptSegments.of(base_prompt)
+        summaries = []
+        stage_records = []
+        width = height = None
+        
+        for name, node_class, render in self.stages:
+            lap_prefix(f"{name}.")
+            node = node_class()
+            required, settings = self.stage_settings(name, node_class, kwargs)
+            
+            if name == "size":
+                tags, summary, width, height, selections = getattr(node, render)(*required, **settings)
+                context = {}
+            else:
+                # The analyzers only read keyword hits, so a context carrying the hits of
+                # the prompt built so far stands in for the concatenated prompt
+                stage_context = PromptContext(base_prompt, {matching: hits})
+                context = self.detect_stage_context(name, node, base_prompt, matching, stage_context, context_awareness)
+                lap("analysis")
+                tags, summary, selections = getattr(node, render)(context, *required, **settings)
+                analyses[name] = freeze_catalog(context)
+            
+            # Drop duplicates of the prompt built so far and trim to the token budget
+            tags, report, stage_tokens = assemble_tags(tags, keys, tokens, drop_duplicates, max_tokens)
+            lap("tags")
+            summaries.append(finish_summary(summary, report, summary_mode))
+            lap("report")
+            stage_records.append(stage_metadata(name, selections, context, len(tags), stage_tokens))
+            lap("metadata")
+            
+            # A stage whose tags were all dropped leaves the prompt untouched
+            if tags:
+                segments = segments.append(tags)
+                text = segments.segment
+                
+                # Scan only the appended tags for the next stage
+                hits = hits | PROMPT_KEYWORDS.scan(text, matching)
+                if keys is not None:
+                    keys = keys | prompt_tag_keys(text)
+                tokens = stage_tokens
+            lap("scan")
+        
+        # Single join of the prompt and every stage's tags
+        lap_prefix("")
+        enhanced_prompt = segments.text()
+        lap("join")
+        separator = "\n" if summary_mode == SUMMARY_COMPACT else "\n\n"
+        pipeline_summary = separator.join(summary for summary in summaries if summary)
+        # Anything not worked out above (other matching modes, keys) comes from the upstream context
+        prompt_context = publish(PromptContext(
+            enhanced_prompt, {matching: hits}, analyses, keys, tokens,
+            upstream=upstream, appended=enhanced_prompt[len(root):],
+        ))
+        metadata = metadata_json({"stages": stage_records, "width": width, "height": height, "token_count": tokens}) if build_metadata else ""
+        lap("metadata")
+        
+        return (enhanced_prompt, pipeline_summary, width, height, prompt_context, tokens, segments, metadata)
@@ -7,7 +7,548 @@ Provides optimization for product photography, brand consistency, and platform-s
 SFW Edition - GitHub Compliant - Professional Grade
 """
 
-import random
+import logging
+
+from .factory_cache import OutputCache, input_fingerprint, memoized_output
+from .factory_catalog import cached_input_types, freeze_catalog, load_catalog
+from .factory_context import PROMPT_CONTEXT, PromptContext, context_key, upstream_context
+from .factory_emphasis import EMPHASIS_LEVELS, EMPHASIS_WEIGHT_INPUT, emphasize, emphasize_all, resolve_emphasis
+from .factory_keywords import MATCHING_MODES, WORD_BOUNDARY, first_match, keyword_table
+from .factory_metadata import metadata_json, stage_metadata, stage_metadata_json, stage_metadata_parts
+from .factory_metrics import metered
+from .factory_segments import PROMPT_SEGMENTS, PromptSegments, segments_input_types, segments_slots
+from .factory_stats import class_stats, instrumented, lap
+from .factory_summary import BUILD_METADATA, SUMMARY_FULL, SUMMARY_MODE_INPUT, SUMMARY_OFF, finish_summary, on_demand_summary, resolve_summary_mode
+from .factory_tags import CLIP_CHUNK_TOKENS, PreparedTags, assemble_tags, join_tags
+
+logger = logging.getLogger(__name__)
+
+# Comprehensive product photography styles covering all commercial scenarios
+PHOTOGRAPHY_STYLES = load_catalog("PHOTOGRAPHY_STYLES", lambda: {
+    # E-commerce Essentials
+    "clean_minimal": {
+        "description": "Clean minimal product photography",
+        "characteristics": ["white_background", "minimal_shadows", "even_lighting", "product_focus"],
+        "tags": ["clean_product", "minimal_style", "white_background", "professional_clean"],
+        "use_case": "e-commerce"
+    },
+    "amazon_optimized": {
+        "description": "Amazon marketplace optimized photography",
+        "characteristics": ["white_background_pure", "85_percent_frame_fill", "multiple_angles", "detail_shots"],
+        "tags": ["amazon_ready", "marketplace_optimized", "guidelines_compliant", "sales_focused"],
+        "use_case": "amazon_listing"
+    },
+    "shopify_standard": {
+        "description": "Shopify store standard product shots",
+        "characteristics": ["consistent_background", "brand_aligned", "mobile_optimized", "conversion_focused"],
+        "tags": ["shopify_ready", "store_consistent", "mobile_friendly", "conversion_optimized"],
+        "use_case": "shopify_store"
+    },
+    "etsy_handmade": {
+        "description": "Etsy handmade product photography",
+        "characteristics": ["artisan_feel", "handcrafted_story", "texture_emphasis", "authentic_presentation"],
+        "tags": ["etsy_style", "handmade_appeal", "artisan_craft", "authentic_product"],
+        "use_case": "etsy_listing"
+    },
+    "ebay_auction": {
+        "description": "eBay auction product photography",
+        "characteristics": ["detailed_condition", "multiple_views", "honest_representation", "competitive_appeal"],
+        "tags": ["ebay_ready", "auction_style", "condition_clear", "competitive_listing"],
+        "use_case": "ebay_auction"
+    },
+
+    # Lifestyle and Context
+    "lifestyle_contextual": {
+        "description": "Lifestyle contextual product shots",
+        "characteristics": ["natural_setting", "context_provided", "storytelling", "relatable"],
+        "tags": ["lifestyle_product", "contextual", "in_use", "natural_setting"],
+        "use_case": "marketing"
+    },
+    "in_use_demonstration": {
+        "description": "Product in active use demonstration",
+        "characteristics": ["hands_on_interaction", "practical_application", "real_world_context", "usage_clarity"],
+        "tags": ["in_use_shot", "demonstration", "practical_context", "user_interaction"],
+        "use_case": "instructional"
+    },
+    "home_environment": {
+        "description": "Product in home environment setting",
+        "characteristics": ["domestic_setting", "interior_context", "cozy_atmosphere", "relatable_space"],
+        "tags": ["home_setting", "domestic_product", "interior_styling", "lifestyle_integration"],
+        "use_case": "home_goods"
+    },
+    "office_workspace": {
+        "description": "Product in office workspace context",
+        "characteristics": ["professional_environment", "work_context", "productivity_focus", "business_setting"],
+        "tags": ["office_setting", "workspace_product", "professional_context", "business_use"],
+        "use_case": "office_products"
+    },
+    "outdoor_adventure": {
+        "description": "Product in outdoor adventure setting",
+        "characteristics": ["natural_environment", "adventure_context", "durability_emphasis", "active_lifestyle"],
+        "tags": ["outdoor_product", "adventure_gear", "nature_setting", "active_use"],
+        "use_case": "outdoor_gear"
+    },
+
+    # Premium and Luxury
+    "hero_dramatic": {
+        "description": "Hero dramatic product photography",
+        "characteristics": ["dramatic_lighting", "bold_composition", "premium_feel", "attention_grabbing"],
+        "tags": ["hero_shot", "dramatic_product", "premium_style", "bold_composition"],
+        "use_case": "advertising"
+    },
+    "luxury_premium": {
+        "description": "Luxury premium product presentation",
+        "characteristics": ["premium_materials", "elegant_composition", "exclusivity", "refined_aesthetic"],
+        "tags": ["luxury_product", "premium_style", "elegant", "exclusive_appeal"],
+        "use_case": "luxury"
+    },
+    "jewelry_precious": {
+        "description": "Precious jewelry product photography",
+        "characteristics": ["sparkle_enhancement", "reflection_control", "luxury_backdrop", "detail_precision"],
+        "tags": ["jewelry_product", "precious_metals", "sparkle_capture", "luxury_jewelry"],
+        "use_case": "jewelry"
+    },
+    "watch_timepiece": {
+        "description": "Watch and timepiece photography",
+        "characteristics": ["face_clarity", "mechanism_detail", "luxury_presentation", "precision_focus"],
+        "tags": ["watch_product", "timepiece", "mechanism_detail", "precision_craft"],
+        "use_case": "watches"
+    },
+    "automotive_luxury": {
+        "description": "Luxury automotive product photography",
+        "characteristics": ["reflective_surfaces", "power_emphasis", "premium_details", "performance_suggestion"],
+        "tags": ["automotive_product", "luxury_vehicle", "performance_focus", "premium_auto"],
+        "use_case": "automotive"
+    },
+
+    # Technical and Detailed
+    "technical_detailed": {
+        "description": "Technical detailed product documentation",
+        "characteristics": ["detailed_view", "technical_accuracy", "informative", "precise"],
+        "tags": ["technical_product", "detailed_view", "documentation", "precision"],
+        "use_case": "technical"
+    },
+    "exploded_view": {
+        "description": "Exploded view technical photography",
+        "characteristics": ["component_separation", "assembly_clarity", "technical_diagram", "educational_focus"],
+        "tags": ["exploded_view", "technical_diagram", "component_detail", "assembly_guide"],
+        "use_case": "technical_manual"
+    },
+    "cutaway_section": {
+        "description": "Cutaway section product photography",
+        "characteristics": ["internal_structure", "cross_section", "educational_value", "technical_insight"],
+        "tags": ["cutaway_view", "internal_structure", "cross_section", "technical_education"],
+        "use_case": "educational"
+    },
+    "before_after": {
+        "description": "Before and after product demonstration",
+        "characteristics": ["transformation_shown", "effectiveness_proof", "comparison_clear", "result_emphasis"],
+        "tags": ["before_after", "transformation", "effectiveness", "comparison_shot"],
+        "use_case": "demonstration"
+    },
+    "size_comparison": {
+        "description": "Size comparison product photography",
+        "characteristics": ["scale_reference", "size_clarity", "proportion_understanding", "measurement_visual"],
+        "tags": ["size_comparison", "scale_reference", "proportion", "measurement_guide"],
+        "use_case": "sizing_guide"
+    },
+
+    # Food and Beverage
+    "food_appetizing": {
+        "description": "Appetizing food product photography",
+        "characteristics": ["fresh_appearance", "texture_emphasis", "color_vibrant", "mouth_watering"],
+        "tags": ["food_product", "appetizing", "fresh_food", "culinary_appeal"],
+        "use_case": "food_marketing"
+    },
+    "beverage_refreshing": {
+        "description": "Refreshing beverage product photography",
+        "characteristics": ["condensation_drops", "ice_crystal", "liquid_clarity", "thirst_quenching"],
+        "tags": ["beverage_product", "refreshing", "liquid_appeal", "drink_marketing"],
+        "use_case": "beverage_marketing"
+    },
+    "ingredient_natural": {
+        "description": "Natural ingredient product photography",
+        "characteristics": ["organic_appearance", "natural_texture", "fresh_quality", "pure_ingredients"],
+        "tags": ["ingredient_product", "natural_food", "organic", "pure_quality"],
+        "use_case": "ingredient_marketing"
+    },
+    "packaging_design": {
+        "description": "Product packaging design photography",
+        "characteristics": ["label_clarity", "brand_visibility", "shelf_appeal", "package_integrity"],
+        "tags": ["packaging_product", "label_design", "brand_showcase", "shelf_ready"],
+        "use_case": "packaging_design"
+    },
+
+    # Fashion and Apparel
+    "fashion_flat_lay": {
+        "description": "Fashion flat lay product photography",
+        "characteristics": ["garment_flat", "styling_accessories", "color_coordination", "layout_artistic"],
+        "tags": ["fashion_product", "flat_lay", "garment_styling", "fashion_layout"],
+        "use_case": "fashion_retail"
+    },
+    "apparel_detail": {
+        "description": "Apparel detail product photography",
+        "characteristics": ["fabric_texture", "construction_quality", "detail_focus", "craftsmanship"],
+        "tags": ["apparel_product", "fabric_detail", "construction", "quality_showcase"],
+        "use_case": "apparel_detail"
+    },
+    "shoes_footwear": {
+        "description": "Shoes and footwear product photography",
+        "characteristics": ["profile_angles", "sole_detail", "material_texture", "style_emphasis"],
+        "tags": ["footwear_product", "shoe_detail", "style_showcase", "material_focus"],
+        "use_case": "footwear"
+    },
+    "accessories_fashion": {
+        "description": "Fashion accessories product photography",
+        "characteristics": ["texture_detail", "color_accuracy", "style_focus", "versatility_shown"],
+        "tags": ["accessory_product", "fashion_detail", "style_accent", "accessory_appeal"],
+        "use_case": "accessories"
+    },
+
+    # Electronics and Technology
+    "electronics_clean": {
+        "description": "Clean electronics product photography",
+        "characteristics": ["screen_clarity", "button_detail", "modern_aesthetic", "tech_appeal"],
+        "tags": ["electronics_product", "tech_device", "modern_design", "digital_appeal"],
+        "use_case": "electronics"
+    },
+    "gadget_innovative": {
+        "description": "Innovative gadget product photography",
+        "characteristics": ["feature_highlight", "innovation_emphasis", "modern_tech", "functionality_clear"],
+        "tags": ["gadget_product", "innovation", "tech_feature", "modern_gadget"],
+        "use_case": "tech_gadgets"
+    },
+    "software_ui": {
+        "description": "Software UI product photography",
+        "characteristics": ["screen_capture", "interface_clarity", "user_experience", "functionality_demo"],
+        "tags": ["software_product", "ui_design", "interface", "digital_product"],
+        "use_case": "software"
+    },
+    "mobile_app": {
+        "description": "Mobile app product photography",
+        "characteristics": ["phone_mockup", "app_interface", "user_interaction", "mobile_optimized"],
+        "tags": ["app_product", "mobile_interface", "user_experience", "app_showcase"],
+        "use_case": "mobile_apps"
+    },
+
+    # Health and Beauty
+    "cosmetics_beauty": {
+        "description": "Cosmetics beauty product photography",
+        "characteristics": ["color_accuracy", "texture_appeal", "luxury_feel", "beauty_enhancement"],
+        "tags": ["cosmetics_product", "beauty_appeal", "makeup", "skincare"],
+        "use_case": "beauty_products"
+    },
+    "skincare_clean": {
+        "description": "Skincare clean product photography",
+        "characteristics": ["purity_emphasis", "clean_aesthetic", "health_focus", "ingredient_transparency"],
+        "tags": ["skincare_product", "clean_beauty", "health_focus", "pure_ingredients"],
+        "use_case": "skincare"
+    },
+    "supplement_health": {
+        "description": "Health supplement product photography",
+        "characteristics": ["clinical_clean", "health_emphasis", "trust_building", "quality_assurance"],
+        "tags": ["supplement_product", "health_focus", "wellness", "quality_supplement"],
+        "use_case": "health_supplements"
+    },
+    "fitness_equipment": {
+        "description": "Fitness equipment product photography",
+        "characteristics": ["strength_emphasis", "durability_shown", "action_ready", "performance_focus"],
+        "tags": ["fitness_product", "exercise_equipment", "strength_training", "workout_gear"],
+        "use_case": "fitness_equipment"
+    },
+
+    # Home and Garden
+    "furniture_home": {
+        "description": "Home furniture product photography",
+        "characteristics": ["room_context", "comfort_emphasis", "style_showcase", "quality_materials"],
+        "tags": ["furniture_product", "home_decor", "interior_design", "comfort_living"],
+        "use_case": "furniture"
+    },
+    "kitchenware_functional": {
+        "description": "Functional kitchenware product photography",
+        "characteristics": ["utility_clear", "cooking_context", "durability_emphasis", "kitchen_ready"],
+        "tags": ["kitchenware_product", "cooking_tools", "kitchen_utility", "culinary_equipment"],
+        "use_case": "kitchenware"
+    },
+    "garden_outdoor": {
+        "description": "Garden outdoor product photography",
+        "characteristics": ["natural_setting", "outdoor_context", "weather_resistant", "garden_integration"],
+        "tags": ["garden_product", "outdoor_living", "landscaping", "garden_tools"],
+        "use_case": "gardening"
+    },
+    "home_improvement": {
+        "description": "Home improvement product photography",
+        "characteristics": ["tool_precision", "project_context", "durability_emphasis", "professional_grade"],
+        "tags": ["home_improvement", "tool_product", "construction", "diy_project"],
+        "use_case": "tools_hardware"
+    },
+
+    # Specialized Categories
+    "toy_playful": {
+        "description": "Playful toy product photography",
+        "characteristics": ["fun_emphasis", "bright_colors", "play_context", "child_appeal"],
+        "tags": ["toy_product", "playful", "child_friendly", "fun_design"],
+        "use_case": "toys"
+    },
+    "pet_supplies": {
+        "description": "Pet supplies product photography",
+        "characteristics": ["pet_context", "comfort_emphasis", "safety_focus", "animal_friendly"],
+        "tags": ["pet_product", "animal_care", "pet_comfort", "pet_safety"],
+        "use_case": "pet_care"
+    },
+    "book_media": {
+        "description": "Book and media product photography",
+        "characteristics": ["cover_clarity", "content_preview", "educational_value", "knowledge_focus"],
+        "tags": ["book_product", "media", "educational", "content_showcase"],
+        "use_case": "books_media"
+    },
+    "art_supplies": {
+        "description": "Art supplies product photography",
+        "characteristics": ["creative_context", "color_accuracy", "artistic_potential", "quality_materials"],
+        "tags": ["art_product", "creative_supplies", "artistic_tools", "creativity_enabler"],
+        "use_case": "art_supplies"
+    },
+    "musical_instruments": {
+        "description": "Musical instruments product photography",
+        "characteristics": ["craftsmanship_detail", "sound_suggestion", "artistic_beauty", "quality_construction"],
+        "tags": ["music_product", "instrument", "craftsmanship", "musical_quality"],
+        "use_case": "musical_instruments"
+    }
+})
+
+# Platform-specific optimizations
+PLATFORM_SPECS = load_catalog("PLATFORM_SPECS", lambda: {
+    "amazon_ecommerce": {
+        "requirements": ["white_background", "85%_frame_fill", "high_resolution", "no_watermarks"],
+        "tags": ["amazon_compliant", "ecommerce_ready", "marketplace_optimized"],
+        "aspect_ratio": "1:1",
+        "background": "pure_white"
+    },
+    "shopify_store": {
+        "requirements": ["consistent_styling", "brand_aligned", "mobile_optimized", "fast_loading"],
+        "tags": ["shopify_optimized", "store_ready", "brand_consistent"],
+        "aspect_ratio": "4:5",
+        "background": "flexible"
+    },
+    "instagram_social": {
+        "requirements": ["square_format", "visually_striking", "story_compatible", "mobile_first"],
+        "tags": ["instagram_ready", "social_optimized", "mobile_friendly"],
+        "aspect_ratio": "1:1",
+        "background": "lifestyle"
+    },
+    "pinterest_discovery": {
+        "requirements": ["vertical_format", "text_overlay_space", "visually_appealing", "clickable"],
+        "tags": ["pinterest_optimized", "discovery_ready", "vertical_format"],
+        "aspect_ratio": "2:3",
+        "background": "contextual"
+    },
+    "facebook_catalog": {
+        "requirements": ["catalog_compliant", "clear_product_view", "brand_consistent", "ad_ready"],
+        "tags": ["facebook_catalog", "ad_optimized", "clear_view"],
+        "aspect_ratio": "1:1",
+        "background": "neutral"
+    },
+    "website_hero": {
+        "requirements": ["high_impact", "brand_showcase", "responsive_design", "conversion_focused"],
+        "tags": ["website_hero", "high_impact", "conversion_focused"],
+        "aspect_ratio": "16:9",
+        "background": "branded"
+    },
+    "print_catalog": {
+        "requirements": ["high_resolution", "print_quality", "color_accurate", "detailed"],
+        "tags": ["print_ready", "catalog_quality", "high_resolution"],
+        "aspect_ratio": "4:5",
+        "background": "neutral"
+    },
+    "email_marketing": {
+        "requirements": ["attention_grabbing", "email_optimized", "quick_loading", "mobile_responsive"],
+        "tags": ["email_optimized", "attention_grabbing", "mobile_ready"],
+        "aspect_ratio": "2:1",
+        "background": "simple"
+    }
+})
+
+# Product categories and their specific needs
+PRODUCT_CATEGORIES = load_catalog("PRODUCT_CATEGORIES", lambda: {
+    "electronics_tech": {
+        "focus_points": ["technical_details", "screen_visibility", "port_access", "sleek_design"],
+        "tags": ["tech_product", "electronic_device", "modern_tech", "sleek_design"],
+        "lighting_needs": ["even_lighting", "no_reflections", "detail_emphasis"]
+    },
+    "fashion_apparel": {
+        "focus_points": ["fabric_texture", "fit_demonstration", "color_accuracy", "style_showcase"],
+        "tags": ["fashion_product", "apparel", "textile", "style_focused"],
+        "lighting_needs": ["soft_lighting", "texture_enhancement", "color_accurate"]
+    },
+    "beauty_cosmetics": {
+        "focus_points": ["color_precision", "texture_detail", "packaging_elegance", "application_view"],
+        "tags": ["beauty_product", "cosmetics", "color_accurate", "elegant"],
+        "lighting_needs": ["color_accurate", "soft_shadows", "luxury_feel"]
+    },
+    "home_decor": {
+        "focus_points": ["material_texture", "size_reference", "style_context", "room_integration"],
+        "tags": ["home_decor", "interior_product", "lifestyle_context", "material_focus"],
+        "lighting_needs": ["natural_lighting", "context_appropriate", "warm_atmosphere"]
+    },
+    "food_beverage": {
+        "focus_points": ["appetizing_appearance", "freshness_indication", "ingredient_visibility", "serving_suggestion"],
+        "tags": ["food_product", "appetizing", "fresh_appearance", "culinary"],
+        "lighting_needs": ["warm_lighting", "appetizing_glow", "fresh_appearance"]
+    },
+    "jewelry_accessories": {
+        "focus_points": ["detail_precision", "material_reflection", "craftsmanship", "luxury_presentation"],
+        "tags": ["jewelry", "luxury_accessory", "precious", "detailed"],
+        "lighting_needs": ["controlled_reflection", "detail_enhancement", "luxury_lighting"]
+    },
+    "sports_fitness": {
+        "focus_points": ["functionality_demonstration", "durability_suggestion", "action_context", "performance_focus"],
+        "tags": ["sports_product", "fitness_gear", "performance", "active"],
+        "lighting_needs": ["dynamic_lighting", "action_ready", "performance_focused"]
+    },
+    "books_media": {
+        "focus_points": ["cover_clarity", "spine_visibility", "content_preview", "collection_view"],
+        "tags": ["book_product", "media", "educational", "content_focused"],
+        "lighting_needs": ["even_lighting", "no_glare", "readable"]
+    },
+    "automotive_parts": {
+        "focus_points": ["precision_engineering", "fit_compatibility", "material_quality", "technical_specs"],
+        "tags": ["automotive", "precision_part", "engineering", "technical"],
+        "lighting_needs": ["technical_lighting", "detail_focused", "professional"]
+    },
+    "toys_games": {
+        "focus_points": ["fun_factor", "safety_features", "age_appropriateness", "play_demonstration"],
+        "tags": ["toy_product", "family_friendly", "fun", "playful"],
+        "lighting_needs": ["bright_lighting", "colorful", "inviting"]
+    }
+})
+
+# Brand positioning styles
+BRAND_POSITIONING = load_catalog("BRAND_POSITIONING", lambda: {
+    "premium_luxury": {
+        "characteristics": ["exclusive", "high_quality", "elegant"],
+        "tags": ["premium_brand", "luxury_positioning",  "exclusive"],
+        "visual_style": "refined"
+    },
+    "affordable_accessible": {
+        "characteristics": ["value_focused", "practical", "relatable", "friendly"],
+        "tags": ["affordable_brand", "accessible", "value_focused", "practical"],
+        "visual_style": "approachable"
+    },
+    "innovative_tech": {
+        "characteristics": ["cutting_edge", "modern", "advanced", "forward_thinking"],
+        "tags": ["innovative_brand", "tech_forward", "modern", "advanced"],
+        "visual_style": "futuristic"
+    },
+    "sustainable_eco": {
+        "characteristics": ["environmentally_conscious", "natural", "responsible", "authentic"],
+        "tags": ["sustainable_brand", "eco_friendly", "natural", "responsible"],
+        "visual_style": "organic"
+    },
+    "artisan_handmade": {
+        "characteristics": ["crafted", "authentic", "unique", "personal"],
+        "tags": ["artisan_brand", "handmade", "crafted", "authentic"],
+        "visual_style": "rustic"
+    },
+    "professional_business": {
+        "characteristics": ["reliable", "efficient", "trustworthy", "corporate"],
+        "tags": ["professional_brand", "business_grade", "reliable", "corporate"],
+        "visual_style": "corporate"
+    }
+})
+
+# Composition techniques for products
+COMPOSITION_TECHNIQUES = load_catalog("COMPOSITION_TECHNIQUES", lambda: {
+    "rule_of_thirds": {
+        "description": "Product positioned using rule of thirds",
+        "tags": ["rule_of_thirds", "balanced_composition", "dynamic_placement"]
+    },
+    "centered_symmetrical": {
+        "description": "Centered symmetrical product placement",
+        "tags": ["centered_composition", "symmetrical", "balanced", "formal"]
+    },
+    "diagonal_dynamic": {
+        "description": "Dynamic diagonal product arrangement",
+        "tags": ["diagonal_composition", "dynamic_angle", "energetic"]
+    },
+    "negative_space": {
+        "description": "Emphasis on negative space around product",
+        "tags": ["negative_space", "minimal_composition", "clean_layout"]
+    },
+    "layered_depth": {
+        "description": "Layered composition with depth",
+        "tags": ["layered_composition", "depth_of_field", "dimensional"]
+    },
+    "pattern_repetition": {
+        "description": "Pattern and repetition in product layout",
+        "tags": ["pattern_composition", "repetition", "rhythmic"]
+    }
+})
+
+
+# Product context keywords, checked in priority order (first matching group wins)
+PRODUCT_KEYWORDS = keyword_table({
+    "electronics": ["phone", "laptop", "camera", "headphones", "gadget", "device"],
+    "fashion": ["clothing", "shirt", "dress", "shoes", "accessories", "fabric"],
+    "beauty": ["makeup", "skincare", "cosmetics", "perfume", "beauty"],
+    "home": ["furniture", "decor", "kitchen", "home", "interior"],
+    "food": ["food", "beverage", "drink", "meal", "snack", "culinary"],
+    "jewelry": ["jewelry", "ring", "necklace", "watch", "precious", "gold"],
+    "sports": ["sports", "fitness", "athletic", "exercise", "gym", "outdoor"],
+    "automotive": ["car", "auto", "vehicle", "motor", "mechanical", "parts"]
+})
+
+COMMERCIAL_KEYWORDS = keyword_table({
+    "commercial": ["product", "commercial", "marketing", "advertising", "sale", "buy", "purchase"]
+})["commercial"]
+
+STYLE_KEYWORDS = keyword_table({
+    "clean": ["clean", "minimal", "simple", "white"],
+    "lifestyle": ["lifestyle", "natural", "contextual", "in_use"],
+    "dramatic": ["dramatic", "bold", "striking", "hero"],
+    "luxury": ["luxury", "premium", "elegant"]
+})
+
+# Image quality standard tags
+IMAGE_QUALITY_TAGS = load_catalog("IMAGE_QUALITY_TAGS", lambda: {
+    "standard": ["standard_quality", "basic_commercial"],
+    "high": ["high_quality", "enhanced_detail"],
+    "professional": ["professional_quality", "commercial_grade"],
+    "commercial": ["commercial_quality", "premium_standard"]
+})
+
+# Color accuracy tags
+COLOR_ACCURACY_TAGS = load_catalog("COLOR_ACCURACY_TAGS", lambda: {
+    "standard": ["standard_color", "basic_accuracy"],
+    "enhanced": ["enhanced_color", "vibrant_accurate"],
+    "true_to_life": ["true_to_life_color", "natural_accurate"],
+    "brand_matched": ["brand_matched_color", "consistent_palette"]
+})
+
+# Detail level tags
+DETAIL_TAGS = load_catalog("DETAIL_TAGS", lambda: {
+    "overview": ["overview_shot", "general_view"],
+    "detailed": ["detailed_view", "feature_focus"],
+    "macro": ["macro_detail", "close_up_precision"],
+    "technical": ["technical_detail", "specification_view"]
+})
+
+# Price point indicator tags
+PRICE_POINT_TAGS = load_catalog("PRICE_POINT_TAGS", lambda: {
+    "budget": ["budget_friendly", "value_focused", "accessible"],
+    "mid_range": ["mid_range", "balanced_value", "mainstream"],
+    "premium": ["premium_product", "high_value", "quality_focused"],
+    "luxury": ["luxury_product", "exclusive", "premium_tier"]
+})
+
+# Product focus tags
+PRODUCT_FOCUS_TAGS = load_catalog("PRODUCT_FOCUS_TAGS", lambda: {
+    "primary_product": ["single_product_focus", "main_subject", "hero_product"],
+    "product_group": ["product_group", "collection_shot", "family_view"],
+    "lifestyle_context": ["lifestyle_context", "in_use", "natural_setting"],
+    "detail_macro": ["macro_detail", "close_up", "feature_focus"],
+    "comparison_view": ["comparison_shot", "side_by_side", "variant_display"]
+})
+
 
 class FactoryProductPhotographer:
     """
@@ -15,477 +556,25 @@ class FactoryProductPhotographer:
     brand consistency, and platform-specific requirements.
     """
     
-    def __init__(self):
-        # Comprehensive product photography styles covering all commercial scenarios
-        self.photography_styles = {
-            # E-commerce Essentials
-            "clean_minimal": {
-                "description": "Clean minimal product photography",
-                "characteristics": ["white_background", "minimal_shadows", "even_lighting", "product_focus"],
-                "tags": ["clean_product", "minimal_style", "white_background", "professional_clean"],
-                "use_case": "e-commerce"
-            },
-            "amazon_optimized": {
-                "description": "Amazon marketplace optimized photography",
-                "characteristics": ["white_background_pure", "85_percent_frame_fill", "multiple_angles", "detail_shots"],
-                "tags": ["amazon_ready", "marketplace_optimized", "guidelines_compliant", "sales_focused"],
-                "use_case": "amazon_listing"
-            },
-            "shopify_standard": {
-                "description": "Shopify store standard product shots",
-                "characteristics": ["consistent_background", "brand_aligned", "mobile_optimized", "conversion_focused"],
-                "tags": ["shopify_ready", "store_consistent", "mobile_friendly", "conversion_optimized"],
-                "use_case": "shopify_store"
-            },
-            "etsy_handmade": {
-                "description": "Etsy handmade product photography",
-                "characteristics": ["artisan_feel", "handcrafted_story", "texture_emphasis", "authentic_presentation"],
-                "tags": ["etsy_style", "handmade_appeal", "artisan_craft", "authentic_product"],
-                "use_case": "etsy_listing"
-            },
-            "ebay_auction": {
-                "description": "eBay auction product photography",
-                "characteristics": ["detailed_condition", "multiple_views", "honest_representation", "competitive_appeal"],
-                "tags": ["ebay_ready", "auction_style", "condition_clear", "competitive_listing"],
-                "use_case": "ebay_auction"
-            },
-            
-            # Lifestyle and Context
-            "lifestyle_contextual": {
-                "description": "Lifestyle contextual product shots",
-                "characteristics": ["natural_setting", "context_provided", "storytelling", "relatable"],
-                "tags": ["lifestyle_product", "contextual", "in_use", "natural_setting"],
-                "use_case": "marketing"
-            },
-            "in_use_demonstration": {
-                "description": "Product in active use demonstration",
-                "characteristics": ["hands_on_interaction", "practical_application", "real_world_context", "usage_clarity"],
-                "tags": ["in_use_shot", "demonstration", "practical_context", "user_interaction"],
-                "use_case": "instructional"
-            },
-            "home_environment": {
-                "description": "Product in home environment setting",
-                "characteristics": ["domestic_setting", "interior_context", "cozy_atmosphere", "relatable_space"],
-                "tags": ["home_setting", "domestic_product", "interior_styling", "lifestyle_integration"],
-                "use_case": "home_goods"
-            },
-            "office_workspace": {
-                "description": "Product in office workspace context",
-                "characteristics": ["professional_environment", "work_context", "productivity_focus", "business_setting"],
-                "tags": ["office_setting", "workspace_product", "professional_context", "business_use"],
-                "use_case": "office_products"
-            },
-            "outdoor_adventure": {
-                "description": "Product in outdoor adventure setting",
-                "characteristics": ["natural_environment", "adventure_context", "durability_emphasis", "active_lifestyle"],
-                "tags": ["outdoor_product", "adventure_gear", "nature_setting", "active_use"],
-                "use_case": "outdoor_gear"
-            },
-            
-            # Premium and Luxury
-            "hero_dramatic": {
-                "description": "Hero dramatic product photography",
-                "characteristics": ["dramatic_lighting", "bold_composition", "premium_feel", "attention_grabbing"],
-                "tags": ["hero_shot", "dramatic_product", "premium_style", "bold_composition"],
-                "use_case": "advertising"
-            },
-            "luxury_premium": {
-                "description": "Luxury premium product presentation",
-                "characteristics": ["premium_materials", "elegant_composition", "exclusivity", "refined_aesthetic"],
-                "tags": ["luxury_product", "premium_style", "elegant", "exclusive_appeal"],
-                "use_case": "luxury"
-            },
-            "jewelry_precious": {
-                "description": "Precious jewelry product photography",
-                "characteristics": ["sparkle_enhancement", "reflection_control", "luxury_backdrop", "detail_precision"],
-                "tags": ["jewelry_product", "precious_metals", "sparkle_capture", "luxury_jewelry"],
-                "use_case": "jewelry"
-            },
-            "watch_timepiece": {
-                "description": "Watch and timepiece photography",
-                "characteristics": ["face_clarity", "mechanism_detail", "luxury_presentation", "precision_focus"],
-                "tags": ["watch_product", "timepiece", "mechanism_detail", "precision_craft"],
-                "use_case": "watches"
-            },
-            "automotive_luxury": {
-                "description": "Luxury automotive product photography",
-                "characteristics": ["reflective_surfaces", "power_emphasis", "premium_details", "performance_suggestion"],
-                "tags": ["automotive_product", "luxury_vehicle", "performance_focus", "premium_auto"],
-                "use_case": "automotive"
-            },
-            
-            # Technical and Detailed
-            "technical_detailed": {
-                "description": "Technical detailed product documentation",
-                "characteristics": ["detailed_view", "technical_accuracy", "informative", "precise"],
-                "tags": ["technical_product", "detailed_view", "documentation", "precision"],
-                "use_case": "technical"
-            },
-            "exploded_view": {
-                "description": "Exploded view technical photography",
-                "characteristics": ["component_separation", "assembly_clarity", "technical_diagram", "educational_focus"],
-                "tags": ["exploded_view", "technical_diagram", "component_detail", "assembly_guide"],
-                "use_case": "technical_manual"
-            },
-            "cutaway_section": {
-                "description": "Cutaway section product photography",
-                "characteristics": ["internal_structure", "cross_section", "educational_value", "technical_insight"],
-                "tags": ["cutaway_view", "internal_structure", "cross_section", "technical_education"],
-                "use_case": "educational"
-            },
-            "before_after": {
-                "description": "Before and after product demonstration",
-                "characteristics": ["transformation_shown", "effectiveness_proof", "comparison_clear", "result_emphasis"],
-                "tags": ["before_after", "transformation", "effectiveness", "comparison_shot"],
-                "use_case": "demonstration"
-            },
-            "size_comparison": {
-                "description": "Size comparison product photography",
-                "characteristics": ["scale_reference", "size_clarity", "proportion_understanding", "measurement_visual"],
-                "tags": ["size_comparison", "scale_reference", "proportion", "measurement_guide"],
-                "use_case": "sizing_guide"
-            },
-            
-            # Food and Beverage
-            "food_appetizing": {
-                "description": "Appetizing food product photography",
-                "characteristics": ["fresh_appearance", "texture_emphasis", "color_vibrant", "mouth_watering"],
-                "tags": ["food_product", "appetizing", "fresh_food", "culinary_appeal"],
-                "use_case": "food_marketing"
-            },
-            "beverage_refreshing": {
-                "description": "Refreshing beverage product photography",
-                "characteristics": ["condensation_drops", "ice_crystal", "liquid_clarity", "thirst_quenching"],
-                "tags": ["beverage_product", "refreshing", "liquid_appeal", "drink_marketing"],
-                "use_case": "beverage_marketing"
-            },
-            "ingredient_natural": {
-                "description": "Natural ingredient product photography",
-                "characteristics": ["organic_appearance", "natural_texture", "fresh_quality", "pure_ingredients"],
-                "tags": ["ingredient_product", "natural_food", "organic", "pure_quality"],
-                "use_case": "ingredient_marketing"
-            },
-            "packaging_design": {
-                "description": "Product packaging design photography",
-                "characteristics": ["label_clarity", "brand_visibility", "shelf_appeal", "package_integrity"],
-                "tags": ["packaging_product", "label_design", "brand_showcase", "shelf_ready"],
-                "use_case": "packaging_design"
-            },
-            
-            # Fashion and Apparel
-            "fashion_flat_lay": {
-                "description": "Fashion flat lay product photography",
-                "characteristics": ["garment_flat", "styling_accessories", "color_coordination", "layout_artistic"],
-                "tags": ["fashion_product", "flat_lay", "garment_styling", "fashion_layout"],
-                "use_case": "fashion_retail"
-            },
-            "apparel_detail": {
-                "description": "Apparel detail product photography",
-                "characteristics": ["fabric_texture", "construction_quality", "detail_focus", "craftsmanship"],
-                "tags": ["apparel_product", "fabric_detail", "construction", "quality_showcase"],
-                "use_case": "apparel_detail"
-            },
-            "shoes_footwear": {
-                "description": "Shoes and footwear product photography",
-                "characteristics": ["profile_angles", "sole_detail", "material_texture", "style_emphasis"],
-                "tags": ["footwear_product", "shoe_detail", "style_showcase", "material_focus"],
-                "use_case": "footwear"
-            },
-            "accessories_fashion": {
-                "description": "Fashion accessories product photography",
-                "characteristics": ["texture_detail", "color_accuracy", "style_focus", "versatility_shown"],
-                "tags": ["accessory_product", "fashion_detail", "style_accent", "accessory_appeal"],
-                "use_case": "accessories"
-            },
-            
-            # Electronics and Technology
-            "electronics_clean": {
-                "description": "Clean electronics product photography",
-                "characteristics": ["screen_clarity", "button_detail", "modern_aesthetic", "tech_appeal"],
-                "tags": ["electronics_product", "tech_device", "modern_design", "digital_appeal"],
-                "use_case": "electronics"
-            },
-            "gadget_innovative": {
-                "description": "Innovative gadget product photography",
-                "characteristics": ["feature_highlight", "innovation_emphasis", "modern_tech", "functionality_clear"],
-                "tags": ["gadget_product", "innovation", "tech_feature", "modern_gadget"],
-                "use_case": "tech_gadgets"
-            },
-            "software_ui": {
-                "description": "Software UI product photography",
-                "characteristics": ["screen_capture", "interface_clarity", "user_experience", "functionality_demo"],
-                "tags": ["software_product", "ui_design", "interface", "digital_product"],
-                "use_case": "software"
-            },
-            "mobile_app": {
-                "description": "Mobile app product photography",
-                "characteristics": ["phone_mockup", "app_interface", "user_interaction", "mobile_optimized"],
-                "tags": ["app_product", "mobile_interface", "user_experience", "app_showcase"],
-                "use_case": "mobile_apps"
-            },
-            
-            # Health and Beauty
-            "cosmetics_beauty": {
-                "description": "Cosmetics beauty product photography",
-                "characteristics": ["color_accuracy", "texture_appeal", "luxury_feel", "beauty_enhancement"],
-                "tags": ["cosmetics_product", "beauty_appeal", "makeup", "skincare"],
-                "use_case": "beauty_products"
-            },
-            "skincare_clean": {
-                "description": "Skincare clean product photography",
-                "characteristics": ["purity_emphasis", "clean_aesthetic", "health_focus", "ingredient_transparency"],
-                "tags": ["skincare_product", "clean_beauty", "health_focus", "pure_ingredients"],
-                "use_case": "skincare"
-            },
-            "supplement_health": {
-                "description": "Health supplement product photography",
-                "characteristics": ["clinical_clean", "health_emphasis", "trust_building", "quality_assurance"],
-                "tags": ["supplement_product", "health_focus", "wellness", "quality_supplement"],
-                "use_case": "health_supplements"
-            },
-            "fitness_equipment": {
-                "description": "Fitness equipment product photography",
-                "characteristics": ["strength_emphasis", "durability_shown", "action_ready", "performance_focus"],
-                "tags": ["fitness_product", "exercise_equipment", "strength_training", "workout_gear"],
-                "use_case": "fitness_equipment"
-            },
-            
-            # Home and Garden
-            "furniture_home": {
-                "description": "Home furniture product photography",
-                "characteristics": ["room_context", "comfort_emphasis", "style_showcase", "quality_materials"],
-                "tags": ["furniture_product", "home_decor", "interior_design", "comfort_living"],
-                "use_case": "furniture"
-            },
-            "kitchenware_functional": {
-                "description": "Functional kitchenware product photography",
-                "characteristics": ["utility_clear", "cooking_context", "durability_emphasis", "kitchen_ready"],
-                "tags": ["kitchenware_product", "cooking_tools", "kitchen_utility", "culinary_equipment"],
-                "use_case": "kitchenware"
-            },
-            "garden_outdoor": {
-                "description": "Garden outdoor product photography",
-                "characteristics": ["natural_setting", "outdoor_context", "weather_resistant", "garden_integration"],
-                "tags": ["garden_product", "outdoor_living", "landscaping", "garden_tools"],
-                "use_case": "gardening"
-            },
-            "home_improvement": {
-                "description": "Home improvement product photography",
-                "characteristics": ["tool_precision", "project_context", "durability_emphasis", "professional_grade"],
-                "tags": ["home_improvement", "tool_product", "construction", "diy_project"],
-                "use_case": "tools_hardware"
-            },
-            
-            # Specialized Categories
-            "toy_playful": {
-                "description": "Playful toy product photography",
-                "characteristics": ["fun_emphasis", "bright_colors", "play_context", "child_appeal"],
-                "tags": ["toy_product", "playful", "child_friendly", "fun_design"],
-                "use_case": "toys"
-            },
-            "pet_supplies": {
-                "description": "Pet supplies product photography",
-                "characteristics": ["pet_context", "comfort_emphasis", "safety_focus", "animal_friendly"],
-                "tags": ["pet_product", "animal_care", "pet_comfort", "pet_safety"],
-                "use_case": "pet_care"
-            },
-            "book_media": {
-                "description": "Book and media product photography",
-                "characteristics": ["cover_clarity", "content_preview", "educational_value", "knowledge_focus"],
-                "tags": ["book_product", "media", "educational", "content_showcase"],
-                "use_case": "books_media"
-            },
-            "art_supplies": {
-                "description": "Art supplies product photography",
-                "characteristics": ["creative_context", "color_accuracy", "artistic_potential", "quality_materials"],
-                "tags": ["art_product", "creative_supplies", "artistic_tools", "creativity_enabler"],
-                "use_case": "art_supplies"
-            },
-            "musical_instruments": {
-                "description": "Musical instruments product photography",
-                "characteristics": ["craftsmanship_detail", "sound_suggestion", "artistic_beauty", "quality_construction"],
-                "tags": ["music_product", "instrument", "craftsmanship", "musical_quality"],
-                "use_case": "musical_instruments"
-            }
-        }
-        
-        # Platform-specific optimizations
-        self.platform_specs = {
-            "amazon_ecommerce": {
-                "requirements": ["white_background", "85%_frame_fill", "high_resolution", "no_watermarks"],
-                "tags": ["amazon_compliant", "ecommerce_ready", "marketplace_optimized"],
-                "aspect_ratio": "1:1",
-                "background": "pure_white"
-            },
-            "shopify_store": {
-                "requirements": ["consistent_styling", "brand_aligned", "mobile_optimized", "fast_loading"],
-                "tags": ["shopify_optimized", "store_ready", "brand_consistent"],
-                "aspect_ratio": "4:5",
-                "background": "flexible"
-            },
-            "instagram_social": {
-                "requirements": ["square_format", "visually_striking", "story_compatible", "mobile_first"],
-                "tags": ["instagram_ready", "social_optimized", "mobile_friendly"],
-                "aspect_ratio": "1:1",
-                "background": "lifestyle"
-            },
-            "pinterest_discovery": {
-                "requirements": ["vertical_format", "text_overlay_space", "visually_appealing", "clickable"],
-                "tags": ["pinterest_optimized", "discovery_ready", "vertical_format"],
-                "aspect_ratio": "2:3",
-                "background": "contextual"
-            },
-            "facebook_catalog": {
-                "requirements": ["catalog_compliant", "clear_product_view", "brand_consistent", "ad_ready"],
-                "tags": ["facebook_catalog", "ad_optimized", "clear_view"],
-                "aspect_ratio": "1:1",
-                "background": "neutral"
-            },
-            "website_hero": {
-                "requirements": ["high_impact", "brand_showcase", "responsive_design", "conversion_focused"],
-                "tags": ["website_hero", "high_impact", "conversion_focused"],
-                "aspect_ratio": "16:9",
-                "background": "branded"
-            },
-            "print_catalog": {
-                "requirements": ["high_resolution", "print_quality", "color_accurate", "detailed"],
-                "tags": ["print_ready", "catalog_quality", "high_resolution"],
-                "aspect_ratio": "4:5",
-                "background": "neutral"
-            },
-            "email_marketing": {
-                "requirements": ["attention_grabbing", "email_optimized", "quick_loading", "mobile_responsive"],
-                "tags": ["email_optimized", "attention_grabbing", "mobile_ready"],
-                "aspect_ratio": "2:1",
-                "background": "simple"
-            }
-        }
-        
-        # Product categories and their specific needs
-        self.product_categories = {
-            "electronics_tech": {
-                "focus_points": ["technical_details", "screen_visibility", "port_access", "sleek_design"],
-                "tags": ["tech_product", "electronic_device", "modern_tech", "sleek_design"],
-                "lighting_needs": ["even_lighting", "no_reflections", "detail_emphasis"]
-            },
-            "fashion_apparel": {
-                "focus_points": ["fabric_texture", "fit_demonstration", "color_accuracy", "style_showcase"],
-                "tags": ["fashion_product", "apparel", "textile", "style_focused"],
-                "lighting_needs": ["soft_lighting", "texture_enhancement", "color_accurate"]
-            },
-            "beauty_cosmetics": {
-                "focus_points": ["color_precision", "texture_detail", "packaging_elegance", "application_view"],
-                "tags": ["beauty_product", "cosmetics", "color_accurate", "elegant"],
-                "lighting_needs": ["color_accurate", "soft_shadows", "luxury_feel"]
-            },
-            "home_decor": {
-                "focus_points": ["material_texture", "size_reference", "style_context", "room_integration"],
-                "tags": ["home_decor", "interior_product", "lifestyle_context", "material_focus"],
-                "lighting_needs": ["natural_lighting", "context_appropriate", "warm_atmosphere"]
-            },
-            "food_beverage": {
-                "focus_points": ["appetizing_appearance", "freshness_indication", "ingredient_visibility", "serving_suggestion"],
-                "tags": ["food_product", "appetizing", "fresh_appearance", "culinary"],
-                "lighting_needs": ["warm_lighting", "appetizing_glow", "fresh_appearance"]
-            },
-            "jewelry_accessories": {
-                "focus_points": ["detail_precision", "material_reflection", "craftsmanship", "luxury_presentation"],
-                "tags": ["jewelry", "luxury_accessory", "precious", "detailed"],
-                "lighting_needs": ["controlled_reflection", "detail_enhancement", "luxury_lighting"]
-            },
-            "sports_fitness": {
-                "focus_points": ["functionality_demonstration", "durability_suggestion", "action_context", "performance_focus"],
-                "tags": ["sports_product", "fitness_gear", "performance", "active"],
-                "lighting_needs": ["dynamic_lighting", "action_ready", "performance_focused"]
-            },
-            "books_media": {
-                "focus_points": ["cover_clarity", "spine_visibility", "content_preview", "collection_view"],
-                "tags": ["book_product", "media", "educational", "content_focused"],
-                "lighting_needs": ["even_lighting", "no_glare", "readable"]
-            },
-            "automotive_parts": {
-                "focus_points": ["precision_engineering", "fit_compatibility", "material_quality", "technical_specs"],
-                "tags": ["automotive", "precision_part", "engineering", "technical"],
-                "lighting_needs": ["technical_lighting", "detail_focused", "professional"]
-            },
-            "toys_games": {
-                "focus_points": ["fun_factor", "safety_features", "age_appropriateness", "play_demonstration"],
-                "tags": ["toy_product", "family_friendly", "fun", "playful"],
-                "lighting_needs": ["bright_lighting", "colorful", "inviting"]
-            }
-        }
-        
-        # Brand positioning styles
-        self.brand_positioning = {
-            "premium_luxury": {
-                "characteristics": ["exclusive", "high_quality", "elegant"],
-                "tags": ["premium_brand", "luxury_positioning",  "exclusive"],
-                "visual_style": "refined"
-            },
-            "affordable_accessible": {
-                "characteristics": ["value_focused", "practical", "relatable", "friendly"],
-                "tags": ["affordable_brand", "accessible", "value_focused", "practical"],
-                "visual_style": "approachable"
-            },
-            "innovative_tech": {
-                "characteristics": ["cutting_edge", "modern", "advanced", "forward_thinking"],
-                "tags": ["innovative_brand", "tech_forward", "modern", "advanced"],
-                "visual_style": "futuristic"
-            },
-            "sustainable_eco": {
-                "characteristics": ["environmentally_conscious", "natural", "responsible", "authentic"],
-                "tags": ["sustainable_brand", "eco_friendly", "natural", "responsible"],
-                "visual_style": "organic"
-            },
-            "artisan_handmade": {
-                "characteristics": ["crafted", "authentic", "unique", "personal"],
-                "tags": ["artisan_brand", "handmade", "crafted", "authentic"],
-                "visual_style": "rustic"
-            },
-            "professional_business": {
-                "characteristics": ["reliable", "efficient", "trustworthy", "corporate"],
-                "tags": ["professional_brand", "business_grade", "reliable", "corporate"],
-                "visual_style": "corporate"
-            }
-        }
-        
-        # Composition techniques for products
-        self.composition_techniques = {
-            "rule_of_thirds": {
-                "description": "Product positioned using rule of thirds",
-                "tags": ["rule_of_thirds", "balanced_composition", "dynamic_placement"]
-            },
-            "centered_symmetrical": {
-                "description": "Centered symmetrical product placement",
-                "tags": ["centered_composition", "symmetrical", "balanced", "formal"]
-            },
-            "diagonal_dynamic": {
-                "description": "Dynamic diagonal product arrangement",
-                "tags": ["diagonal_composition", "dynamic_angle", "energetic"]
-            },
-            "negative_space": {
-                "description": "Emphasis on negative space around product",
-                "tags": ["negative_space", "minimal_composition", "clean_layout"]
-            },
-            "layered_depth": {
-                "description": "Layered composition with depth",
-                "tags": ["layered_composition", "depth_of_field", "dimensional"]
-            },
-            "pattern_repetition": {
-                "description": "Pattern and repetition in product layout",
-                "tags": ["pattern_composition", "repetition", "rhythmic"]
-            }
-        }
+    # Shared read-only catalogs, built once per process
+    photography_styles = PHOTOGRAPHY_STYLES
+    platform_specs = PLATFORM_SPECS
+    product_categories = PRODUCT_CATEGORIES
+    brand_positioning = BRAND_POSITIONING
+    composition_techniques = COMPOSITION_TECHNIQUES
+    image_quality_tags = IMAGE_QUALITY_TAGS
+    color_accuracy_tags = COLOR_ACCURACY_TAGS
+    detail_tags = DETAIL_TAGS
+    price_point_tags = PRICE_POINT_TAGS
+    product_focus_tags = PRODUCT_FOCUS_TAGS
     
-    @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
-        instance = cls()
-        
-        style_options = ["auto"] + list(instance.photography_styles.keys())
-        platform_options = ["none"] + list(instance.platform_specs.keys())
-        category_options = ["auto"] + list(instance.product_categories.keys())
-        brand_options = ["auto"] + list(instance.brand_positioning.keys())
-        composition_options = ["auto"] + list(instance.composition_techniques.keys())
+        style_options = ["auto"] + list(cls.photography_styles.keys())
+        platform_options = ["none"] + list(cls.platform_specs.keys())
+        category_options = ["auto"] + list(cls.product_categories.keys())
+        brand_options = ["auto"] + list(cls.brand_positioning.keys())
+        composition_options = ["auto"] + list(cls.composition_techniques.keys())
         
         return {
             "required": {
@@ -494,6 +583,8 @@ class FactoryProductPhotographer:
                 "product_focus": (["primary_product", "product_group", "lifestyle_context", "detail_macro", "comparison_view"], {"default": "primary_product"}),
             },
             "optional": {
+                "prompt_context": (PROMPT_CONTEXT,),
+                
                 # Platform Optimization
                 "target_platform": (platform_options, {"default": "none"}),
                 "platform_compliance": ("BOOLEAN", {"default": True}),
@@ -534,55 +625,55 @@ class FactoryProductPhotographer:
                 "social_sharing_optimized": ("BOOLEAN", {"default": False}),
                 
                 # Enhancement
-                "product_emphasis": (["low", "medium", "high", "very_high"], {"default": "medium"}),
+                "product_emphasis": (list(EMPHASIS_LEVELS), {"default": "medium"}),
                 "context_awareness": ("BOOLEAN", {"default": True}),
-            }
+                
+                # Prompt Assembly Controls
+                "keyword_matching": (list(MATCHING_MODES), {"default": WORD_BOUNDARY}),
+                "product_emphasis_weight": EMPHASIS_WEIGHT_INPUT,
+                "drop_duplicate_tags": ("BOOLEAN", {"default": False}),
+                "max_tokens": ("INT", {"default": 0, "min": 0, "max": 4096, "step": CLIP_CHUNK_TOKENS}),
+                "summary_mode": SUMMARY_MODE_INPUT,
+            },
+            "hidden": {"unique_id": "UNIQUE_ID", "prompt": "PROMPT"},
         }
     
-    RETURN_TYPES = ("STRING", "STRING")
-    RETURN_NAMES = ("enhanced_prompt", "product_summary")
+    RETURN_TYPES = ("STRING", "STRING", PROMPT_CONTEXT, "INT", PROMPT_SEGMENTS, "STRING")
+    RETURN_NAMES = ("enhanced_prompt", "product_summary", "prompt_context", "token_count", "prompt_segments", "metadata")
     FUNCTION = "optimize_product_photography"
     CATEGORY = "Camera Factory Station"
     
-    def analyze_product_context(self, prompt):
+    # Bounded memo of recent outputs keyed by input fingerprint
+    output_cache = OutputCache(maxsize=1024)
+    
+    @classmethod
+    def cache_info(cls):
+        """Return hit/miss/eviction counters of the output cache"""
+        return cls.output_cache.info()
+    
+    @classmethod
+    def stats(cls):
+        """Return call counts and latency histograms per stage (recorded while factory_stats is enabled)"""
+        return class_stats(cls)
+    
+    @classmethod
+    def IS_CHANGED(cls, **kwargs):
+        """Product configuration is deterministic; the fingerprint also tracks whether the summary output is connected"""
+        kwargs["summary_mode"] = resolve_summary_mode(cls, kwargs)
+        return input_fingerprint(kwargs)
+    
+    def analyze_product_context(self, prompt, matching=WORD_BOUNDARY, prompt_context=None):
         """Analyze prompt to understand product photography context"""
-        prompt_lower = prompt.lower()
+        hits = PromptContext.for_prompt(prompt, prompt_context).hits(matching)
         
         # Detect product indicators
-        product_keywords = {
-            "electronics": ["phone", "laptop", "camera", "headphones", "gadget", "device"],
-            "fashion": ["clothing", "shirt", "dress", "shoes", "accessories", "fabric"],
-            "beauty": ["makeup", "skincare", "cosmetics", "perfume", "beauty"],
-            "home": ["furniture", "decor", "kitchen", "home", "interior"],
-            "food": ["food", "beverage", "drink", "meal", "snack", "culinary"],
-            "jewelry": ["jewelry", "ring", "necklace", "watch", "precious", "gold"],
-            "sports": ["sports", "fitness", "athletic", "exercise", "gym", "outdoor"],
-            "automotive": ["car", "auto", "vehicle", "motor", "mechanical", "parts"]
-        }
-        
-        detected_category = "general"
-        for category, keywords in product_keywords.items():
-            if any(keyword in prompt_lower for keyword in keywords):
-                detected_category = category
-                break
+        detected_category = first_match(PRODUCT_KEYWORDS, hits, "general")
         
         # Detect commercial intent
-        commercial_keywords = ["product", "commercial", "marketing", "advertising", "sale", "buy", "purchase"]
-        has_commercial_intent = any(keyword in prompt_lower for keyword in commercial_keywords)
+        has_commercial_intent = not hits.isdisjoint(COMMERCIAL_KEYWORDS)
         
         # Detect style preferences
-        style_keywords = {
-            "clean": ["clean", "minimal", "simple", "white"],
-            "lifestyle": ["lifestyle", "natural", "contextual", "in_use"],
-            "dramatic": ["dramatic", "bold", "striking", "hero"],
-            "luxury": ["luxury", "premium", "elegant"]
-        }
-        
-        detected_style = "clean"
-        for style, keywords in style_keywords.items():
-            if any(keyword in prompt_lower for keyword in keywords):
-                detected_style = style
-                break
+        detected_style = first_match(STYLE_KEYWORDS, hits, "clean")
         
         return {
             "product_category": detected_category,
@@ -626,7 +717,7 @@ class FactoryProductPhotographer:
             if bg_requirement != "flexible":
                 tags.append(f"{bg_requirement}_background")
         elif platform != "none":
-            print(f"Warning: Platform '{platform}' not found in platform_specs")
+            logger.warning("Platform '%s' not found in platform_specs", platform)
         
         # Category-specific tags
         category = kwargs.get("product_category", "auto")
@@ -639,7 +730,7 @@ class FactoryProductPhotographer:
             tags.extend(cat_config["focus_points"])
             tags.extend(cat_config["lighting_needs"])
         elif category != "general":
-            print(f"Warning: Product category '{category}' not found in product_categories")
+            logger.warning("Product category '%s' not found in product_categories", category)
         
         # Brand positioning
         brand = kwargs.get("brand_positioning", "auto")
@@ -649,7 +740,7 @@ class FactoryProductPhotographer:
             tags.extend(brand_config["characteristics"])
             tags.append(f"{brand_config['visual_style']}_style")
         elif brand != "auto":
-            print(f"Warning: Brand positioning '{brand}' not found in brand_positioning")
+            logger.warning("Brand positioning '%s' not found in brand_positioning", brand)
         
         # Technical settings
         background = kwargs.get("background_style", "auto")
@@ -670,7 +761,7 @@ class FactoryProductPhotographer:
             comp_config = self.composition_techniques[composition]
             tags.extend(comp_config["tags"])
         elif composition != "auto":
-            print(f"Warning: Composition technique '{composition}' not found in composition_techniques")
+            logger.warning("Composition technique '%s' not found in composition_techniques", composition)
         
         # Frame filling
         frame_fill = kwargs.get("frame_filling", "balanced")
@@ -678,33 +769,15 @@ class FactoryProductPhotographer:
         
         # Quality settings
         quality = kwargs.get("image_quality", "professional")
-        quality_tags = {
-            "standard": ["standard_quality", "basic_commercial"],
-            "high": ["high_quality", "enhanced_detail"],
-            "professional": ["professional_quality", "commercial_grade"],
-            "commercial": ["commercial_quality", "premium_standard"]
-        }
-        tags.extend(quality_tags[quality])
+        tags.extend(self.image_quality_tags[quality])
         
         # Color accuracy
         color_acc = kwargs.get("color_accuracy", "enhanced")
-        color_tags = {
-            "standard": ["standard_color", "basic_accuracy"],
-            "enhanced": ["enhanced_color", "vibrant_accurate"],
-            "true_to_life": ["true_to_life_color", "natural_accurate"],
-            "brand_matched": ["brand_matched_color", "consistent_palette"]
-        }
-        tags.extend(color_tags[color_acc])
+        tags.extend(self.color_accuracy_tags[color_acc])
         
         # Detail level
         detail = kwargs.get("detail_level", "detailed")
-        detail_tags = {
-            "overview": ["overview_shot", "general_view"],
-            "detailed": ["detailed_view", "feature_focus"],
-            "macro": ["macro_detail", "close_up_precision"],
-            "technical": ["technical_detail", "specification_view"]
-        }
-        tags.extend(detail_tags[detail])
+        tags.extend(self.detail_tags[detail])
         
         # Commercial optimization
         if kwargs.get("conversion_optimization", True):
@@ -723,32 +796,115 @@ class FactoryProductPhotographer:
         # Price point indication
         price_point = kwargs.get("price_point_indicator", "auto")
         if price_point != "auto":
-            price_tags = {
-                "budget": ["budget_friendly", "value_focused", "accessible"],
-                "mid_range": ["mid_range", "balanced_value", "mainstream"],
-                "premium": ["premium_product", "high_value", "quality_focused"],
-                "luxury": ["luxury_product", "exclusive", "premium_tier"]
-            }
-            tags.extend(price_tags.get(price_point, []))
+            tags.extend(self.price_point_tags.get(price_point, ()))
         
         return tags
     
     def apply_emphasis(self, tag, emphasis_level):
-        """Apply emphasis brackets based on level"""
-        if emphasis_level == "low":
-            return f"({tag})"
-        elif emphasis_level == "high":
-            return f"(({tag}))"
-        elif emphasis_level == "very_high":
-            return f"((({tag})))"
-        else:  # medium
-            return tag
+        """Apply emphasis brackets or a numeric weight via the shared emphasis engine"""
+        return emphasize(tag, emphasis_level)
     
+    @instrumented
+    @on_demand_summary
+    @memoized_output
+    @metered
     def optimize_product_photography(self, base_prompt, photography_style, product_focus, **kwargs):
         """Main function to optimize product photography"""
+        # Reuse the upstream analysis so only newly appended tags are scanned
+        prompt_context = PromptContext.for_prompt(base_prompt, kwargs.pop("prompt_context", None))
         
         # Analyze product context
-        context = self.analyze_product_context(base_prompt) if kwargs.get("context_awareness", True) else {}
+        matching = kwargs.get("keyword_matching", WORD_BOUNDARY)
+        context = self.analyze_product_context(base_prompt, matching, prompt_context) if kwargs.get("context_awareness", True) else {}
+        lap("analysis")
+        
+        product_tags, product_summary, selections = self.render_product_photography(context, photography_style, product_focus, **kwargs)
+        
+        # Drop duplicate tags and trim to the token budget (earlier tags win)
+        drop_duplicates = kwargs.get("drop_duplicate_tags", False)
+        product_tags, report, token_count = assemble_tags(
+            product_tags, prompt_context.tag_keys() if drop_duplicates else (), prompt_context.token_count(), drop_duplicates, kwargs.get("max_tokens", 0)
+        )
+        lap("tags")
+        product_summary = finish_summary(product_summary, report, kwargs.get("summary_mode", SUMMARY_FULL))
+        lap("report")
+        
+        # Create enhanced prompt
+        enhanced_prompt = join_tags(base_prompt, product_tags)
+        lap("join")
+        
+        # Hand the analysis on to the next node in the chain
+        prompt_context = prompt_context.passed_on(enhanced_prompt, "product", context)
+        
+        # Structured record of what this node chose, for indexing without parsing the summary
+        metadata = metadata_json(stage_metadata("product", selections, context, len(product_tags), token_count)) if kwargs.get(BUILD_METADATA, True) else ""
+        lap("metadata")
+        
+        return (enhanced_prompt, product_summary, prompt_context, token_count, PromptSegments.of(enhanced_prompt), metadata)
+    
+    @instrumented
+    @metered
+    def optimize_product_photography_batch(self, prompts, photography_style, product_focus, prompt_contexts=None, **kwargs):
+        """Optimize a list of prompts with the same settings, rendering tags once per distinct context"""
+        matching = kwargs.get("keyword_matching", WORD_BOUNDARY)
+        context_awareness = kwargs.get("context_awareness", True)
+        drop_duplicates = kwargs.get("drop_duplicate_tags", False)
+        max_tokens = kwargs.get("max_tokens", 0)
+        summary_mode = kwargs.get("summary_mode", SUMMARY_FULL)
+        build_metadata = kwargs.get(BUILD_METADATA, True)
+        # Rendered tags by keyword hits, and by detected context for hits detected alike
+        rendered = {}
+        by_context = {}
+        results = []
+        
+        for index, base_prompt in enumerate(prompts):
+            # Reuse the upstream analysis so only newly appended tags are scanned
+            prompt_context = PromptContext.for_prompt(base_prompt, upstream_context(prompt_contexts, index))
+            
+            # The analyzers only read keyword hits, so prompts with the same hits share the analysis
+            hits = prompt_context.hits(matching) if context_awareness else None
+            entry = rendered.get(hits)
+            if entry is None:
+                # Analyze product context
+                context = self.analyze_product_context(base_prompt, matching, prompt_context) if context_awareness else {}
+                
+                # Settings and context fully determine the product tags
+                key = context_key(context)
+                entry = by_context.get(key)
+                if entry is None:
+                    product_tags, product_summary, selections = self.render_product_photography(context, photography_style, product_focus, **kwargs)
+                    # Interned tags, the frozen context and the serialized record are shared by every prompt with this context
+                    parts = stage_metadata_parts("product", selections, context) if build_metadata else None
+                    entry = by_context[key] = (PreparedTags(product_tags), product_summary, selections, freeze_catalog(context), parts)
+                rendered[hits] = entry
+            product_tags, product_summary, selections, frozen_context, parts = entry
+            lap("analysis")
+            
+            # Drop duplicate tags and trim to the token budget (earlier tags win)
+            product_tags, report, token_count = assemble_tags(
+                product_tags, prompt_context.tag_keys() if drop_duplicates else (), prompt_context.token_count(), drop_duplicates, max_tokens
+            )
+            lap("tags")
+            product_summary = finish_summary(product_summary, report, summary_mode)
+            lap("report")
+            
+            # Create enhanced prompt
+            enhanced_prompt = join_tags(base_prompt, product_tags)
+            lap("join")
+            
+            # Hand the analysis on to the next node in the chain
+            prompt_context = prompt_context.passed_on(enhanced_prompt, "product", frozen_context)
+            
+            # Structured record of what this node chose, for indexing without parsing the summary
+            metadata = stage_metadata_json(parts, len(product_tags), token_count) if build_metadata else ""
+            lap("metadata")
+            
+            results.append((enhanced_prompt, product_summary, prompt_context, token_count, PromptSegments.of(enhanced_prompt), metadata))
+        
+        return results
+    
+    def render_product_photography(self, context, photography_style, product_focus, **kwargs):
+        """Select a photography configuration for a detected context and return (emphasized tags, summary, selections)"""
         
         # Select photography configuration
         photo_config = self.select_configuration_by_style(photography_style, context, **kwargs)
@@ -757,21 +913,31 @@ class FactoryProductPhotographer:
         product_tags = self.generate_product_tags(photo_config, context, **kwargs)
         
         # Add product focus tags
-        focus_tags = {
-            "primary_product": ["single_product_focus", "main_subject", "hero_product"],
-            "product_group": ["product_group", "collection_shot", "family_view"],
-            "lifestyle_context": ["lifestyle_context", "in_use", "natural_setting"],
-            "detail_macro": ["macro_detail", "close_up", "feature_focus"],
-            "comparison_view": ["comparison_shot", "side_by_side", "variant_display"]
-        }
-        product_tags.extend(focus_tags.get(product_focus, []))
+        product_tags.extend(self.product_focus_tags.get(product_focus, ()))
+        lap("selection")
         
         # Apply emphasis
-        emphasis_level = kwargs.get("product_emphasis", "medium")
-        emphasized_tags = [self.apply_emphasis(tag, emphasis_level) for tag in product_tags]
+        emphasis_level = resolve_emphasis(kwargs.get("product_emphasis", "medium"), kwargs.get("product_emphasis_weight", 0.0))
+        emphasized_tags = emphasize_all(product_tags, emphasis_level)
+        lap("emphasis")
         
-        # Create enhanced prompt
-        enhanced_prompt = f"{base_prompt}, {', '.join(emphasized_tags)}"
+        # Selections for the metadata output
+        selections = {
+            "photography_style": photography_style,
+            "focus": product_focus,
+            "configuration": photo_config["description"],
+            "target_platform": kwargs.get("target_platform", "none"),
+            "brand_positioning": kwargs.get("brand_positioning", "auto"),
+            "image_quality": kwargs.get("image_quality", "professional"),
+            "background_style": kwargs.get("background_style", "auto"),
+            "lighting_setup": kwargs.get("lighting_setup", "auto"),
+            "angle_perspective": kwargs.get("angle_perspective", "auto"),
+            "emphasis": emphasis_level,
+        }
+        
+        # Nothing more to build when the summary output is off
+        if kwargs.get("summary_mode", SUMMARY_FULL) == SUMMARY_OFF:
+            return (tuple(emphasized_tags), "", selections)
         
         # Create summary
         summary_parts = [
@@ -796,7 +962,7 @@ class FactoryProductPhotographer:
                 platform_config = self.platform_specs[platform]
                 summary_parts.append(f"• Aspect Ratio: {platform_config['aspect_ratio']}")
             else:
-                print(f"Warning: Platform '{platform}' not found in platform_specs for summary")
+                logger.warning("Platform '%s' not found in platform_specs for summary", platform)
         
         # Brand and quality settings
         brand = kwargs.get("brand_positioning", "auto")
@@ -835,4 +1001,45 @@ class FactoryProductPhotographer:
         
         product_summary = "\n".join(summary_parts)
         
-        return (enhanced_prompt, product_summary)
+        lap("summary")
+        return (tuple(emphasized_tags), product_summary, selections)
+
+
+class FactoryProductPhotographerBatch(FactoryProductPhotographer):
+    """
+    List-input variant of the product photographer. Takes a list of prompts (for example
+    from a batch text loader) and optimizes all of them with the same settings in one call.
+    """
+    
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,) * len(FactoryProductPhotographer.RETURN_TYPES)
+    FUNCTION = "optimize_product_photography_list"
+    
+    def optimize_product_photography_list(self, base_prompt, **kwargs):
+        """Unwrap the single-valued settings and run the batch entry point"""
+        prompt_contexts = kwargs.pop("prompt_context", None)
+        settings = {name: values[0] for name, values in kwargs.items()}
+        settings["summary_mode"] = resolve_summary_mode(type(self), settings)
+        results = self.optimize_product_photography_batch(base_prompt, prompt_contexts=prompt_contexts, **settings)
+        return tuple(list(column) for column in zip(*results)) if results else tuple([] for _ in self.RETURN_TYPES)
+
+
+class FactoryProductPhotographerSegments(FactoryProductPhotographer):
+    """
+    Segment-chain variant of the product photographer. Takes and returns PROMPT_SEGMENTS, so the
+    product tags are appended to the chain without copying the prompt.
+    """
+    
+    segment_slots = segments_slots(FactoryProductPhotographer)
+    RETURN_TYPES = tuple(FactoryProductPhotographer.RETURN_TYPES[slot] for slot in segment_slots)
+    RETURN_NAMES = tuple(FactoryProductPhotographer.RETURN_NAMES[slot] for slot in segment_slots)
+    FUNCTION = "optimize_product_photography_segments"
+    
+    @cached_input_types
+    def INPUT_TYPES(cls):
+        return segments_input_types(FactoryProductPhotographer.INPUT_TYPES())
+    
+    def optimize_product_photography_segments(self, prompt_segments, **kwargs):
+        """Run the node on a segment chain and return the extended chain in place of the prompt"""
+        result = self.optimize_product_photography(PromptSegments.of(prompt_segments), **kwargs)
+        return tuple(result[slot] for slot in self.segment_slots)
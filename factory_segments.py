@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+"""
+Factory Segments - Prompt Segment Chains
+Carries a prompt between nodes as a chain of comma-joined segments, so each node appends its
+tags without copying the prompt and the final string is joined once by the consumer.
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+from .factory_catalog import cached_input_types
+
+# ComfyUI socket type for PromptSegments outputs and inputs
+PROMPT_SEGMENTS = "PROMPT_SEGMENTS"
+
+
+class PromptSegments:
+    """
+    Immutable prompt rope.
+
+    Each instance is one segment plus a link to the chain it extends, so appending
+    shares every earlier segment instead of copying it. The text is the segments
+    joined with ", " exactly like join_tags builds it, and is only built when
+    text() is called (and then kept). Two chains are equal when their segments are.
+    """
+
+    __slots__ = ("parent", "segment", "length", "_text", "_hash")
+
+    def __init__(self, segment="", parent=None):
+        self.parent = parent
+        self.segment = segment
+        if parent is None:
+            self.length = len(segment)
+            self._text = segment
+        else:
+            self.length = parent.length + 2 + len(segment)
+            self._text = None
+        self._hash = None
+
+    @classmethod
+    def of(cls, prompt):
+        """Return prompt as a segment chain (a plain string becomes a single segment)"""
+        if isinstance(prompt, cls):
+            return prompt
+        return cls(prompt)
+
+    def append(self, tags):
+        """Return a chain with tags appended as one segment; an empty tag list returns this chain"""
+        if not tags:
+            return self
+        return PromptSegments(", ".join(tags), self)
+
+    def segments(self):
+        """Return every segment of the chain, oldest first"""
+        segments = []
+        node = self
+        while node is not None:
+            segments.append(node.segment)
+            node = node.parent
+        segments.reverse()
+        return tuple(segments)
+
+    def text(self):
+        """Return the joined prompt (built once)"""
+        if self._text is None:
+            self._text = ", ".join(self.segments())
+        return self._text
+
+    def appended_since(self, prefix):
+        """
+        Return the text this chain appends to prefix (a chain or a string it starts
+        with), or None when prefix is not an earlier state of this chain.
+        """
+        appended = []
+        node = self
+        while node is not None:
+            if node is prefix or (node._text is not None and node._text == prefix):
+                return "".join(f", {segment}" for segment in reversed(appended))
+            appended.append(node.segment)
+            node = node.parent
+        return None
+
+    def __str__(self):
+        return self.text()
+
+    def __len__(self):
+        return self.length
+
+    def __eq__(self, other):
+        if not isinstance(other, PromptSegments):
+            return NotImplemented
+        if self is other:
+            return True
+        return self.length == other.length and hash(self) == hash(other) and self.segments() == other.segments()
+
+    def __hash__(self):
+        # Chained through the parent, so each segment is hashed once per chain
+        if self._hash is None:
+            self._hash = hash((None if self.parent is None else hash(self.parent), self.segment))
+        return self._hash
+
+    def __repr__(self):
+        return f"PromptSegments({list(self.segments())!r})"
+
+
+def segments_input_types(schema):
+    """Return a node schema with its base_prompt input replaced by a prompt_segments input"""
+    required = {"prompt_segments": (PROMPT_SEGMENTS,)}
+    required.update((name, spec) for name, spec in schema["required"].items() if name != "base_prompt")
+    variant = dict(schema)
+    variant["required"] = required
+    return variant
+
+
+def segments_slots(node_class):
+    """Output slots of a node returned by its segment-chain variant: prompt_segments first, then all but the prompt"""
+    segments_slot = node_class.RETURN_NAMES.index("prompt_segments")
+    others = tuple(slot for slot in range(1, len(node_class.RETURN_NAMES)) if slot != segments_slot)
+    return (segments_slot,) + others
+
+
+class FactorySegmentsToPrompt:
+    """
+    Join a prompt segment chain into a plain STRING, for CLIPTextEncode or any
+    other node that takes a prompt. This is the only place the chain is copied.
+    """
+
+    @cached_input_types
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "prompt_segments": (PROMPT_SEGMENTS,),
+            }
+        }
+
+    RETURN_TYPES = ("STRING",)
+    RETURN_NAMES = ("prompt",)
+    FUNCTION = "join_segments"
+    CATEGORY = "Camera Factory Station"
+
+    def join_segments(self, prompt_segments):
+        """Materialize the prompt string"""
+        return (PromptSegments.of(prompt_segments).text(),)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+"""
+Factory Stats - Hot-Path Timing Histograms
+Optional in-process instrumentation of every node entry point and its sub-stages (analysis,
+selection, emphasis, tags, summary, join, metadata): call counts and latency histograms per
+node class, read with <Node>.stats() or dumped as JSON. Off unless enabled, and then the
+entry points and stage laps cost one flag check.
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+# Set to 1 to record timings from startup; enable_stats() switches it at runtime
+STATS_ENV = "CAMERA_FACTORY_STATION_STATS"
+
+# Histogram bucket upper bounds in microseconds (log scale); the last bucket is open-ended
+BUCKET_BOUNDS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000, 500000, 1000000)
+
+_enabled = os.environ.get(STATS_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+_lock = threading.Lock()
+_local = threading.local()
+
+# Node class name -> stage name -> LatencyHistogram
+_registry = {}
+
+
+class LatencyHistogram:
+    """Call count, total, min, max and log-scale bucket counts of one stage's latency"""
+
+    __slots__ = ("count", "total", "minimum", "maximum", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+
+    def record(self, micros):
+        self.count += 1
+        self.total += micros
+        if self.minimum is None or micros < self.minimum:
+            self.minimum = micros
+        if micros > self.maximum:
+            self.maximum = micros
+        self.buckets[bisect_left(BUCKET_BOUNDS, micros)] += 1
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of calls (the max for the open bucket)"""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return min(float(BUCKET_BOUNDS[index]), self.maximum) if index < len(BUCKET_BOUNDS) else self.maximum
+        return self.maximum
+
+    def as_dict(self):
+        """Plain summary in microseconds, with the non-empty buckets keyed by upper bound"""
+        buckets = {}
+        for index, count in enumerate(self.buckets):
+            if count:
+                buckets[f"le_{BUCKET_BOUNDS[index]}" if index < len(BUCKET_BOUNDS) else "inf"] = count
+        return {
+            "count": self.count,
+            "total_us": round(self.total, 3),
+            "mean_us": round(self.total / self.count, 3) if self.count else 0.0,
+            "min_us": round(self.minimum or 0.0, 3),
+            "max_us": round(self.maximum, 3),
+            "p50_us": self.percentile(0.5),
+            "p90_us": self.percentile(0.9),
+            "p99_us": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+def enable_stats(enabled=True):
+    """Switch recording on or off for the whole process"""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def stats_enabled():
+    return _enabled
+
+
+def record(node_name, stage, seconds):
+    """Add one timing to a node's stage histogram"""
+    with _lock:
+        stages = _registry.setdefault(node_name, {})
+        histogram = stages.get(stage)
+        if histogram is None:
+            histogram = stages[stage] = LatencyHistogram()
+        histogram.record(seconds * 1e6)
+
+
+def node_stats(node_name):
+    """Snapshot of one node's stage histograms as plain dicts"""
+    with _lock:
+        return {stage: histogram.as_dict() for stage, histogram in _registry.get(node_name, {}).items()}
+
+
+def all_stats():
+    """Snapshot of every node's stage histograms"""
+    with _lock:
+        return {
+            node_name: {stage: histogram.as_dict() for stage, histogram in stages.items()}
+            for node_name, stages in _registry.items()
+        }
+
+
+def reset_stats():
+    """Drop every recorded timing"""
+    with _lock:
+        _registry.clear()
+
+
+def dump_stats(target):
+    """Write all_stats() as JSON to a path or an open text file"""
+    snapshot = {"enabled": _enabled, "nodes": all_stats()}
+    if hasattr(target, "write"):
+        json.dump(snapshot, target, indent=2, sort_keys=True)
+        return
+    with open(target, "w", encoding="utf-8") as stats_file:
+        json.dump(snapshot, stats_file, indent=2, sort_keys=True)
+
+
+def class_stats(cls):
+    """Class-level stats() of a node: its stage histograms"""
+    return node_stats(cls.__name__)
+
+
+class Stopwatch:
+    """Times consecutive stages of one entry-point call; each lap records the time since the last"""
+
+    __slots__ = ("node_name", "prefix", "last")
+
+    def __init__(self, node_name):
+        self.node_name = node_name
+        self.prefix = ""
+        self.last = time.perf_counter()
+
+    def lap(self, stage):
+        now = time.perf_counter()
+        record(self.node_name, self.prefix + stage, now - self.last)
+        self.last = now
+
+
+def lap(stage):
+    """Record the time since the previous lap of the running entry point under stage"""
+    if _enabled:
+        watch = getattr(_local, "watch", None)
+        if watch is not None:
+            watch.lap(stage)
+
+
+def lap_prefix(prefix):
+    """Prefix the following laps of the running entry point (the pipeline names them per stage)"""
+    if _enabled:
+        watch = getattr(_local, "watch", None)
+        if watch is not None:
+            watch.prefix = prefix
+            watch.last = time.perf_counter()
+
+
+def instrumented(method):
+    """
+    Time a node entry point as its "call" stage and enable lap() inside it.
+    Nested entry points (a variant calling its base node) are timed once, by the outermost.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not _enabled or getattr(_local, "watch", None) is not None:
+            return method(self, *args, **kwargs)
+        watch = _local.watch = Stopwatch(type(self).__name__)
+        start = watch.last
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _local.watch = None
+            record(watch.node_name, "call", time.perf_counter() - start)
+
+    return wrapper
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+"""
+Factory Summary - On-Demand Summary Rendering
+Resolves how much of a node's human-readable summary to build: the full multi-line text,
+a one-line compact form, or nothing when the summary output is switched off or not linked.
+The JSON metadata output is likewise only built when something reads it.
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+import functools
+
+# Summary detail levels offered by every node
+SUMMARY_FULL = "full"
+SUMMARY_COMPACT = "compact"
+SUMMARY_OFF = "off"
+SUMMARY_MODES = (SUMMARY_FULL, SUMMARY_COMPACT, SUMMARY_OFF)
+SUMMARY_MODE_INPUT = (list(SUMMARY_MODES), {"default": SUMMARY_FULL})
+
+# Hidden ComfyUI inputs used to find out whether the summary output is connected
+WORKFLOW_INPUTS = ("prompt", "unique_id")
+
+# Internal setting passed to node entry points when the metadata output is not linked
+BUILD_METADATA = "build_metadata"
+
+
+def _single(value):
+    """Unwrap the one-element lists list-mode nodes receive"""
+    if isinstance(value, list) and len(value) == 1:
+        return value[0]
+    return value
+
+
+def output_linked(workflow, unique_id, slot):
+    """Return whether any node of an API-format workflow reads output slot of node unique_id"""
+    return slot in linked_slots(workflow, unique_id)
+
+
+def linked_slots(workflow, unique_id):
+    """Return the output slots of node unique_id that nodes of an API-format workflow read"""
+    unique_id = str(unique_id)
+    slots = set()
+    for node in workflow.values():
+        for value in node.get("inputs", {}).values():
+            if isinstance(value, list) and len(value) == 2 and str(value[0]) == unique_id:
+                slots.add(value[1])
+    return slots
+
+
+def summary_slot(node_class):
+    """Index of a node's summary output"""
+    for slot, name in enumerate(node_class.RETURN_NAMES):
+        if name.endswith("_summary"):
+            return slot
+    return None
+
+
+def resolve_summary_mode(node_class, inputs):
+    """
+    Remove the hidden workflow inputs from inputs and return the summary mode to render.
+    A summary output that nothing reads is not built; outside ComfyUI (no workflow)
+    the requested mode is used as is. An unread metadata output is switched off by
+    setting BUILD_METADATA to False in inputs.
+    """
+    workflow = _single(inputs.pop("prompt", None))
+    unique_id = _single(inputs.pop("unique_id", None))
+    mode = _single(inputs.get("summary_mode", SUMMARY_FULL))
+    if isinstance(workflow, dict) and unique_id is not None:
+        linked = linked_slots(workflow, unique_id)
+        if "metadata" in node_class.RETURN_NAMES and node_class.RETURN_NAMES.index("metadata") not in linked:
+            inputs[BUILD_METADATA] = False
+        slot = summary_slot(node_class)
+        if slot is not None and slot not in linked:
+            return SUMMARY_OFF
+    return mode
+
+
+def on_demand_summary(method):
+    """Resolve the summary mode and metadata output of a node entry point before it runs (and before memoization)"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        kwargs["summary_mode"] = resolve_summary_mode(type(self), kwargs)
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def compact_summary(summary):
+    """Fold a multi-line summary into one line: the heading, then every bullet separated by |"""
+    lines = [line.strip() for line in summary.split("\n") if line.strip()]
+    if len(lines) <= 1:
+        return summary
+    heading = lines[0].rstrip(":")
+    items = [line.lstrip("• ") for line in lines[1:]]
+    return f"{heading}: {' | '.join(items)}"
+
+
+def finish_summary(summary, report, mode=SUMMARY_FULL):
+    """Append a node's tag report to its rendered summary in the requested mode"""
+    if mode == SUMMARY_OFF:
+        return ""
+    if mode == SUMMARY_COMPACT:
+        return compact_summary(summary + report)
+    return summary + report
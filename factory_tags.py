@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+
+"""
+Factory Tags - Prompt Assembly Helpers
+Ordered tag deduplication, an offline CLIP token estimate and token-budget trimming
+for the final join of every node.
+
+SFW Edition - GitHub Compliant - Professional Grade
+"""
+
+import re
+
+from .factory_keywords import normalize_tag
+from .factory_segments import PromptSegments
+
+# CLIP's pre-tokenizer: contractions, letter runs, single digits and punctuation runs
+_CLIP_PIECES = re.compile(r"'s|'t|'re|'ve|'m|'ll|'d|[^\W\d_]+|\d|(?:[^\s\w]|_)+")
+
+# Emphasis syntax ComfyUI strips before tokenizing: brackets and (tag:1.2) weights
+_EMPHASIS_SYNTAX = re.compile(r":\s*-?\d+(?:\.\d+)?\s*\)|[()]")
+
+# Usable tokens per CLIP window (77 minus the start and end tokens)
+CLIP_CHUNK_TOKENS = 75
+
+# Per-tag token counts and normalized keys, memoized because chains and batches repeat the same tags
+_TAG_TOKENS = {}
+_TAG_KEYS = {}
+_MAX_CACHED_TAGS = 16384
+
+
+def tag_token_count(tag):
+    """
+    Estimate the CLIP tokens of one comma-free tag.
+    Letter runs of up to 10 characters count as one BPE token and longer runs as
+    one more per further 6 characters; digits and punctuation count one each.
+    """
+    count = _TAG_TOKENS.get(tag)
+    if count is None:
+        count = 0
+        for piece in _CLIP_PIECES.findall(_EMPHASIS_SYNTAX.sub(" ", tag.lower())):
+            if piece[0].isalpha():
+                count += 1 + max(0, len(piece) - 5) // 6
+            else:
+                count += len(piece)
+        if len(_TAG_TOKENS) >= _MAX_CACHED_TAGS:
+            _TAG_TOKENS.clear()
+        _TAG_TOKENS[tag] = count
+    return count
+
+
+def tag_key(tag):
+    """Normalized key of one prompt tag, as used for duplicate detection"""
+    key = _TAG_KEYS.get(tag)
+    if key is None:
+        key = normalize_tag(tag)
+        if len(_TAG_KEYS) >= _MAX_CACHED_TAGS:
+            _TAG_KEYS.clear()
+        _TAG_KEYS[tag] = key
+    return key
+
+
+def estimate_tokens(text):
+    """
+    Offline estimate of the CLIP tokens of a prompt.
+    The estimate is additive over comma-separated tags (each comma is one token),
+    so appending ", tags" to a prompt adds exactly the estimate of the new tags.
+    """
+    tags = text.split(",")
+    tokens = len(tags) - 1
+    for tag in tags:
+        count = _TAG_TOKENS.get(tag)
+        tokens += tag_token_count(tag) if count is None else count
+    return tokens
+
+
+def clip_chunks(tokens):
+    """Number of 77-token CLIP windows needed for a token count"""
+    return max(1, -(-tokens // CLIP_CHUNK_TOKENS))
+
+
+def prompt_tag_keys(prompt):
+    """Return the normalized keys of every tag in a prompt"""
+    return frozenset(key for key in map(tag_key, prompt.split(",")) if key)
+
+
+def dedupe_tags(tags, seen_keys=frozenset()):
+    """
+    Drop tags whose normalized form already appeared, keeping the first occurrence.
+    Earlier tags have priority: anything already in seen_keys (the incoming prompt)
+    wins over a node's tags, and a node's earlier tags win over its later ones.
+    Returns (kept tags, dropped tags).
+    """
+    seen = set(seen_keys)
+    kept = []
+    dropped = []
+    for tag in tags:
+        key = tag_key(tag)
+        if key in seen:
+            dropped.append(tag)
+        else:
+            if key:
+                seen.add(key)
+            kept.append(tag)
+    return kept, dropped
+
+
+def tokens_saved(dropped):
+    """Estimated CLIP tokens saved by dropping tags, including each tag's comma"""
+    return sum(tag_token_count(tag) + 1 for tag in dropped)
+
+
+def dedupe_report(dropped):
+    """Summary line describing dropped duplicates, or an empty string when none were dropped"""
+    if not dropped:
+        return ""
+    return f"\n• Duplicates Dropped: {len(dropped)} (~{tokens_saved(dropped)} tokens saved)"
+
+
+def trim_tags(tags, used_tokens, max_tokens):
+    """
+    Keep the leading tags that fit in max_tokens on top of used_tokens.
+    A node emits its tags in priority order, so everything from the first tag
+    that does not fit is dropped. Returns (kept tags, trimmed tags).
+    """
+    kept = []
+    for tag in tags:
+        used_tokens += tag_token_count(tag) + 1
+        if used_tokens > max_tokens:
+            break
+        kept.append(tag)
+    return kept, list(tags[len(kept):])
+
+
+class PreparedTags:
+    """
+    A node's rendered tags, prepared once for appending to many prompts.
+    Batches render tags once per detected context and assemble them onto every prompt
+    with that context; the token estimate of the tags is worked out here, and their keys
+    and the duplicates among them on the first prompt that drops duplicates, so a prompt
+    sharing no key with the tags skips the deduplication pass.
+    """
+
+    __slots__ = ("tags", "tokens", "_keys", "_deduped")
+
+    def __init__(self, tags):
+        self.tags = tags
+        self.tokens = sum(tag_token_count(tag) + 1 for tag in tags)
+        self._keys = None
+        self._deduped = None
+
+    def deduped(self, prompt_keys):
+        """(kept, dropped) tags after dropping duplicates of each other and of prompt_keys"""
+        if self._keys is None:
+            self._keys = frozenset(key for key in map(tag_key, self.tags) if key)
+        if not self._keys.isdisjoint(prompt_keys):
+            return dedupe_tags(self.tags, prompt_keys)
+        if self._deduped is None:
+            self._deduped = dedupe_tags(self.tags)
+        return self._deduped
+
+
+def assemble_tags(tags, prompt_keys, prompt_tokens, drop_duplicates=False, max_tokens=0):
+    """
+    Prepare a node's tags (a list or PreparedTags) for appending to a prompt.
+    Optionally drops tags the prompt already carries (prompt_keys is only read then),
+    then trims to max_tokens (0 = no limit).
+    Returns (kept tags, summary report lines, token estimate of the joined prompt).
+    """
+    prepared = tags if isinstance(tags, PreparedTags) else None
+    if prepared is not None:
+        tags = prepared.tags
+    report = ""
+    if drop_duplicates:
+        tags, dropped = dedupe_tags(tags, prompt_keys) if prepared is None else prepared.deduped(prompt_keys)
+        report += dedupe_report(dropped)
+    if max_tokens:
+        tags, trimmed = trim_tags(tags, prompt_tokens, max_tokens)
+        if trimmed:
+            chunks = clip_chunks(max_tokens)
+            report += f"\n• Trimmed: {len(trimmed)} tags to fit {max_tokens} tokens ({chunks} CLIP chunk{'s' if chunks != 1 else ''})"
+    if prepared is not None and tags is prepared.tags:
+        return tags, report, prompt_tokens + prepared.tokens
+    token_count = prompt_tokens + sum(tag_token_count(tag) + 1 for tag in tags)
+    return tags, report, token_count
+
+
+def join_tags(prompt, tags):
+    """
+    Append tags to a prompt the way every node does; an empty tag list leaves it unchanged.
+    A PromptSegments prompt gets the tags as a new segment instead of being copied.
+    """
+    if not tags:
+        return prompt
+    if isinstance(prompt, PromptSegments):
+        return prompt.append(tags)
+    return f"{prompt}, {', '.join(tags)}"
@@ -0,0 +1,30 @@
+"""
+Shared fixtures for the Camera Factory Station tests.
+The tests live inside the node pack, so they import it by its folder name.
+"""
+
+import contextlib
+import importlib
+import io
+import os
+import sys
+
+import pytest
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_NAME = os.path.basename(PACKAGE_DIR)
+
+
+@pytest.fixture(scope="session")
+def station():
+    """The node pack imported as a package, with its startup banner hidden"""
+    parent = os.path.dirname(PACKAGE_DIR)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return importlib.import_module(PACKAGE_NAME)
+
+
+@pytest.fixture(scope="session")
+def package_dir():
+    return PACKAGE_DIR
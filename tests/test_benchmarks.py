@@ -0,0 +1,51 @@
+"""Tests for the release benchmark suite's metrics and comparison (not its timings)"""
+
+import importlib
+import os
+import sys
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def suite(package_dir):
+    """benchmarks/run_suite.py imported as a module"""
+    benchmarks = os.path.join(package_dir, "benchmarks")
+    sys.path.insert(0, benchmarks)
+    try:
+        yield importlib.import_module("run_suite")
+    finally:
+        sys.path.remove(benchmarks)
+
+
+def test_option_sets_are_the_same_on_every_run(station, suite):
+    for name in station.NODE_CLASS_MAPPINGS:
+        node_class = station.NODE_CLASS_MAPPINGS[name]
+        sets = suite.option_sets(node_class, 3)
+        assert sets == suite.option_sets(node_class, 3)
+        assert [label for label, _ in sets] == ["defaults", "random1", "random2", "random3"]
+        choices = {
+            input_name: spec[0] for section in node_class.INPUT_TYPES().values()
+            for input_name, spec in section.items() if isinstance(spec, tuple) and isinstance(spec[0], list)
+        }
+        for _, settings in sets:
+            assert all(settings[input_name] in options for input_name, options in choices.items() if input_name in settings)
+
+
+def test_fresh_interpreter_probe_times_every_node(station, suite):
+    timings = suite.probe("input_types", 1)
+    assert set(timings) == set(station.NODE_CLASS_MAPPINGS) | {"package"}
+    assert all(value >= 0 for value in timings.values())
+
+
+def test_compare_reports_the_change_against_a_previous_run(suite, capsys):
+    metrics = {
+        "call.FactoryCameraOperator.defaults": {"value": 30.0, "unit": "us"},
+        "chain.pipeline": {"value": 5000.0, "unit": "prompts/s"},
+    }
+    previous = {"call.FactoryCameraOperator.defaults": {"value": 40.0, "unit": "us"}}
+    suite.compare(metrics, previous)
+    camera, pipeline = capsys.readouterr().out.splitlines()
+    assert camera.split()[:3] == ["call.FactoryCameraOperator.defaults", "30.00", "us"]
+    assert camera.endswith("was        40.00  ( -25.0%)")
+    assert "was" not in pipeline
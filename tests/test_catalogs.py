@@ -0,0 +1,116 @@
+"""Tests that node catalogs are built once, shared by every node instance and never modified"""
+
+import logging
+import sys
+from types import MappingProxyType
+
+import pytest
+
+PROMPTS = [
+    "portrait of a woman at sunset, golden hour",
+    "red sneaker on white background, studio",
+    "gold necklace, jewelry, luxury, dramatic",
+    "ceramic vase by the window, morning light, minimalist",
+]
+
+
+def node_catalogs(node_class):
+    """The read-only catalogs of a node's module, by name"""
+    module = sys.modules[node_class.__module__]
+    return {
+        name: value for name, value in vars(module).items()
+        if name.isupper() and isinstance(value, MappingProxyType)
+    }
+
+
+def plain(value):
+    """Deep plain copy of a frozen catalog, for comparing its contents"""
+    if isinstance(value, MappingProxyType):
+        return {key: plain(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [plain(item) for item in value]
+    return value
+
+
+def stage_classes(station):
+    return [node_class for _, node_class, _ in station.factory_pipeline.PIPELINE_STAGES]
+
+
+def test_every_node_has_catalogs(station):
+    for node_class in stage_classes(station):
+        assert node_catalogs(node_class), node_class.__name__
+
+
+@pytest.mark.parametrize("index", range(5))
+def test_instances_share_catalogs(station, index):
+    node_class = stage_classes(station)[index]
+    first, second = node_class(), node_class()
+    assert first.INPUT_TYPES() is second.INPUT_TYPES()
+    assert not vars(first) and not vars(second)
+    for name, catalog in node_catalogs(node_class).items():
+        assert getattr(sys.modules[type(first).__module__], name) is catalog
+
+
+@pytest.mark.parametrize("index", range(5))
+def test_running_a_node_leaves_its_catalogs_unchanged(station, index):
+    node_class = stage_classes(station)[index]
+    catalogs = node_catalogs(node_class)
+    before = {name: plain(catalog) for name, catalog in catalogs.items()}
+
+    required = list(node_class.INPUT_TYPES()["required"].items())[1:]
+    node = node_class()
+    entry = getattr(node, node_class.FUNCTION)
+    # Every option of the first choice input, the rest at their defaults
+    name, spec = next((name, spec) for name, spec in required if isinstance(spec[0], list))
+    defaults = {
+        other: other_spec[1].get("default", other_spec[0][0]) if len(other_spec) > 1 else other_spec[0][0]
+        for other, other_spec in required
+    }
+    for option in spec[0]:
+        for prompt in PROMPTS:
+            entry(prompt, **dict(defaults, **{name: option}))
+    getattr(node, node_class.FUNCTION + "_batch")(PROMPTS, **defaults)
+
+    assert node_catalogs(node_class) == catalogs
+    for name, catalog in catalogs.items():
+        assert plain(catalog) == before[name], name
+
+
+def test_unreadable_shared_catalog_is_logged(station, tmp_path, monkeypatch, capsys, caplog):
+    catalog = station.factory_catalog
+    shared = tmp_path / "catalog_shared.bin"
+    shared.write_bytes(b"not a shared catalog")
+    monkeypatch.setenv(catalog.SHARED_ENV, str(shared))
+    with caplog.at_level(logging.WARNING):
+        assert catalog._map_shared_catalog() == {}
+    assert capsys.readouterr().out == ""
+    assert str(shared) in caplog.text
+
+
+def schema_copy(value):
+    """Deep copy of an INPUT_TYPES schema, for comparing its contents"""
+    if isinstance(value, dict):
+        return {key: schema_copy(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(schema_copy(item) for item in value)
+    return value
+
+
+def test_cached_input_types_is_built_once_and_never_changes(station):
+    node_classes = list(station.NODE_CLASS_MAPPINGS.values())
+    schemas = {node_class: node_class.INPUT_TYPES() for node_class in node_classes}
+    before = {node_class: schema_copy(schema) for node_class, schema in schemas.items()}
+
+    # Everything that reads the schemas: the pipeline and segment variants, the CLI, node calls
+    station.factory_pipeline.stage_input_names.cache_clear()
+    station.factory_pipeline.stage_input_names()
+    station.factory_cli.load_chain([{"type": name} for name in station.NODE_CLASS_MAPPINGS])
+    for node_class in stage_classes(station):
+        settings = [spec[0][0] for _, spec in list(node_class.INPUT_TYPES()["required"].items())[1:]]
+        getattr(node_class(), node_class.FUNCTION)(PROMPTS[0], *settings)
+        node_class.IS_CHANGED(base_prompt=PROMPTS[0])
+
+    for node_class, schema in schemas.items():
+        assert node_class.INPUT_TYPES() is schema
+        assert node_class().INPUT_TYPES() is schema
+        assert schema_copy(schema) == before[node_class], node_class.__name__
@@ -0,0 +1,53 @@
+"""Tests for the headless CLI's mapping of saved workflows onto node inputs"""
+
+import json
+import logging
+import os
+
+
+def load_workflow(package_dir, name):
+    with open(os.path.join(package_dir, name), encoding="utf-8") as workflow_file:
+        return json.load(workflow_file)
+
+
+def test_product_workflow_resolves_without_warnings(station, package_dir, caplog):
+    with caplog.at_level(logging.WARNING):
+        chain = station.factory_cli.load_chain(load_workflow(package_dir, "product_workflow.json"))
+    assert caplog.records == []
+
+    settings = dict((node_class.__name__, node_settings) for node_class, node_settings in chain)
+    camera = settings["FactoryCameraOperator"]
+    assert camera["photography_style"] == "commercial"
+    assert camera["shot_type"] == "commercial_shot"
+    assert camera["camera_emphasis"] == "very_high"
+    assert settings["FactorySizeOptimizer"]["size_preset"] == "amazon_main"
+
+
+def test_leading_prompt_value_is_consumed(station):
+    cli = station.factory_cli
+    camera = station.FactoryCameraOperator
+    with_prompt = cli.widget_settings(camera, ["a red sneaker", "portrait", "close_up", "high_end"])
+    without_prompt = cli.widget_settings(camera, ["portrait", "close_up", "high_end"])
+    assert with_prompt == without_prompt
+    assert with_prompt["shot_type"] == "close_up"
+
+
+def test_seed_control_value_is_skipped(station):
+    cli = station.factory_cli
+    camera = station.FactoryCameraOperator
+    names = [name for name, _ in cli.widget_inputs(camera)]
+    values = [None] * names.index("seed") + [7, "randomize", "low"]
+    settings = cli.widget_settings(camera, values)
+    assert settings["seed"] == 7
+    assert settings[names[names.index("seed") + 1]] == "low"
+
+
+def test_config_problems_are_logged_not_printed(station, capsys, caplog):
+    cli = station.factory_cli
+    entry = {"type": "FactorySizeOptimizer", "inputs": {"size_preset": "bogus_preset", "no_such_input": 1}}
+    with caplog.at_level(logging.WARNING, logger=cli.__name__):
+        (node_class, settings), = cli.load_chain([entry])
+    assert capsys.readouterr().err == ""
+    assert settings["size_preset"] == node_class.INPUT_TYPES()["required"]["size_preset"][1]["default"]
+    assert "Invalid value 'bogus_preset' for FactorySizeOptimizer.size_preset" in caplog.text
+    assert "Unknown input 'no_such_input' for FactorySizeOptimizer ignored" in caplog.text
@@ -0,0 +1,77 @@
+"""Tests for the PromptContext passed between chained nodes"""
+
+
+def test_hits_rescanned_after_late_keyword_registration(station):
+    PromptContext = station.factory_context.PromptContext
+    first = PromptContext("studio photo, zorblax glow")
+    second = PromptContext("studio photo, zorblax glow")
+    assert "zorblax" not in first.hits()
+    assert "zorblax" not in second.hits()
+
+    # A node module imported after the contexts were built registers its keywords
+    station.factory_keywords.keyword_table({"late_table": ["zorblax"]})
+
+    assert "zorblax" in first.hits()
+    assert "zorblax" in second.extended("studio photo, zorblax glow, soft light").hits()
+
+
+def test_extended_context_matches_a_fresh_scan(station):
+    PromptContext = station.factory_context.PromptContext
+    context = PromptContext("portrait of a woman")
+    context.hits()
+    extended = context.extended("portrait of a woman, golden hour, sunset")
+    assert extended.hits() == PromptContext("portrait of a woman, golden hour, sunset").hits()
+
+
+def test_extended_keys_and_tokens_match_a_fresh_context(station):
+    PromptContext = station.factory_context.PromptContext
+    context = PromptContext("portrait, (soft light:1.2)")
+    context.tag_keys()
+    context.token_count()
+    first = context.extended("portrait, (soft light:1.2), Golden_Hour")
+    second = first.extended("portrait, (soft light:1.2), Golden_Hour, 85mm lens")
+    fresh = PromptContext("portrait, (soft light:1.2), Golden_Hour, 85mm lens")
+    assert second.tag_keys() == fresh.tag_keys() == {"portrait", "soft light", "golden hour", "85mm lens"}
+    assert second.token_count() == fresh.token_count()
+
+
+def test_cached_outputs_keep_the_upstream_analyses(station):
+    PromptContext = station.factory_context.PromptContext
+    node = station.FactoryLightingStudio()
+    prompt = "portrait of a woman, golden hour"
+    outputs = {}
+    for name in ("sunset", "night"):
+        upstream = PromptContext(prompt).with_analysis("camera", {"time_context": name})
+        outputs[name] = node.design_lighting(prompt, "mood_atmospheric", "moderate", prompt_context=upstream)
+    context_slot = type(node).RETURN_NAMES.index("prompt_context")
+    assert outputs["sunset"][context_slot].analyses["camera"]["time_context"] == "sunset"
+    assert outputs["night"][context_slot].analyses["camera"]["time_context"] == "night"
+
+    # The same analyses in another context object are still a cache hit
+    again = PromptContext(prompt).with_analysis("camera", {"time_context": "night"})
+    assert node.design_lighting(prompt, "mood_atmospheric", "moderate", prompt_context=again) is outputs["night"]
+
+
+def test_unlinked_node_reads_the_upstream_analysis(station, monkeypatch):
+    camera, lighting = station.FactoryCameraOperator(), station.FactoryLightingStudio()
+    context_module = station.factory_context
+    enhanced = camera.enhance_with_camera("portrait of a woman at sunset", "professional", "close_up", "professional", seed=11)[0]
+
+    scanned = []
+    scan = context_module.PROMPT_KEYWORDS.scan
+    monkeypatch.setattr(context_module.PROMPT_KEYWORDS, "scan", lambda text, *args: scanned.append(text) or scan(text, *args))
+    # Only the lighting tags are scanned, for the context handed on
+    reused = lighting.design_lighting(enhanced, "mood_atmospheric", "moderate", seed=11)
+    context_slot = type(lighting).RETURN_NAMES.index("prompt_context")
+    reused[context_slot].hits()
+    assert enhanced not in scanned
+
+    # Without the camera output to read from, the node rescans and gets the same result
+    monkeypatch.setattr(context_module, "_PUBLISHED", type(context_module._PUBLISHED)())
+    lighting.output_cache.clear()
+    fresh = lighting.design_lighting(enhanced, "mood_atmospheric", "moderate", seed=11)
+    assert enhanced in scanned
+    assert fresh[:2] == reused[:2]
+    assert fresh[context_slot].hits() == reused[context_slot].hits()
+    assert fresh[context_slot].token_count() == reused[context_slot].token_count()
+    assert not reused[context_slot].analyses.keys() - {"lighting"}
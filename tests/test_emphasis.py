@@ -0,0 +1,57 @@
+"""Tests for the shared memoized emphasis engine"""
+
+import pytest
+
+TAGS = ["85mm_portrait", "soft light", "f1.4", "golden_hour"]
+
+
+@pytest.mark.parametrize("emphasis, expected", [
+    ("none", "{}"),
+    ("low", "({})"),
+    ("medium", "{}"),
+    ("high", "(({}))"),
+    ("very_high", "((({})))"),
+    ("maximum", "(((({}))))"),
+    ("unknown_level", "{}"),
+    (1.0, "{}"),
+    (1.3, "({}:1.3)"),
+    (0.85, "({}:0.85)"),
+    (2, "({}:2)"),
+])
+def test_emphasis_is_the_same_computed_and_memoized(station, emphasis, expected):
+    engine = station.factory_emphasis.EmphasisEngine()
+    rendered = [expected.format(tag) for tag in TAGS]
+    first = engine.emphasize_all(TAGS, emphasis)
+    assert first == rendered
+    # Served from the table: equal and the very same string objects
+    again = engine.emphasize_all(TAGS, emphasis)
+    assert again == rendered
+    assert all(cached is original for cached, original in zip(again, first))
+    assert [engine.emphasize(tag, emphasis) for tag in TAGS] == rendered
+
+
+def test_full_table_is_cleared_and_still_renders(station):
+    engine = station.factory_emphasis.EmphasisEngine()
+    engine.max_cached_tags = 3
+    for _ in range(3):
+        assert engine.emphasize_all(TAGS, "high") == [f"(({tag}))" for tag in TAGS]
+    assert len(engine._tables["high"]) <= engine.max_cached_tags
+
+
+def test_weight_takes_over_from_the_level(station):
+    emphasis = station.factory_emphasis
+    assert emphasis.resolve_emphasis("high") == "high"
+    assert emphasis.resolve_emphasis("high", 0.0) == "high"
+    assert emphasis.resolve_emphasis("high", 1.2500001) == 1.25
+    assert emphasis.emphasize("soft light", emphasis.resolve_emphasis("low", 1.25)) == "(soft light:1.25)"
+
+
+@pytest.mark.parametrize("level", ["none", "low", "medium", "high", "very_high", "maximum"])
+def test_nodes_apply_the_shared_engine(station, level):
+    node = station.FactoryCameraOperator()
+    settings = ("portrait of a woman", "professional", "close_up", "professional")
+    plain = node.enhance_with_camera(*settings, camera_emphasis="medium")[0]
+    emphasized = node.enhance_with_camera(*settings, camera_emphasis=level)[0]
+    tags = plain[len(settings[0]) + 2:].split(", ")
+    expected = station.factory_emphasis.emphasize_all(tags, level)
+    assert emphasized == ", ".join([settings[0]] + expected)
@@ -0,0 +1,77 @@
+"""Tests for the shared single-pass keyword matcher"""
+
+import random
+
+import pytest
+
+PROMPTS = [
+    "portrait of a woman at sunset, golden hour, (soft light:1.2)",
+    "Red SPORTS car in the CITY at night, neon, rain",
+    "1girl, scarf, cardigan, early morning, mist, close_up",
+    "luxury perfume bottle on marble, elegant, goldenhour, backlighting",
+    "car,scar,carpet,,oscar   ",
+    "",
+]
+
+
+def all_keywords(station):
+    """The keywords of every analyzer, registered once each node module is loaded"""
+    for name in station.NODE_CLASS_MAPPINGS:
+        station.NODE_CLASS_MAPPINGS[name]
+    return station.factory_keywords.PROMPT_KEYWORDS.keywords
+
+
+def substring_hits(keywords, text):
+    """The per-keyword `keyword in prompt_lower` scan the analyzers used before the matcher"""
+    text = text.lower()
+    return frozenset(keyword for keyword in keywords if keyword in text)
+
+
+@pytest.mark.parametrize("prompt", PROMPTS)
+def test_substring_mode_matches_the_per_keyword_scan(station, prompt):
+    keywords = all_keywords(station)
+    matcher = station.factory_keywords.KeywordMatcher(keywords)
+    assert matcher.scan(prompt, station.factory_keywords.SUBSTRING) == substring_hits(keywords, prompt)
+
+
+def test_substring_mode_finds_overlapping_and_nested_keywords(station):
+    keywords_module = station.factory_keywords
+    keywords = ["light", "lighting", "ligh", "ght", "sun", "sunset", "set", "un", "golden hour", "hour"]
+    matcher = keywords_module.KeywordMatcher(keywords)
+    rng = random.Random(3)
+    alphabet = ["light", "ing", "sun", "set", "golden", " ", "hour", ",", "g", "h", "t", "u", "n"]
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randrange(12)))
+        assert matcher.scan(text, keywords_module.SUBSTRING) == substring_hits(keywords, text), text
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("scar", set()),
+    ("red car", {"car"}),
+    ("Car_Interior", {"car"}),
+    ("(car:1.3)", {"car"}),
+    ("lighting", set()),
+    ("soft light", {"light", "soft light"}),
+    ("soft  LIGHT", {"light", "soft light"}),
+    ("soft_light", {"light", "soft light"}),
+    ("soft, light", {"light"}),
+    ("light soft", {"light"}),
+    ("at golden hour", {"golden hour"}),
+    ("goldenhour", set()),
+    ("golden hours", set()),
+])
+def test_word_boundary_mode_matches_whole_words_within_one_tag(station, text, expected):
+    matcher = station.factory_keywords.KeywordMatcher(["car", "light", "soft light", "golden hour"])
+    assert matcher.scan(text) == expected
+    assert matcher.scan(text, station.factory_keywords.WORD_BOUNDARY) == expected
+
+
+def test_word_boundary_mode_on_the_analyzer_keywords(station):
+    keywords_module = station.factory_keywords
+    hits = keywords_module.PROMPT_KEYWORDS.scan
+    all_keywords(station)
+    assert "car" not in hits("oscar night, scar")
+    assert "car" in hits("red sports car")
+    assert "golden hour" in hits("portrait at golden_hour")
+    assert "golden hour" not in hits("golden, hour")
+    assert "car" in hits("oscar night, scar", keywords_module.SUBSTRING)
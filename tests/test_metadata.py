@@ -0,0 +1,59 @@
+"""Tests for the JSON metadata output of the nodes"""
+
+import json
+from types import MappingProxyType
+
+import pytest
+
+
+def stage_nodes(station):
+    return [(name, node_class) for name, node_class, _ in station.factory_pipeline.PIPELINE_STAGES]
+
+
+def default_settings(node_class):
+    """The required choice inputs of a node at their first option"""
+    return [spec[0][0] for name, spec in list(node_class.INPUT_TYPES()["required"].items())[1:]]
+
+
+def api_workflow(unique_id, slot):
+    """API-format workflow in which one node reads output slot of node unique_id"""
+    return {unique_id: {"inputs": {}}, "99": {"inputs": {"text": [unique_id, slot]}}}
+
+
+@pytest.mark.parametrize("record", [
+    ("camera", {"shot_type": "close_up", "seed": 3}, {"mood": "calm", "colors": ["red", "teal"]}, 4, 17),
+    ("color", {}, {}, 0, 0),
+    ("lighting", {"setup": "café \"neon\""}, MappingProxyType({"tags": frozenset({"b", "a"})}), 12, 250),
+])
+def test_assembled_record_matches_a_full_serialization(station, record):
+    metadata = station.factory_metadata
+    stage, selections, detected, tag_count, token_count = record
+    parts = metadata.stage_metadata_parts(stage, selections, detected)
+    assembled = metadata.stage_metadata_json(parts, tag_count, token_count)
+    assert assembled == metadata.metadata_json(metadata.stage_metadata(*record))
+    assert json.loads(assembled)["token_count"] == token_count
+
+
+@pytest.mark.parametrize("index", range(5))
+def test_metadata_is_empty_unlinked_and_valid_json_linked(station, index):
+    stage, node_class = stage_nodes(station)[index]
+    node = node_class()
+    entry = getattr(node, node_class.FUNCTION)
+    settings = default_settings(node_class)
+    metadata_slot = node_class.RETURN_NAMES.index("metadata")
+    token_slot = node_class.RETURN_NAMES.index("token_count")
+
+    for prompt in ("portrait of a woman at sunset", "red sneaker on white background"):
+        unlinked = entry(prompt, *settings, prompt=api_workflow("7", 0), unique_id="7")
+        linked = entry(prompt, *settings, prompt=api_workflow("7", metadata_slot), unique_id="7")
+        assert unlinked[metadata_slot] == ""
+
+        record = json.loads(linked[metadata_slot])
+        assert record["stage"] == stage
+        assert record["token_count"] == linked[token_slot]
+        assert record["tag_count"] == len(linked[0].split(", ")) - len(prompt.split(", "))
+
+    # A batch shares the serialized selections between prompts but not the counts
+    batch = getattr(node, node_class.FUNCTION + "_batch")(["portrait", "portrait, studio, white background"], *settings)
+    first, second = (json.loads(result[metadata_slot]) for result in batch)
+    assert first["token_count"] != second["token_count"]
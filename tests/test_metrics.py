@@ -0,0 +1,81 @@
+"""Tests for the Prometheus metrics export"""
+
+import os
+import subprocess
+import sys
+import textwrap
+import urllib.request
+
+import pytest
+
+
+def test_scraping_does_not_import_node_modules(package_dir):
+    # A fresh interpreter, since the other tests import every node module
+    script = textwrap.dedent(f"""
+        import importlib, sys
+        sys.path.insert(0, {os.path.dirname(package_dir)!r})
+        station = importlib.import_module({os.path.basename(package_dir)!r})
+        station.FactorySizeOptimizer().optimize_sizing("red sneaker", "auto", "balanced")
+        text = station.factory_metrics.render_metrics()
+        print(sorted(name for name in sys.modules if name.startswith(station.__name__ + ".factory_")))
+        print("FactorySizeOptimizer" in text)
+    """)
+    env = dict(os.environ, CAMERA_FACTORY_STATION_QUIET="1")
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True)
+    modules, size_reported = result.stdout.splitlines()
+    assert "factory_camera_operator" not in modules
+    assert "factory_pipeline" not in modules
+    assert size_reported == "True"
+
+
+@pytest.fixture
+def metrics(station):
+    """The metrics module with recording on and no samples, switched off again afterwards"""
+    module = station.factory_metrics
+    module.reset_metrics()
+    module.enable_metrics(True)
+    yield module
+    module.enable_metrics(False)
+    module.reset_metrics()
+
+
+def test_unlinked_metadata_does_not_break_metrics(station, metrics):
+    node = station.FactoryCameraOperator()
+    metadata_slot = type(node).RETURN_NAMES.index("metadata")
+    workflow = {"5": {"inputs": {}}, "6": {"inputs": {"text": ["5", 0]}}}
+    result = node.enhance_with_camera("portrait of a woman", "professional", "close_up", "professional", prompt=workflow, unique_id="5")
+    assert result[metadata_slot] == ""
+
+    tags = len(result[0].split(", ")) - 1
+    text = metrics.render_metrics()
+    assert 'camera_factory_tags_added_count{node="FactoryCameraOperator"} 1' in text
+    assert f'camera_factory_tags_added_sum{{node="FactoryCameraOperator"}} {tags}' in text
+
+
+def test_tags_added_counts_appended_segments(station, metrics):
+    PromptSegments = station.factory_segments.PromptSegments
+    chain = PromptSegments("portrait, soft light")
+    assert metrics.tags_added(chain, chain.append(["85mm", "(bokeh:1.2)"]).append(["film grain"])) == 3
+    assert metrics.tags_added("portrait, soft light", "portrait, soft light, 85mm, bokeh") == 2
+    assert metrics.tags_added(chain, chain) == 0
+
+
+def test_metrics_endpoint_serves_node_samples(station, metrics):
+    server = metrics.start_metrics_server(0)
+    try:
+        station.FactorySizeOptimizer().optimize_sizing("red sneaker, shot 42", "instagram_square", "quality")
+        host, port = server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            content_type = response.headers["Content-Type"]
+            body = response.read().decode("utf-8")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert content_type == metrics.CONTENT_TYPE
+    assert 'camera_factory_node_calls_total{node="FactorySizeOptimizer"} 1' in body
+    assert 'camera_factory_node_prompts_total{node="FactorySizeOptimizer"} 1' in body
+    assert 'camera_factory_option_selections_total{node="FactorySizeOptimizer",option="size_preset",value="instagram_square"} 1' in body
+    assert "# TYPE camera_factory_tags_added histogram" in body
+    assert 'camera_factory_tags_added_bucket{node="FactorySizeOptimizer",le="+Inf"} 1' in body
+    assert 'camera_factory_prompt_length_chars_count{node="FactorySizeOptimizer",direction="out"} 1' in body
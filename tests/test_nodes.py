@@ -0,0 +1,108 @@
+"""Tests for behaviour shared by every Camera Factory Station node"""
+
+import logging
+
+import pytest
+
+
+def test_warnings_go_to_the_log_not_stdout(station, capsys, caplog):
+    node = station.FactorySizeOptimizer()
+    with caplog.at_level(logging.WARNING):
+        node.optimize_sizing("red sneaker", "bogus_preset", "balanced", quality_preset="bogus_quality")
+    assert capsys.readouterr().out == ""
+    assert "bogus_preset" in caplog.text
+
+
+def api_workflow(unique_id, slot):
+    """API-format workflow in which one node reads output slot of node unique_id"""
+    return {unique_id: {"inputs": {}}, "99": {"inputs": {"text": [unique_id, slot]}}}
+
+
+def test_metadata_built_only_when_linked(station):
+    node_class = station.FactoryCameraOperator
+    node = node_class()
+    metadata_slot = node_class.RETURN_NAMES.index("metadata")
+    summary_slot = node_class.RETURN_NAMES.index("camera_summary")
+
+    unlinked = node.enhance_with_camera(
+        "portrait", "auto", "auto", "professional", prompt=api_workflow("1", summary_slot), unique_id="1",
+    )
+    linked = node.enhance_with_camera(
+        "portrait", "auto", "auto", "professional", prompt=api_workflow("1", metadata_slot), unique_id="1",
+    )
+    direct = node.enhance_with_camera("portrait", "auto", "auto", "professional")
+
+    assert unlinked[metadata_slot] == ""
+    assert unlinked[summary_slot] != ""
+    assert linked[metadata_slot] == direct[metadata_slot] != ""
+    assert linked[summary_slot] == ""
+
+
+def test_duplicates_are_kept_unless_dropping_is_switched_on(station):
+    node = station.FactoryCameraOperator()
+    settings = ("portrait of a woman", "professional", "close_up", "professional")
+    enhanced = node.enhance_with_camera(*settings)[0]
+
+    # Running the node again on its own output appends the same tags again by default
+    again, summary = node.enhance_with_camera(enhanced, *settings[1:])[:2]
+    assert again == f"{enhanced}, {enhanced[len(settings[0]) + 2:]}"
+    assert "Duplicates Dropped" not in summary
+
+    deduped, summary = node.enhance_with_camera(enhanced, *settings[1:], drop_duplicate_tags=True)[:2]
+    assert deduped == enhanced
+    assert "Duplicates Dropped" in summary
+
+
+@pytest.mark.parametrize("index", range(5))
+def test_single_calls_skip_the_batch_path_and_match_it(station, monkeypatch, index):
+    node_class = station.factory_pipeline.PIPELINE_STAGES[index][1]
+    node = node_class()
+    settings = [spec[0][0] for _, spec in list(node_class.INPUT_TYPES()["required"].items())[1:]]
+    prompts = ["portrait of a woman at sunset", "red sneaker, studio", "portrait of a woman at sunset, dramatic"]
+    batch = getattr(node, node_class.FUNCTION + "_batch")(prompts, *settings)
+
+    def no_batch(*args, **kwargs):
+        raise AssertionError("single call went through the batch method")
+
+    monkeypatch.setattr(node, node_class.FUNCTION + "_batch", no_batch)
+    node_class.output_cache.clear()
+    context_slot = node_class.RETURN_NAMES.index("prompt_context")
+    for prompt, expected in zip(prompts, batch):
+        result = getattr(node, node_class.FUNCTION)(prompt, *settings)
+        assert result[:context_slot] + result[context_slot + 1:] == expected[:context_slot] + expected[context_slot + 1:]
+        assert result[context_slot].analyses == expected[context_slot].analyses
+
+
+SEEDED_CALLS = [
+    ("FactoryCameraOperator", ("portrait of a woman at sunset", "auto", "auto", "professional")),
+    ("FactoryColorHarmonist", ("portrait of a woman at sunset", "mood_based", "vibrant")),
+]
+
+
+@pytest.mark.parametrize("name, settings", SEEDED_CALLS)
+def test_seed_decides_the_selection(station, name, settings):
+    node_class = getattr(station, name)
+    entry = getattr(node_class(), node_class.FUNCTION)
+
+    def enhanced(seed):
+        # Cleared so every call selects again instead of returning the cached output
+        node_class.output_cache.clear()
+        return entry(*settings, seed=seed)[0]
+
+    assert enhanced(0) == enhanced(0)
+    assert enhanced(7) == enhanced(7)
+    assert enhanced(0) != enhanced(1)
+
+
+@pytest.mark.parametrize("name, settings", SEEDED_CALLS)
+def test_is_changed_is_stable_for_the_same_inputs(station, name, settings):
+    node_class = getattr(station, name)
+    names = list(node_class.INPUT_TYPES()["required"])
+    inputs = dict(zip(names, settings), seed=3)
+
+    fingerprint = node_class.IS_CHANGED(**inputs)
+    assert node_class.IS_CHANGED(**inputs) == fingerprint
+    assert node_class.IS_CHANGED(**dict(reversed(list(inputs.items())))) == fingerprint
+    context = station.factory_context.PromptContext(settings[0])
+    assert node_class.IS_CHANGED(**dict(inputs, prompt_context=context)) == fingerprint
+    assert node_class.IS_CHANGED(**dict(inputs, seed=4)) != fingerprint
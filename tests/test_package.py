@@ -0,0 +1,65 @@
+"""Tests for the package entry point: lazy node registration and the startup banner"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+
+def run_fresh(package_dir, body, **env):
+    """Run body in a fresh interpreter after importing the node pack as `station`"""
+    script = textwrap.dedent(f"""
+        import importlib, sys
+        sys.path.insert(0, {os.path.dirname(package_dir)!r})
+    """) + textwrap.dedent(body)
+    environment = {name: value for name, value in os.environ.items() if name != "CAMERA_FACTORY_STATION_QUIET"}
+    environment.update(env)
+    return subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=environment, check=True)
+
+
+def test_every_registered_node_resolves(station):
+    mappings = station.NODE_CLASS_MAPPINGS
+    assert set(mappings) == set(station.NODE_MODULES) == set(station.__all__) == set(station.NODE_DISPLAY_NAME_MAPPINGS)
+    for name in mappings:
+        node_class = mappings[name]
+        assert node_class.__name__ == name
+        assert mappings[name] is node_class
+        assert getattr(station, name) is node_class
+        assert callable(getattr(node_class(), node_class.FUNCTION))
+    assert dict(mappings.loaded()) == {name: mappings[name] for name in mappings}
+    with pytest.raises(KeyError):
+        mappings["NoSuchNode"]
+
+
+def test_node_modules_are_imported_on_first_lookup(package_dir):
+    result = run_fresh(package_dir, f"""
+        station = importlib.import_module({os.path.basename(package_dir)!r})
+        print(sorted(module for module in set(station.NODE_MODULES.values()) if station.__name__ + module in sys.modules))
+        print(len(station.NODE_CLASS_MAPPINGS), list(station.NODE_CLASS_MAPPINGS.loaded()))
+        station.NODE_CLASS_MAPPINGS["FactorySizeOptimizer"]
+        print([name for name, _ in station.NODE_CLASS_MAPPINGS.loaded()])
+    """, CAMERA_FACTORY_STATION_QUIET="1")
+    before, registry, after = result.stdout.splitlines()
+    assert before == "[]"
+    assert registry == "17 []"
+    # The size module and the segment helpers it imports, nothing else
+    assert after == "['FactorySizeOptimizer', 'FactorySizeOptimizerBatch', 'FactorySizeOptimizerSegments', 'FactorySegmentsToPrompt']"
+
+
+def test_startup_banner_is_logged_and_can_be_silenced(package_dir):
+    body = f"""
+        import logging
+        logging.basicConfig(level=logging.INFO, format="%(name)s|%(message)s")
+        importlib.import_module({os.path.basename(package_dir)!r})
+    """
+    shown = run_fresh(package_dir, body)
+    assert shown.stdout == ""
+    assert "Production Imaging Bay is Online" in shown.stderr
+    assert f"{os.path.basename(package_dir)}|" in shown.stderr
+    # Plain text, not colored, when the log does not go to a terminal
+    assert "\033[" not in shown.stderr
+
+    quiet = run_fresh(package_dir, body, CAMERA_FACTORY_STATION_QUIET="1")
+    assert quiet.stdout == quiet.stderr == ""
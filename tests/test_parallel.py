@@ -0,0 +1,63 @@
+"""Tests that multiprocess batch enhancement is reproducible for any worker count"""
+
+import functools
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+PROMPTS = [
+    "portrait of a woman at sunset, golden hour",
+    "red sneaker on white background, studio",
+    "mountain landscape at sunrise, dramatic sky",
+    "ceramic vase by the window, morning light, minimalist",
+    "city street at night, neon lights, rain",
+]
+
+CHAIN = [
+    {"type": "FactoryCameraOperator", "inputs": {"photography_style": "auto", "shot_type": "auto", "seed": 11}},
+    {"type": "FactoryColorHarmonist", "inputs": {"color_approach": "mood_based", "color_intensity": "vibrant", "seed": 5}},
+    {"type": "FactorySizeOptimizer"},
+]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_ordered_map_keeps_input_order(station, workers):
+    parallel = station.factory_parallel
+    seeds = list(parallel.ordered_map(functools.partial(parallel.item_seed, 42), range(40), workers))
+    assert seeds == [parallel.item_seed(42, index) for index in range(40)]
+
+
+def test_item_seeds_are_the_same_in_every_process(station, package_dir):
+    parallel = station.factory_parallel
+    seeds = [parallel.item_seed(seed, index) for seed in (0, 42, 2 ** 63) for index in range(5)]
+    assert len(set(seeds)) == len(seeds)
+
+    script = textwrap.dedent(f"""
+        import importlib, sys
+        sys.path.insert(0, {os.path.dirname(package_dir)!r})
+        station = importlib.import_module({os.path.basename(package_dir)!r})
+        print([station.factory_parallel.item_seed(seed, index) for seed in (0, 42, 2 ** 63) for index in range(5)])
+    """)
+    env = dict(os.environ, CAMERA_FACTORY_STATION_QUIET="1", PYTHONHASHSEED="random")
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True)
+    assert result.stdout.strip() == str(seeds)
+
+
+def enhanced(station, workers, chunk_size):
+    cli = station.factory_cli
+    records = ({"id": index, "prompt": prompt} for index, prompt in enumerate(PROMPTS * 3))
+    chain = cli.load_chain(CHAIN)
+    return list(cli.enhance_stream(chain, records, chunk_size=chunk_size, workers=workers, seed_per_item=True))
+
+
+def test_seed_per_item_output_does_not_depend_on_workers_or_chunks(station):
+    expected = enhanced(station, workers=1, chunk_size=256)
+    assert [result["id"] for result in expected] == list(range(len(PROMPTS) * 3))
+    # The same prompt gets a different seed at every position
+    assert len({result["enhanced_prompt"] for result in expected[::len(PROMPTS)]}) > 1
+
+    assert enhanced(station, workers=1, chunk_size=4) == expected
+    assert enhanced(station, workers=3, chunk_size=2) == expected
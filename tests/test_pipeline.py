@@ -0,0 +1,72 @@
+"""Tests that the fused Factory Pipeline reproduces the five chained nodes"""
+
+import json
+import random
+
+import pytest
+
+PROMPTS = [
+    "professional portrait of a woman",
+    "red sneaker product shot, white background, studio",
+    "mountain landscape at sunrise, golden hour, dramatic sky",
+    "luxury perfume bottle on marble, soft light, elegant",
+    "",
+]
+
+
+def random_settings(station, seed):
+    """A random value for every pipeline widget, as a user could set them"""
+    rng = random.Random(seed)
+    schema = station.FactoryPipeline.INPUT_TYPES()
+    settings = {}
+    for section in ("required", "optional"):
+        for name, spec in schema[section].items():
+            if isinstance(spec[0], list):
+                settings[name] = rng.choice(spec[0])
+            elif spec[0] == "BOOLEAN":
+                settings[name] = rng.random() < 0.5
+            elif name == "seed":
+                settings[name] = rng.randrange(1 << 32)
+            elif name == "max_tokens":
+                settings[name] = rng.choice([0, 0, 75, 150])
+    # Without context awareness camera smart selection has no scene type to read
+    settings["context_awareness"] = True
+    return settings
+
+
+def run_chain(station, prompt, settings):
+    """Run the five stage nodes in chain order with the pipeline settings under each node's names"""
+    pipeline = station.factory_pipeline
+    names = pipeline.stage_input_names()
+    enhanced, prompt_context, outputs = prompt, None, []
+    for stage, node_class, _ in pipeline.PIPELINE_STAGES:
+        stage_settings = {name: settings[pipeline_name] for name, pipeline_name in names[stage].items() if pipeline_name in settings}
+        optional = node_class.INPUT_TYPES()["optional"]
+        stage_settings.update((name, settings[name]) for name in pipeline.SHARED_SETTINGS if name in settings and name in optional)
+        result = getattr(node_class(), node_class.FUNCTION)(enhanced, prompt_context=prompt_context, **stage_settings)
+        enhanced, prompt_context = result[0], result[node_class.RETURN_NAMES.index("prompt_context")]
+        outputs.append(dict(zip(node_class.RETURN_NAMES, result)))
+    return outputs
+
+
+@pytest.mark.parametrize("prompt", PROMPTS)
+@pytest.mark.parametrize("seed", range(6))
+def test_pipeline_matches_the_chained_nodes(station, prompt, seed):
+    settings = random_settings(station, seed)
+    settings["keyword_matching"] = ("word_boundary", "substring")[seed % 2]
+    pipeline_class = station.FactoryPipeline
+    result = dict(zip(pipeline_class.RETURN_NAMES, pipeline_class().run_pipeline(prompt, **settings)))
+    chain = run_chain(station, prompt, settings)
+    last = chain[-1]
+
+    assert result["enhanced_prompt"] == last["enhanced_prompt"]
+    assert (result["width"], result["height"]) == (last["optimal_width"], last["optimal_height"])
+    assert result["token_count"] == last["token_count"]
+    separator = "\n" if settings["summary_mode"] == "compact" else "\n\n"
+    summaries = [next(value for name, value in outputs.items() if name.endswith("_summary")) for outputs in chain]
+    assert result["pipeline_summary"] == separator.join(summary for summary in summaries if summary)
+    assert json.loads(result["metadata"])["stages"] == [json.loads(outputs["metadata"]) for outputs in chain]
+
+    matching = settings["keyword_matching"]
+    assert result["prompt_context"].hits(matching) == last["prompt_context"].hits(matching)
+    assert result["prompt_context"].analyses.keys() == last["prompt_context"].analyses.keys()
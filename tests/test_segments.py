@@ -0,0 +1,47 @@
+"""Tests for the segment-chain node variants"""
+
+import pytest
+
+SEGMENT_NODES = (
+    "FactoryCameraOperatorSegments",
+    "FactoryColorHarmonistSegments",
+    "FactoryLightingStudioSegments",
+    "FactoryProductPhotographerSegments",
+    "FactorySizeOptimizerSegments",
+)
+
+
+def run_chain(station, linked):
+    """Run the five segment nodes in chain order, returning the final chain and context"""
+    chain = station.factory_segments.PromptSegments("portrait of a woman at sunset, golden hour")
+    context = None
+    for name in SEGMENT_NODES:
+        node_class = getattr(station, name)
+        node_class.output_cache.clear()
+        settings = {input_name: spec[0][0] for input_name, spec in list(node_class.INPUT_TYPES()["required"].items())[1:]}
+        if linked and context is not None:
+            settings["prompt_context"] = context
+        outputs = getattr(node_class(), node_class.FUNCTION)(chain, **settings)
+        chain, context = outputs[0], outputs[node_class.RETURN_NAMES.index("prompt_context")]
+        context.hits()
+        context.token_count()
+    return chain, context
+
+
+@pytest.mark.parametrize("linked", [True, False])
+@pytest.mark.parametrize("published", [True, False])
+def test_chain_is_analyzed_per_segment_without_joining(station, monkeypatch, linked, published):
+    if not published:
+        # Nothing to read from: every node analyzes the chain it gets segment by segment
+        monkeypatch.setattr(station.factory_context, "publish", lambda context: context)
+    chain, context = run_chain(station, linked)
+
+    node = chain
+    while node.parent is not None:
+        assert node._text is None
+        node = node.parent
+
+    fresh = station.factory_context.PromptContext(chain.text())
+    assert context.hits() == fresh.hits()
+    assert context.tag_keys() == fresh.tag_keys()
+    assert context.token_count() == fresh.token_count()
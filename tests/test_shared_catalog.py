@@ -0,0 +1,79 @@
+"""Tests that worker processes read their catalogs from the shared memory-mapped file"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+PROMPTS = ["portrait of a woman, soft light", "red sneaker product shot", "mountain landscape at sunrise"]
+
+# Prints which catalogs were mapped, their contents and the pipeline output, as one JSON line
+WORKER = """
+import importlib, json, sys
+sys.path.insert(0, {parent!r})
+station = importlib.import_module({package!r})
+node_classes = [station.NODE_CLASS_MAPPINGS[name] for name in station.NODE_CLASS_MAPPINGS]
+
+def plain(value):
+    if hasattr(value, "items"):
+        return {{key: plain(item) for key, item in value.items()}}
+    if isinstance(value, tuple):
+        return [plain(item) for item in value]
+    if isinstance(value, frozenset):
+        return sorted(value)
+    return value
+
+mapped, contents = [], {{}}
+for module in sorted(set(station.NODE_MODULES.values())):
+    for name, value in sorted(vars(sys.modules[station.__name__ + module]).items()):
+        if name.isupper() and hasattr(value, "items"):
+            contents[module + "." + name] = plain(value)
+            if type(value).__name__ == "MappedCatalog":
+                mapped.append(module + "." + name)
+pipeline = station.FactoryPipeline
+settings = {{name: spec[0][0] for name, spec in list(pipeline.INPUT_TYPES()["required"].items())[1:]}}
+outputs = [pipeline().run_pipeline(prompt, **settings)[:4] for prompt in {prompts!r}]
+print(json.dumps({{"mapped": mapped, "contents": contents, "outputs": outputs}}))
+"""
+
+
+def run_worker(package_dir, shared_path):
+    code = WORKER.format(parent=os.path.dirname(package_dir), package=os.path.basename(package_dir), prompts=PROMPTS)
+    env = dict(os.environ, CAMERA_FACTORY_STATION_QUIET="1", CAMERA_FACTORY_STATION_CATALOG_MMAP=shared_path)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.fixture(scope="module")
+def shared_file(station, tmp_path_factory):
+    return station.factory_catalog.build_shared_catalog(str(tmp_path_factory.mktemp("shared") / "catalog_shared.bin"))
+
+
+def test_workers_map_every_catalog_and_produce_the_same_output(station, package_dir, shared_file):
+    built = run_worker(package_dir, "off")
+    workers = [run_worker(package_dir, shared_file) for _ in range(2)]
+    # Every catalog loaded through load_catalog (the keyword tables are not catalogs)
+    catalogs = sorted(f".{module}.{name}" for module, name in station.factory_catalog._builders)
+
+    assert built["mapped"] == []
+    for worker in workers:
+        assert worker["mapped"] == catalogs
+        assert worker["contents"] == built["contents"]
+        assert worker["outputs"] == built["outputs"]
+
+
+def test_stale_module_entries_fall_back_to_the_literals(station, package_dir, shared_file, tmp_path):
+    catalog_file = station.factory_mmap.CatalogFile(shared_file)
+    modules = {}
+    for module, entry in catalog_file.catalogs().items():
+        # A digest of other source for one module, as after editing it without rebuilding the file
+        modules[module] = {"source": "stale" if module == "factory_size_optimizer" else entry["source"], "catalogs": entry["catalogs"]}
+    stale_path = station.factory_mmap.write_catalog_file(str(tmp_path / "stale.bin"), modules)
+    catalog_file.close()
+
+    worker = run_worker(package_dir, stale_path)
+    assert worker["mapped"]
+    assert not any(name.startswith(".factory_size_optimizer.") for name in worker["mapped"])
+    assert worker["outputs"] == run_worker(package_dir, "off")["outputs"]
@@ -0,0 +1,72 @@
+"""Tests for the optional per-node timing histograms"""
+
+import io
+import json
+
+import pytest
+
+PROMPTS = [f"portrait of a woman at sunset, shot {index}" for index in range(12)]
+
+
+@pytest.fixture
+def stats(station):
+    """The stats module with recording on and no timings, switched off again afterwards"""
+    module = station.factory_stats
+    module.reset_stats()
+    module.enable_stats(True)
+    yield module
+    module.enable_stats(False)
+    module.reset_stats()
+
+
+def test_histogram_buckets_and_percentiles(station):
+    histogram = station.factory_stats.LatencyHistogram()
+    for micros in (0.5, 1, 3, 3, 40, 2e6):
+        histogram.record(micros)
+    summary = histogram.as_dict()
+    assert summary["count"] == 6
+    assert summary["buckets"] == {"le_1": 2, "le_5": 2, "le_50": 1, "inf": 1}
+    assert (summary["min_us"], summary["max_us"]) == (0.5, 2e6)
+    assert summary["p50_us"] == 5.0
+    assert summary["p99_us"] == 2e6
+
+
+def test_stats_count_every_call(station, stats):
+    node_class = station.FactoryCameraOperator
+    node = node_class()
+    node_class.output_cache.clear()
+    for prompt in PROMPTS:
+        node.enhance_with_camera(prompt, "professional", "close_up", "professional")
+    # Repeated inputs are served by the output cache: timed as calls, without stages
+    for prompt in PROMPTS[:5]:
+        node.enhance_with_camera(prompt, "professional", "close_up", "professional")
+
+    recorded = node_class.stats()
+    assert recorded["call"]["count"] == len(PROMPTS) + 5
+    assert sum(recorded["call"]["buckets"].values()) == len(PROMPTS) + 5
+    for stage in ("analysis", "selection", "join"):
+        assert recorded[stage]["count"] == len(PROMPTS), stage
+        assert sum(recorded[stage]["buckets"].values()) == len(PROMPTS)
+    assert station.FactoryColorHarmonist.stats() == {}
+
+    dumped = io.StringIO()
+    stats.dump_stats(dumped)
+    assert json.loads(dumped.getvalue())["nodes"]["FactoryCameraOperator"]["call"]["count"] == len(PROMPTS) + 5
+
+
+def test_pipeline_stages_are_counted_under_their_prefix(station, stats):
+    pipeline_class = station.FactoryPipeline
+    settings = {name: spec[0][0] for name, spec in list(pipeline_class.INPUT_TYPES()["required"].items())[1:]}
+    pipeline_class.output_cache.clear()
+    for prompt in PROMPTS[:4]:
+        pipeline_class().run_pipeline(prompt, **settings)
+    recorded = station.FactoryPipeline.stats()
+    assert recorded["call"]["count"] == 4
+    assert {name for name in recorded if "." in name} >= {"camera.selection", "size.selection"}
+    assert all(stage["count"] == 4 for stage in recorded.values())
+
+
+def test_nothing_is_recorded_while_disabled(station):
+    station.factory_stats.reset_stats()
+    station.FactorySizeOptimizer().optimize_sizing("red sneaker, shot 99", "instagram_square", "quality")
+    assert station.FactorySizeOptimizer.stats() == {}
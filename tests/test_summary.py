@@ -0,0 +1,63 @@
+"""Tests for on-demand summary rendering (summary_mode and the linked-output check)"""
+
+import pytest
+
+
+def stage_node(station, index):
+    return station.factory_pipeline.PIPELINE_STAGES[index][1]
+
+
+def default_settings(node_class):
+    """The required choice inputs of a node at their first option"""
+    return [spec[0][0] for _, spec in list(node_class.INPUT_TYPES()["required"].items())[1:]]
+
+
+def api_workflow(unique_id, slot):
+    """API-format workflow in which one node reads output slot of node unique_id"""
+    return {unique_id: {"inputs": {}}, "99": {"inputs": {"text": [unique_id, slot]}}}
+
+
+@pytest.mark.parametrize("index", range(5))
+def test_summary_modes(station, index):
+    summary = station.factory_summary
+    node_class = stage_node(station, index)
+    entry = getattr(node_class(), node_class.FUNCTION)
+    settings = ["portrait of a woman at sunset"] + default_settings(node_class)
+    slot = summary.summary_slot(node_class)
+
+    full = entry(*settings, summary_mode="full")
+    compact = entry(*settings, summary_mode="compact")
+    off = entry(*settings, summary_mode="off")
+    assert entry(*settings) == full
+
+    assert "\n" in full[slot]
+    assert compact[slot] == summary.compact_summary(full[slot]) and "\n" not in compact[slot]
+    assert off[slot] == ""
+    # Only the summary output depends on the mode
+    for other in range(len(full)):
+        if other not in (slot, node_class.RETURN_NAMES.index("prompt_context")):
+            assert full[other] == compact[other] == off[other]
+
+
+@pytest.mark.parametrize("index", range(5))
+def test_summary_is_built_only_when_its_output_is_linked(station, index):
+    summary = station.factory_summary
+    node_class = stage_node(station, index)
+    entry = getattr(node_class(), node_class.FUNCTION)
+    settings = ["red sneaker on white background"] + default_settings(node_class)
+    slot = summary.summary_slot(node_class)
+
+    direct = entry(*settings)
+    linked = entry(*settings, prompt=api_workflow("3", slot), unique_id="3")
+    unlinked = entry(*settings, prompt=api_workflow("3", 0), unique_id="3")
+    linked_compact = entry(*settings, summary_mode="compact", prompt=[api_workflow("3", slot)], unique_id=["3"])
+
+    assert linked[slot] == direct[slot] != ""
+    assert unlinked[slot] == ""
+    assert unlinked[0] == linked[0] == direct[0]
+    assert linked_compact[slot] == summary.compact_summary(direct[slot])
+
+    inputs = dict(zip(node_class.INPUT_TYPES()["required"], settings))
+    fingerprints = [node_class.IS_CHANGED(**inputs, prompt=api_workflow("3", linked_slot), unique_id="3") for linked_slot in (slot, 0, slot)]
+    # Linking the summary output changes what the node must build, so the executor reruns it
+    assert fingerprints[0] == fingerprints[2] != fingerprints[1]
@@ -0,0 +1,63 @@
+"""Tests for the frozen option-to-tag lookup tables the renderers read"""
+
+from types import MappingProxyType
+
+import pytest
+
+PROMPT = "portrait of a woman at sunset"
+
+# node, table attribute, the input it serves, what an option missing from the table renders,
+# and settings the table needs to be read at all ("auto" options never read a table)
+TAG_TABLES = [
+    ("FactoryCameraOperator", "iso_tags", "iso_setting", "option", {"technical_detail": "detailed"}),
+    ("FactoryCameraOperator", "shutter_tags", "shutter_speed", "option", {"technical_detail": "detailed"}),
+    ("FactoryCameraOperator", "white_balance_tags", "white_balance", "option", {"technical_detail": "detailed"}),
+    ("FactoryCameraOperator", "camera_quality_tags", "camera_quality", ("professional_quality",), {}),
+    ("FactoryColorHarmonist", "intensity_tags", "color_intensity", None, {"color_approach": "mood_based"}),
+    ("FactoryColorHarmonist", "temperature_tags", "color_temperature", (), {"color_approach": "mood_based"}),
+    ("FactoryColorHarmonist", "saturation_tags", "saturation_level", (), {"color_approach": "mood_based"}),
+    ("FactoryColorHarmonist", "contrast_tags", "contrast_level", None, {"color_approach": "mood_based"}),
+    ("FactoryLightingStudio", "lighting_quality_tags", "lighting_quality", None, {}),
+    ("FactoryLightingStudio", "atmosphere_tags", "atmosphere_density", (), {}),
+    ("FactoryLightingStudio", "shadow_tags", "shadow_control", (), {}),
+    ("FactoryLightingStudio", "highlight_tags", "highlight_control", (), {}),
+    ("FactoryLightingStudio", "lighting_contrast_tags", "lighting_contrast", None, {}),
+    ("FactoryProductPhotographer", "image_quality_tags", "image_quality", None, {}),
+    ("FactoryProductPhotographer", "color_accuracy_tags", "color_accuracy", None, {}),
+    ("FactoryProductPhotographer", "detail_tags", "detail_level", None, {}),
+    ("FactoryProductPhotographer", "price_point_tags", "price_point_indicator", (), {}),
+    ("FactoryProductPhotographer", "product_focus_tags", "product_focus", None, {}),
+    ("FactorySizeOptimizer", "optimization_tags", "optimization_target", "balanced", {}),
+]
+
+
+def input_spec(node_class, name):
+    schema = node_class.INPUT_TYPES()
+    return schema["required"].get(name) or schema["optional"][name]
+
+
+@pytest.mark.parametrize("node, attribute, input_name, fallback, extra", TAG_TABLES)
+def test_tag_table_renders_every_option(station, node, attribute, input_name, fallback, extra):
+    node_class = getattr(station, node)
+    table = getattr(node_class, attribute)
+    assert isinstance(table, MappingProxyType)
+    assert all(isinstance(tags, tuple) and all(isinstance(tag, str) for tag in tags) for tags in table.values())
+
+    required = [name for name in node_class.INPUT_TYPES()["required"]][1:]
+    defaults = {name: input_spec(node_class, name)[0][0] for name in required}
+    entry = getattr(node_class(), node_class.FUNCTION)
+    for option in input_spec(node_class, input_name)[0]:
+        if option == "auto":
+            continue
+        if option in table:
+            expected = table[option]
+        elif fallback is None:
+            pytest.fail(f"{attribute} has no tags for {input_name}={option!r}")
+        elif fallback == "option":
+            expected = (option,)
+        elif isinstance(fallback, str):
+            expected = table[fallback]
+        else:
+            expected = fallback
+        enhanced = entry(PROMPT, **dict(defaults, **extra, **{input_name: option}))[0]
+        assert f", {', '.join(expected)}" in enhanced or not expected, (option, enhanced)
@@ -0,0 +1,80 @@
+"""Tests for the token estimate and max_tokens trimming of the node tags"""
+
+import pytest
+
+PROMPT = "portrait of a woman at sunset, golden hour"
+
+
+def stage_node(station, index):
+    return station.factory_pipeline.PIPELINE_STAGES[index][1]
+
+
+def default_settings(node_class):
+    """The required choice inputs of a node at their first option"""
+    return [spec[0][0] for _, spec in list(node_class.INPUT_TYPES()["required"].items())[1:]]
+
+
+def tag_cost(tags_module, tags):
+    """Tokens the tags add to a prompt, one comma each included"""
+    return sum(tags_module.tag_token_count(tag) + 1 for tag in tags)
+
+
+def test_trim_keeps_a_tag_that_ends_exactly_at_the_budget(station):
+    tags_module = station.factory_tags
+    tags = ["85mm lens", "shallow depth of field", "(bokeh:1.2)", "film grain"]
+    used = tags_module.estimate_tokens(PROMPT)
+    for count in range(len(tags) + 1):
+        budget = used + tag_cost(tags_module, tags[:count])
+        assert tags_module.trim_tags(tags, used, budget) == (tags[:count], tags[count:])
+        if count:
+            assert tags_module.trim_tags(tags, used, budget - 1) == (tags[:count - 1], tags[count - 1:])
+
+
+@pytest.mark.parametrize("index", range(5))
+def test_max_tokens_trims_node_tags_at_the_boundary(station, index):
+    tags_module = station.factory_tags
+    node_class = stage_node(station, index)
+    entry = getattr(node_class(), node_class.FUNCTION)
+    settings = default_settings(node_class)
+    token_slot = node_class.RETURN_NAMES.index("token_count")
+
+    full = entry(PROMPT, *settings)
+    tags = full[0][len(PROMPT) + 2:].split(", ")
+    used = tags_module.estimate_tokens(PROMPT)
+    assert len(tags) > 1
+
+    for count in (1, len(tags) // 2, len(tags)):
+        budget = used + tag_cost(tags_module, tags[:count])
+        fits = entry(PROMPT, *settings, max_tokens=budget)
+        assert fits[0] == ", ".join([PROMPT] + tags[:count])
+        assert fits[token_slot] == budget
+
+        over = entry(PROMPT, *settings, max_tokens=budget - 1)
+        assert over[0] == ", ".join([PROMPT] + tags[:count - 1])
+        assert over[token_slot] == tags_module.estimate_tokens(over[0]) <= budget - 1
+        assert f"Trimmed: {len(tags) - count + 1} tags to fit {budget - 1} tokens" in over[1]
+
+
+@pytest.mark.parametrize("index", range(5))
+def test_zero_max_tokens_does_not_trim(station, index):
+    node_class = stage_node(station, index)
+    entry = getattr(node_class(), node_class.FUNCTION)
+    settings = default_settings(node_class)
+    token_slot = node_class.RETURN_NAMES.index("token_count")
+
+    default = entry(PROMPT, *settings)
+    unlimited = entry(PROMPT, *settings, max_tokens=0)
+    assert unlimited[0] == default[0]
+    assert unlimited[token_slot] == default[token_slot] == station.factory_tags.estimate_tokens(default[0])
+    assert "Trimmed" not in unlimited[1]
+
+
+def test_incoming_prompt_over_the_budget_is_never_trimmed(station):
+    node_class = station.FactoryCameraOperator
+    entry = getattr(node_class(), node_class.FUNCTION)
+    token_slot = node_class.RETURN_NAMES.index("token_count")
+    budget = station.factory_tags.estimate_tokens(PROMPT) - 1
+
+    enhanced = entry(PROMPT, *default_settings(node_class), max_tokens=budget)
+    assert enhanced[0] == PROMPT
+    assert enhanced[token_slot] == station.factory_tags.estimate_tokens(PROMPT)